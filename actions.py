@@ -0,0 +1,208 @@
+import time
+
+from brightness import BrightnessController, SbcBrightnessBackend
+from commands import Op, OP_LANES, LANE_INPUT
+
+# --------------------------------------------------------------------------------
+# --- ВИКОНАННЯ КОМАНД: РЕЄСТР ОБРОБНИКІВ ТА БЕКЕНДИ ВИВОДУ ---
+# --------------------------------------------------------------------------------
+# Кожен код операції має обробник handler(backend, a, b). Нова дія реєструється
+# через @action(Op.X), а не додає ще одне порівняння рядків. Бекенд виводу -
+# будь-який об'єкт з методами PyAutoGuiBackend: pyautogui, linux_input.UinputBackend
+# для Linux, NullBackend або RecordingBackend для бенчмарків. Смуги виконавця
+# (lanes.py) викликають бекенд з кількох потоків одночасно.
+
+JOYSTICK_SENSITIVITY = 0.3
+
+ACTION_HANDLERS = {}
+
+
+def action(op):
+    def register(handler):
+        ACTION_HANDLERS[op] = handler
+        return handler
+    return register
+
+
+def _hotkey_action(op, *keys):
+    action(op)(lambda backend, a, b: backend.hotkey(*keys))
+
+
+def _press_action(op, key):
+    action(op)(lambda backend, a, b: backend.press(key))
+
+
+@action(Op.MOVE)
+def _move(backend, move_x, move_y):
+    backend.move(move_x * JOYSTICK_SENSITIVITY, move_y * JOYSTICK_SENSITIVITY)
+
+
+@action(Op.CLICK)
+def _click(backend, a, b):
+    backend.click()
+
+
+@action(Op.RIGHT_CLICK)
+def _right_click(backend, a, b):
+    backend.right_click()
+
+
+@action(Op.SCROLL)
+def _scroll(backend, steps, b):
+    backend.scroll(int(120 * steps))
+
+
+@action(Op.VOLUME)
+def _volume(backend, steps, b):
+    steps = int(steps)
+    if steps:
+        backend.press('volumeup' if steps > 0 else 'volumedown', presses=abs(steps))
+
+
+@action(Op.BRIGHTNESS)
+def _brightness(backend, steps, b):
+    backend.change_brightness(5 * int(steps))
+
+
+_hotkey_action(Op.SWIPE_NEXT_WINDOW, 'alt', 'tab')
+_hotkey_action(Op.SWIPE_PREV_WINDOW, 'alt', 'shift', 'tab')
+_hotkey_action(Op.SWIPE_DESKTOP, 'win', 'd')
+_hotkey_action(Op.SWIPE_TASK_VIEW, 'win', 'tab')
+
+_press_action(Op.PPT_START_SHOW, 'f5')
+_press_action(Op.PPT_NEXT_SLIDE, 'right')
+_press_action(Op.PPT_PREV_SLIDE, 'left')
+
+_hotkey_action(Op.ZOOM_RAISE_HAND, 'alt', 'y')
+_hotkey_action(Op.ZOOM_MUTE, 'alt', 'a')
+_hotkey_action(Op.ZOOM_VIDEO, 'alt', 'v')
+
+_hotkey_action(Op.BROWSER_NEXT_TAB, 'ctrl', 'tab')
+_hotkey_action(Op.BROWSER_PREV_TAB, 'ctrl', 'shift', 'tab')
+
+_press_action(Op.MEDIA_PLAY_PAUSE, 'space')
+_press_action(Op.MEDIA_NEXT_TRACK, 'nexttrack')
+_press_action(Op.MEDIA_PREV_TRACK, 'prevtrack')
+
+
+class PyAutoGuiBackend:
+    def __init__(self, brightness_backend=None):
+        import pyautogui
+        pyautogui.FAILSAFE = False
+        pyautogui.PAUSE = 0
+        self._pyautogui = pyautogui
+        if brightness_backend is None:
+            brightness_backend = SbcBrightnessBackend()
+        self.brightness = BrightnessController(brightness_backend).start()
+
+    def move(self, dx, dy):
+        self._pyautogui.move(dx, dy)
+
+    def click(self):
+        self._pyautogui.click()
+
+    def right_click(self):
+        self._pyautogui.rightClick()
+
+    def scroll(self, amount):
+        self._pyautogui.scroll(amount)
+
+    def press(self, key, presses=1):
+        self._pyautogui.press(key, presses=presses)
+
+    def hotkey(self, *keys):
+        self._pyautogui.hotkey(*keys)
+
+    def change_brightness(self, delta):
+        self.brightness.change(delta)
+
+    def close(self):
+        self.brightness.stop()
+
+
+class NullBackend:
+    def move(self, dx, dy):
+        pass
+
+    def click(self):
+        pass
+
+    def right_click(self):
+        pass
+
+    def scroll(self, amount):
+        pass
+
+    def press(self, key, presses=1):
+        pass
+
+    def hotkey(self, *keys):
+        pass
+
+    def change_brightness(self, delta):
+        pass
+
+    def close(self):
+        pass
+
+
+class RecordingBackend:
+    # Фальшивий вивід: записує (час, метод, аргументи) кожного виклику. delays - імітована
+    # тривалість методу в секундах, напр. {'press': 0.02}; для press - на кожне натискання.
+    def __init__(self, delays=None):
+        self.delays = delays or {}
+        self.calls = []
+
+    def _record(self, method, *args, repeat=1):
+        self.calls.append((time.perf_counter(), method, args))
+        delay = self.delays.get(method)
+        if delay:
+            time.sleep(delay * repeat)
+
+    def move(self, dx, dy):
+        self._record('move', dx, dy)
+
+    def click(self):
+        self._record('click')
+
+    def right_click(self):
+        self._record('right_click')
+
+    def scroll(self, amount):
+        self._record('scroll', amount)
+
+    def press(self, key, presses=1):
+        self._record('press', key, presses, repeat=presses)
+
+    def hotkey(self, *keys):
+        self._record('hotkey', *keys)
+
+    def change_brightness(self, delta):
+        self._record('change_brightness', delta)
+
+    def close(self):
+        pass
+
+
+def dispatch(backend, op, a, b):
+    handler = ACTION_HANDLERS.get(op)
+    if handler is None:
+        print(f"Action worker: невідомий код операції {op}")
+        return
+    handler(backend, a, b)
+
+
+def execute(backend, command, latency=None):
+    op, a, b, capture_time, enqueue_time = command
+    exec_start = time.time()
+    dispatch(backend, op, a, b)
+    if latency is not None:
+        latency.record_command(capture_time, enqueue_time, exec_start, time.time(), OP_LANES.get(op, LANE_INPUT))
+
+
+def run_actions(command_channel, backend, latency=None):
+    while True:
+        command = command_channel.get()
+        if command is None: break
+        execute(backend, command, latency)
+    backend.close()
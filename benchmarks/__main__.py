@@ -0,0 +1,224 @@
+import argparse
+import json
+import platform
+import sys
+import time
+
+import numpy as np
+
+from actions import NullBackend, dispatch
+from benchmarks.action_dispatch import bench_channel
+from benchmarks.frame_transfer import bench_queue, bench_ring
+from benchmarks.classifier import calibrate, rule_keys
+from benchmarks.synthetic import synthetic_hand, synthetic_session, synthetic_motion_session
+from commands import Op, LANES, pack_command, unpack_command, RecordingSink
+from features import extract_features, gesture_flags, gesture_keys
+from gesture_engine import GestureEngine
+from landmark_filter import LandmarkFilter
+from lanes import LaneExecutor
+from landmarks import HAND_RIGHT, HAND_LEFT
+from motion import MotionDetector, MOTIONS
+from rules import RuleEngine
+
+# Набір бенчмарків конвеєра без камери, моделі MediaPipe та Windows API.
+# Кожен бенчмарк повертає мікросекунди на одну операцію (менше - краще).
+# Старі count_fingers_up та is_* замінені векторними extract_features,
+# gesture_flags і gesture_keys, тому міряються саме вони.
+#
+#   python -m benchmarks                          - запустити все
+#   python -m benchmarks --save baseline.json     - зберегти базову лінію
+#   python -m benchmarks --compare baseline.json  - порівняти, код 1 при регресії
+#   python -m benchmarks -k features              - лише бенчмарки з "features" в імені
+
+BENCHMARKS = {}
+
+
+def benchmark(name):
+    def register(fn):
+        BENCHMARKS[name] = fn
+        return fn
+    return register
+
+
+def per_call(fn, number, repeat=5):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        best = min(best, (time.perf_counter() - start) / number)
+    return best * 1e6
+
+
+def _hands(count):
+    landmarks = np.stack([synthetic_hand(0b00110, 0.3 + 0.4 * i, 0.5, (HAND_RIGHT, HAND_LEFT)[i]) for i in range(count)])
+    return landmarks, np.array([HAND_RIGHT, HAND_LEFT][:count])
+
+
+@benchmark('features.extract_1_hand')
+def _extract_one():
+    landmarks, handedness = _hands(1)
+    return per_call(lambda: extract_features(landmarks, handedness), 5000)
+
+
+@benchmark('features.extract_2_hands')
+def _extract_two():
+    landmarks, handedness = _hands(2)
+    return per_call(lambda: extract_features(landmarks, handedness), 5000)
+
+
+@benchmark('features.gesture_flags_and_key')
+def _flags():
+    features = extract_features(*_hands(1))
+
+    def run():
+        gesture_keys(features, gesture_flags(features))
+    return per_call(run, 5000)
+
+
+@benchmark('classifier.predict_1_hand')
+def _classifier():
+    model = calibrate(np.random.default_rng(0))
+    landmarks, handedness = _hands(1)
+    fallback = rule_keys(landmarks, handedness)
+    return per_call(lambda: model.predict_keys(landmarks, handedness, fallback), 5000)
+
+
+@benchmark('filter.one_euro_2_hands')
+def _one_euro():
+    session = synthetic_session(100, noise=0.01)
+    landmark_filter = LandmarkFilter()
+    hands = session.hands[:15]
+
+    def run():
+        for record in hands:
+            landmark_filter.apply(record)
+    return per_call(run, 300) / len(hands)
+
+
+@benchmark('motion.push_and_detect')
+def _motion():
+    session, _ = synthetic_motion_session(MOTIONS, repeats=1, noise=0.003)
+
+    def run():
+        detector = MotionDetector(session.frame_size)
+        for hands in session.hands:
+            detector.push(hands)
+            detector.detect()
+    return per_call(run, 1, repeat=3) / len(session)
+
+
+@benchmark('rules.lookup')
+def _rule_lookup():
+    rules = RuleEngine.load()
+    keys = list(range(256))
+
+    def run():
+        for key in keys:
+            rules.lookup('action', 'browser', key)
+    return per_call(run, 200) / len(keys)
+
+
+def _engine_benchmark(context):
+    session = synthetic_session(1500, (context,))
+    rules = RuleEngine.load()
+
+    def run():
+        engine = GestureEngine(rules, session.frame_size, RecordingSink(), verbose=False)
+        engine.state.app_context = context
+        for hands in session.hands:
+            engine.process(hands)
+    return per_call(run, 1, repeat=3) / len(session)
+
+
+for _context in ('general', 'powerpoint', 'zoom', 'browser', 'media'):
+    benchmark(f'engine.frame.{_context}')(lambda context=_context: _engine_benchmark(context))
+
+
+@benchmark('actions.dispatch')
+def _dispatch():
+    backend = NullBackend()
+    records = [pack_command(op) for op in (Op.CLICK, Op.SWIPE_NEXT_WINDOW, Op.PPT_NEXT_SLIDE, Op.MEDIA_NEXT_TRACK)]
+
+    def run():
+        for data in records:
+            op, a, b, capture_time, enqueue_time = unpack_command(data)
+            dispatch(backend, op, a, b)
+    return per_call(run, 20000) / len(records)
+
+
+@benchmark('actions.lanes_submit_to_done')
+def _lanes():
+    ops = (Op.CLICK, Op.SWIPE_NEXT_WINDOW, Op.MEDIA_NEXT_TRACK, Op.PPT_NEXT_SLIDE)
+    commands = [(ops[i % len(ops)], 0.0, 0.0, 0.0, 0.0) for i in range(2000)]
+
+    def run():
+        executor = LaneExecutor(NullBackend(), depths={lane: len(commands) for lane in LANES}).start()
+        for command in commands:
+            executor.submit(command)
+        executor.close()
+    return per_call(run, 1, repeat=3) / len(commands)
+
+
+@benchmark('actions.channel_to_worker')
+def _channel():
+    return 1e6 / bench_channel()
+
+
+@benchmark('ipc.frame_720p.queue')
+def _queue_720p():
+    return bench_queue((720, 1280, 3), frames=100) * 1e6
+
+
+@benchmark('ipc.frame_720p.ring')
+def _ring_720p():
+    return bench_ring((720, 1280, 3), frames=100) * 1e6
+
+
+def compare(results, baseline, threshold):
+    regressions = []
+    print(f"\n{'benchmark':<34}{'baseline us':>14}{'now us':>12}{'change':>10}")
+    for name, value in results.items():
+        if name not in baseline:
+            continue
+        old = baseline[name]
+        change = value / old - 1.0 if old else 0.0
+        flag = "  REGRESSION" if change > threshold else ""
+        print(f"{name:<34}{old:>14.3f}{value:>12.3f}{change * 100:>9.1f}%{flag}")
+        if flag:
+            regressions.append(name)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Gesture pipeline benchmarks (headless, no camera).")
+    parser.add_argument('-k', dest='pattern', default='', help="run only benchmarks containing this substring")
+    parser.add_argument('--save', metavar='PATH', help="save results as a JSON baseline")
+    parser.add_argument('--compare', metavar='PATH', help="compare against a JSON baseline")
+    parser.add_argument('--threshold', type=float, default=0.15, help="allowed slowdown before flagging (0.15 = 15%%)")
+    args = parser.parse_args()
+
+    results = {}
+    for name, fn in BENCHMARKS.items():
+        if args.pattern not in name:
+            continue
+        results[name] = fn()
+        print(f"{name:<34}{results[name]:>12.3f} us")
+
+    if args.save:
+        with open(args.save, 'w', encoding='utf-8') as f:
+            json.dump({'python': sys.version.split()[0], 'machine': platform.platform(), 'results': results}, f,
+                      indent=2)
+        print(f"Baseline saved: {args.save}")
+
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            baseline = json.load(f)['results']
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) above {args.threshold * 100:.0f}%")
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
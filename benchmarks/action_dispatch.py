@@ -0,0 +1,44 @@
+import time
+from multiprocessing import Process
+
+from actions import NullBackend, dispatch, run_actions
+from commands import CommandChannel, Op, pack_command, unpack_command
+
+# Пропускна здатність виконавця команд з бекендом-заглушкою:
+# окремо диспетчеризація в процесі та повний шлях через CommandChannel.
+# Запуск з кореня репозиторію: python -m benchmarks.action_dispatch
+
+COMMANDS = 200000
+CHANNEL_COMMANDS = 20000
+MIX = [Op.CLICK, Op.SWIPE_NEXT_WINDOW, Op.PPT_NEXT_SLIDE, Op.BROWSER_PREV_TAB, Op.MEDIA_NEXT_TRACK]
+
+
+def bench_dispatch():
+    backend = NullBackend()
+    records = [pack_command(MIX[i % len(MIX)], 0.0, 0.0) for i in range(COMMANDS)]
+    start = time.perf_counter()
+    for data in records:
+        op, a, b, capture_time, enqueue_time = unpack_command(data)
+        dispatch(backend, op, a, b)
+    return COMMANDS / (time.perf_counter() - start)
+
+
+def bench_channel():
+    channel = CommandChannel()
+    worker = Process(target=run_actions, args=(channel, NullBackend()), daemon=True)
+    worker.start()
+    start = time.perf_counter()
+    for i in range(CHANNEL_COMMANDS):
+        channel.send(MIX[i % len(MIX)])
+    channel.close()
+    worker.join()
+    return CHANNEL_COMMANDS / (time.perf_counter() - start)
+
+
+def main():
+    print(f"decode + dispatch:        {bench_dispatch():>12,.0f} commands/s")
+    print(f"channel -> action worker: {bench_channel():>12,.0f} commands/s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,116 @@
+import argparse
+import queue
+import threading
+import time
+
+import numpy as np
+
+from actions import RecordingBackend
+from commands import CommandChannel, Op, LANES, OP_LANES
+from stages.action import ActionStage
+from telemetry import PipelineCounters
+
+# Виконавець дій: один цикл проти смуг (lanes.py). Потік команд у реальному часі,
+# як під час роботи: рух курсора з частотою кадрів, кліки, гарячі клавіші й
+# системні дії (гучність на кілька кроків, медіаклавіші). Вивід - RecordingBackend
+# з імітованою тривалістю методів DELAYS (порядок величин; натискання гучності та
+# медіаклавіш - найповільніші). Команди йдуть тим самим шляхом, що й у конвеєрі:
+# CommandChannel -> ActionStage у потоці. Затримка - від постановки команди в
+# канал до кінця її виконання, p50/p95/p99 для кожної смуги й окремо для кліків
+# (кліки не зливаються і не відкидаються, тож n-й виклик click - n-й надісланий клік).
+#
+# Запуск з кореня репозиторію: python -m benchmarks.action_lanes
+
+SECONDS = 10.0
+MOVE_RATE = 60.0
+# Команд на секунду: (код операції, аргумент, частота).
+EVENTS = (
+    (Op.CLICK, 0.0, 2.0),
+    (Op.BROWSER_NEXT_TAB, 0.0, 1.0),
+    (Op.VOLUME, 3.0, 2.0),
+    (Op.MEDIA_NEXT_TRACK, 0.0, 0.5),
+)
+DELAYS = {
+    'move': 0.0003,
+    'scroll': 0.001,
+    'click': 0.003,
+    'right_click': 0.003,
+    'hotkey': 0.02,
+    'press': 0.015,
+    'change_brightness': 0.0005,
+}
+
+
+class LatencyLog:
+    # Замість LatencyHistograms: точні затримки кожної команди за смугами.
+    def __init__(self):
+        self.by_lane = {lane: [] for lane in LANES}
+
+    def record_command(self, capture_time, enqueue_time, exec_start, exec_end, lane=None):
+        self.by_lane[lane].append(exec_end - enqueue_time)
+
+
+def schedule(seconds, rng):
+    # [(час від початку, код операції, аргумент), ...] за зростанням часу.
+    events = [(i / MOVE_RATE, Op.MOVE, 2.0) for i in range(int(seconds * MOVE_RATE))]
+    for op, a, rate in EVENTS:
+        events += [(float(t), op, a) for t in rng.uniform(0.0, seconds, int(seconds * rate))]
+    return sorted(events, key=lambda event: event[0])
+
+
+def measure(events, lanes):
+    # (затримки за смугами, затримки кліків, лічильники).
+    log = LatencyLog()
+    counters = PipelineCounters()
+    backend = RecordingBackend(DELAYS)
+    channel = CommandChannel(counters, queue.Queue())
+    stage = ActionStage(channel, log, backend_factory=lambda: backend, counters=counters, lanes=lanes)
+    worker = threading.Thread(target=stage.run, name='action', daemon=True)
+    worker.start()
+    clicks_sent = []
+    start = time.perf_counter()
+    for t, op, a in events:
+        delay = start + t - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+        if op == Op.CLICK:
+            clicks_sent.append(time.perf_counter())
+        channel.send(op, a, capture_time=time.time())
+    channel.close()
+    worker.join()
+    clicks_done = [t + DELAYS['click'] for t, method, _ in backend.calls if method == 'click']
+    return log.by_lane, [done - sent for sent, done in zip(clicks_sent, clicks_done)], counters
+
+
+def print_row(executor, name, latencies, coalesced='', blocked=''):
+    ms = np.array(latencies) * 1000
+    p50, p95, p99 = np.percentile(ms, (50, 95, 99))
+    print(f"{executor:<10}{name:<8}{len(ms):>10}{p50:>9.1f}{p95:>9.1f}{p99:>9.1f}{coalesced:>11}{blocked:>9}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Затримка дій: один цикл виконання проти смуг")
+    parser.add_argument('--seconds', type=float, default=SECONDS)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    events = schedule(args.seconds, np.random.default_rng(args.seed))
+    print(f"{len(events)} commands in {args.seconds:.0f} s: move {MOVE_RATE:.0f} Hz, "
+          + ", ".join(f"{op.name.lower()} {rate:g}/s" for op, _, rate in EVENTS))
+    print(f"{'executor':<10}{'lane':<8}{'commands':>10}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}"
+          f"{'coalesced':>11}{'blocked':>9}")
+    for lanes in (False, True):
+        by_lane, clicks, counters = measure(events, lanes)
+        executor = 'lanes' if lanes else 'serial'
+        for lane in LANES:
+            if not by_lane[lane]:
+                continue
+            # Злиті в каналі (поки виконавець зайнятий) і в черзі смуги.
+            coalesced = counters.get('lane_merged', lane) + sum(
+                counters.get('commands_coalesced', op.name.lower()) for op in Op if OP_LANES[op] == lane)
+            print_row(executor, lane, by_lane[lane], coalesced, counters.get('lane_blocked', lane))
+        print_row(executor, 'click', clicks)
+
+
+if __name__ == '__main__':
+    main()
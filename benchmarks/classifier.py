@@ -0,0 +1,120 @@
+import argparse
+import time
+
+import numpy as np
+
+from benchmarks.synthetic import synthetic_gesture, transform_hand
+from classifier import GestureClassifier, CLASS_KEYS, CLASSES, normalize_landmarks
+from features import extract_features, gesture_flags, gesture_keys, KEY_FLAGS_LUT
+from landmarks import HAND_RIGHT, HAND_LEFT
+
+# Класифікатор найближчого центроїда проти порогових правил.
+# 1. Калібрування: CALIBRATION_SAMPLES зразків кожного жесту, рука майже вертикальна
+#    (+-10 градусів) на звичайній відстані, з шумом лендмарків - як запис calibrate.py.
+# 2. Точність на повернутих і віддалених/наближених руках (обидві руки, з шумом):
+#    жест правильний, якщо прапорці його ключа збігаються з прапорцями канонічної пози.
+#    Для класифікатора вказано також частку відхилених поз (для них лишається ключ правил).
+# 3. Вартість на кадр: правила (ознаки, прапорці, ключ) і класифікатор (нормалізація,
+#    одне множення матриць, відхилення), для однієї та двох рук.
+#
+# Запуск з кореня репозиторію: python -m benchmarks.classifier
+
+CALIBRATION_SAMPLES = 40
+TEST_SAMPLES = 20
+NOISE = 0.003
+ANGLES = (0, 15, 30, 45, 60)
+SCALES = (0.5, 0.75, 1.0, 1.5)
+ASPECT = 720 / 1280
+
+
+def sample_hands(name, count, rng, max_angle, scale_range, handedness=None):
+    # (лендмарки (count, 21, 3), руки (count,)) з випадковим положенням, поворотом і масштабом.
+    landmarks, sides = [], []
+    for _ in range(count):
+        side = handedness if handedness is not None else rng.choice((HAND_RIGHT, HAND_LEFT))
+        lm = synthetic_gesture(name, rng.uniform(0.35, 0.65), rng.uniform(0.4, 0.6), side)
+        angle = np.radians(rng.uniform(-max_angle, max_angle) if max_angle else 0.0)
+        lm = transform_hand(lm, angle, rng.uniform(*scale_range), ASPECT)
+        landmarks.append(lm + rng.normal(0.0, NOISE, lm.shape).astype(np.float32))
+        sides.append(side)
+    return np.stack(landmarks), np.array(sides)
+
+
+def rule_keys(landmarks, handedness):
+    features = extract_features(landmarks, handedness)
+    return gesture_keys(features, gesture_flags(features))
+
+
+def calibrate(rng):
+    samples = {name: sample_hands(name, CALIBRATION_SAMPLES, rng, 10, (0.9, 1.1), HAND_RIGHT) for name in CLASSES}
+    return GestureClassifier.fit(samples)
+
+
+def accuracy(model, angle, scale, rng):
+    # (точність правил, точність класифікатора, частка відхилених класифікатором поз).
+    rules_ok = model_ok = rejected = total = 0
+    for name in CLASSES:
+        # Поворот рівно на +-angle: половина рук за годинниковою стрілкою, половина проти.
+        landmarks, handedness = sample_hands(name, TEST_SAMPLES, rng, 0, (scale, scale))
+        signs = np.where(np.arange(len(landmarks)) % 2, 1.0, -1.0)
+        landmarks = np.stack([transform_hand(lm, np.radians(angle) * sign, 1.0, ASPECT)
+                              for lm, sign in zip(landmarks, signs)])
+        fallback = rule_keys(landmarks, handedness)
+        keys = model.predict_keys(landmarks, handedness, fallback)
+        expected = KEY_FLAGS_LUT[CLASS_KEYS[name]]
+        rules_ok += int((KEY_FLAGS_LUT[fallback] == expected).sum())
+        model_ok += int((KEY_FLAGS_LUT[keys] == expected).sum())
+        rejected += int((model.classify(landmarks, handedness)[1] > model.reject_distance).sum())
+        total += len(landmarks)
+    return rules_ok / total, model_ok / total, rejected / total
+
+
+def per_call(fn, number=20000):
+    start = time.perf_counter()
+    for _ in range(number):
+        fn()
+    return (time.perf_counter() - start) / number * 1e6
+
+
+def cost(model, hands):
+    landmarks = np.stack([synthetic_gesture('v_sign', 0.3 + 0.4 * i, 0.5, side)
+                          for i, side in enumerate((HAND_RIGHT, HAND_LEFT)[:hands])])
+    handedness = np.array((HAND_RIGHT, HAND_LEFT)[:hands])
+    fallback = rule_keys(landmarks, handedness)
+    features = normalize_landmarks(landmarks, handedness, model.scale)
+    return {
+        'rules': per_call(lambda: rule_keys(landmarks, handedness)),
+        'normalize': per_call(lambda: normalize_landmarks(landmarks, handedness, model.scale)),
+        'matmul': per_call(lambda: model.scores(features)),
+        'classifier': per_call(lambda: model.predict_keys(landmarks, handedness, fallback)),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Класифікатор статичних жестів проти порогових правил")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    model = calibrate(rng)
+    print(f"Calibrated {len(model.classes)} gestures x {CALIBRATION_SAMPLES} samples, "
+          f"reject distance {model.reject_distance:.3f}, noise {NOISE}")
+    print()
+    print("Accuracy, rules / classifier (rejected by classifier)")
+    print(f"{'angle':>6}" + "".join(f"{f'scale {scale}':>24}" for scale in SCALES))
+    for angle in ANGLES:
+        cells = []
+        for scale in SCALES:
+            rules, learned, rejected = accuracy(model, angle, scale, rng)
+            cells.append(f"{rules * 100:>5.0f}% / {learned * 100:>4.0f}% ({rejected * 100:>3.0f}%)")
+        print(f"{angle:>5}°" + "".join(f"{cell:>24}" for cell in cells))
+
+    print()
+    print(f"{'hands':>6}{'rules us':>10}{'normalize us':>14}{'matmul us':>11}{'classifier us':>15}")
+    for hands in (1, 2):
+        c = cost(model, hands)
+        print(f"{hands:>6}{c['rules']:>10.1f}{c['normalize']:>14.1f}{c['matmul']:>11.1f}{c['classifier']:>15.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,36 @@
+import time
+
+from actions import NullBackend
+from cursor import CursorInterpolator
+
+# Вартість потоку плавного руху курсора: частка одного ядра процесора, поки
+# команди руху надходять з частотою 30 Гц, і поки рук немає (потік спить).
+# Запуск з кореня репозиторію: python -m benchmarks.cursor
+
+RATES = (120, 180, 240)
+COMMAND_RATE = 30
+SECONDS = 3.0
+
+
+def measure(rate, moving=True, seconds=SECONDS):
+    cursor = CursorInterpolator(NullBackend(), rate).start()
+    cpu_start, wall_start = time.process_time(), time.perf_counter()
+    while time.perf_counter() - wall_start < seconds:
+        if moving:
+            cursor.update(12.0, -4.0)
+        time.sleep(1 / COMMAND_RATE)
+    cpu, wall = time.process_time() - cpu_start, time.perf_counter() - wall_start
+    cursor.stop()
+    return cpu / wall * 100, cursor.ticks / wall
+
+
+def main():
+    print(f"{'rate Hz':>8}{'moving CPU %':>15}{'ticks/s':>10}{'idle CPU %':>13}")
+    for rate in RATES:
+        moving_cpu, ticks = measure(rate)
+        idle_cpu, _ = measure(rate, moving=False)
+        print(f"{rate:>8}{moving_cpu:>15.2f}{ticks:>10.0f}{idle_cpu:>13.2f}")
+
+
+if __name__ == '__main__':
+    main()
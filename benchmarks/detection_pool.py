@@ -0,0 +1,149 @@
+import argparse
+import os
+import time
+
+from actions import NullBackend
+from benchmarks.executors import SyntheticDetectionStage
+from benchmarks.synthetic import synthetic_session
+from capture import FrameGrabber, SyntheticSource
+from commands import CommandChannel
+from context import ScriptedWindowBackend
+from frame_ring import FrameRing, FRAME_RING_SLOTS
+from pipeline import make_executor
+from reorder import REORDER_MAX_DELAY
+from roi import RoiTracker
+from scheduler import TierFeedback
+from stages.action import ActionStage
+from stages.capture import CaptureStage
+from stages.gesture import GestureStage
+from telemetry import LatencyHistograms, LatencyWindow, PipelineCounters
+
+# Пул детекторів: пропускна здатність проти безперервності трекінгу.
+#
+# 1. Масштабування. Джерело дає кадри швидше, ніж встигає один детектор (детекцію
+#    замінено роботою OpenCV ~10 мс на одному потоці), і для N = 1..max_workers
+#    міряється, скільки кадрів за секунду доходить до логіки жестів у порядку
+#    захоплення, скільки результатів відкинуто як запізнілі чи пропущено, і затримка
+#    етапу логіки жестів (разом з очікуванням у буфері порядку).
+# 2. Безперервність. Кожен детектор бачить лише кожен N-й кадр, тож його трекер
+#    (MediaPipe і ROI) між своїми кадрами бачить у N разів більший рух руки. На
+#    синтетичній сесії з рухомою рукою рахується, як часто рука виходить за межі
+#    ROI, передбаченої з попереднього кадру цього детектора (трекер втрачає руку),
+#    і яка частка детекцій іде по всьому кадру - повільний пошук долоні.
+#
+# Запуск з кореня репозиторію: python -m benchmarks.detection_pool [--max-workers 4]
+
+SECONDS = 5.0
+SHAPE = (720, 1280, 3)
+SOURCE_FPS = 120.0
+SESSION_FPS = 30.0
+
+
+def cpu_seconds():
+    times = os.times()
+    return times.user + times.system + times.children_user + times.children_system
+
+
+def measure_throughput(workers, seconds=SECONDS, executor_name='process'):
+    executor = make_executor(executor_name)
+    frame_queues = [executor.queue(maxsize=1) for _ in range(workers)]
+    gesture_queue = executor.queue(maxsize=workers)
+    gui_queue = executor.queue(maxsize=5, external=True)
+    source = SyntheticSource(SHAPE, SOURCE_FPS, frames=int(seconds * SOURCE_FPS))
+    source.open()
+    grabber = FrameGrabber(source).start()
+
+    frame_ring = FrameRing(SHAPE, max(FRAME_RING_SLOTS, 2 * workers + 2))
+    latency = LatencyHistograms()
+    counters = PipelineCounters()
+    command_channel = CommandChannel(counters, executor.queue())
+    tier_feedback = TierFeedback()
+
+    for worker, frame_queue in enumerate(frame_queues):
+        executor.start(SyntheticDetectionStage(frame_ring, frame_queue, gesture_queue, counters, tier_feedback,
+                                               worker=worker))
+    executor.start(GestureStage(SHAPE[1::-1], gesture_queue, None, command_channel, gui_queue, latency, counters,
+                                tier_feedback, window_backend=ScriptedWindowBackend([]),
+                                reorder_delay=REORDER_MAX_DELAY if workers > 1 else None))
+    executor.start(ActionStage(command_channel, latency, backend_factory=NullBackend))
+    window = LatencyWindow(latency)
+    cpu_start, wall_start = cpu_seconds(), time.perf_counter()
+    CaptureStage(grabber, frame_ring, frame_queues, None, counters, {}, headless=True).run()
+    wall = time.perf_counter() - wall_start
+
+    for frame_queue in frame_queues:
+        frame_queue.put(None)
+    gesture_queue.put(None)
+    command_channel.close()
+    executor.join()
+    cpu = cpu_seconds() - cpu_start
+
+    grabber.stop()
+    frame_ring.close()
+    frame_ring.unlink()
+    stats = window.update()
+    return {
+        'fps': stats['gesture']['count'] / wall,
+        'dropped': counters.get('queue_dropped', 'frame'),
+        'late': counters.get('reorder_late', 'gesture'),
+        'skipped': counters.get('reorder_skipped', 'gesture'),
+        'gesture_p50': stats['gesture']['p50'],
+        'gesture_p95': stats['gesture']['p95'],
+        'cpu': cpu / wall * 100,
+    }
+
+
+def roi_continuity(stride, session):
+    # (частка кадрів, де рука вийшла за ROI, частка детекцій по всьому кадру) для трекерів,
+    # кожен з яких бачить лише кожен stride-й кадр сесії.
+    w, h = session.frame_size
+    misses = full_frames = runs = 0
+    for start in range(stride):
+        tracker = RoiTracker((w, h))
+        for record in session.hands[start::stride]:
+            region, _ = tracker.plan()
+            record = record.copy()
+            x0, y0, x1, y1 = region
+            num_hands = int(record['num_hands'])
+            landmarks = record['landmarks'][:num_hands]
+            landmarks[..., 0] = (landmarks[..., 0] * w - x0) / (x1 - x0)
+            landmarks[..., 1] = (landmarks[..., 1] * h - y0) / (y1 - y0)
+            if region == (0, 0, w, h):
+                full_frames += 1
+            elif num_hands and ((landmarks[..., :2] < 0.0) | (landmarks[..., :2] > 1.0)).any():
+                misses += 1
+                record['num_hands'] = 0
+            tracker.update(record, region)
+            runs += 1
+    return misses / runs, full_frames / runs
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Масштабування пулу детекторів і безперервність трекінгу")
+    parser.add_argument('--max-workers', type=int, default=max(2, os.cpu_count() or 1))
+    parser.add_argument('--seconds', type=float, default=SECONDS)
+    parser.add_argument('--executor', default='process')
+    args = parser.parse_args()
+
+    print(f"CPU cores: {os.cpu_count()}, source {SOURCE_FPS:.0f} fps, executor {args.executor}")
+    rows = []
+    for workers in range(1, args.max_workers + 1):
+        rows.append((workers, measure_throughput(workers, args.seconds, args.executor)))
+
+    print(f"{'workers':>8}{'fps':>8}{'speedup':>9}{'dropped':>9}{'late':>6}{'skipped':>9}"
+          f"{'gesture p50 ms':>16}{'p95 ms':>8}{'CPU %':>8}")
+    base = rows[0][1]['fps'] or 1.0
+    for workers, r in rows:
+        print(f"{workers:>8}{r['fps']:>8.1f}{r['fps'] / base:>9.2f}{r['dropped']:>9}{r['late']:>6}{r['skipped']:>9}"
+              f"{r['gesture_p50'] * 1000:>16.1f}{r['gesture_p95'] * 1000:>8.1f}{r['cpu']:>8.1f}")
+
+    session = synthetic_session(frames=1800, fps=SESSION_FPS)
+    print()
+    print(f"{'workers':>8}{'tracker interval ms':>21}{'ROI misses %':>14}{'full-frame %':>14}")
+    for workers in range(1, args.max_workers + 1):
+        misses, full_frames = roi_continuity(workers, session)
+        print(f"{workers:>8}{workers / SESSION_FPS * 1000:>21.0f}{misses * 100:>14.1f}{full_frames * 100:>14.1f}")
+
+
+if __name__ == '__main__':
+    main()
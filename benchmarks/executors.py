@@ -0,0 +1,122 @@
+import argparse
+import os
+import time
+
+import cv2
+
+from actions import NullBackend
+from benchmarks.synthetic import synthetic_session
+from capture import FrameGrabber, SyntheticSource
+from commands import CommandChannel
+from context import ScriptedWindowBackend
+from frame_ring import FrameRing
+from landmark_filter import LandmarkFilter
+from pipeline import EXECUTORS, make_executor
+from scheduler import DetectionScheduler, TierFeedback
+from stages.action import ActionStage
+from stages.capture import CaptureStage
+from stages.detection import DetectionStage
+from stages.gesture import GestureStage
+from telemetry import LatencyHistograms, LatencyWindow, PipelineCounters
+
+# Той самий конвеєр у різних виконавцях: процеси, потоки, asyncio. Детекцію замінено
+# на роботу OpenCV приблизно тієї ж тривалості (вона, як і MediaPipe, відпускає GIL)
+# плюс синтетичні лендмарки з активацією та рухом руки, тож до виконання доходять
+# справжні команди руху. Вивід дій - NullBackend, GUI та прев'ю вимкнено.
+# Метрики: end_to_end від захоплення кадру до виконання команди (p50/p95) і
+# процесорний час усіх потоків і дочірніх процесів на секунду роботи.
+# Запуск з кореня репозиторію: python -m benchmarks.executors
+
+SECONDS = 5.0
+SHAPE = (720, 1280, 3)
+FPS = 30.0
+# Розмір і ядро розмиття підібрано так, щоб "детекція" тривала ~10 мс, як MediaPipe lite.
+DETECT_SIZE = (640, 360)
+BLUR_KERNEL = 41
+
+
+class SyntheticDetectionStage(DetectionStage):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.session = synthetic_session(frames=600)
+
+    def create_detector(self):
+        return None
+
+    def setup(self):
+        super().setup()
+        # Одна модель MediaPipe lite фактично займає одне ядро; так само обмежуємо OpenCV.
+        cv2.setNumThreads(1)
+        # Синтетичний кадр майже не змінюється, тож без цього детектор пропускав би кадри через рух.
+        self.scheduler = DetectionScheduler(self.tier_feedback, motion_threshold=0.0)
+
+    def detect(self, rgb_frame, record):
+        cv2.GaussianBlur(cv2.resize(rgb_frame, DETECT_SIZE), (BLUR_KERNEL, BLUR_KERNEL), 0)
+        source = self.session.hands[record['seq'] % len(self.session.hands)]
+        for field in ('num_hands', 'landmarks', 'handedness', 'scores'):
+            record[field] = source[field]
+        return record
+
+    def teardown(self):
+        self.frame_ring.detach()
+
+
+def cpu_seconds():
+    times = os.times()
+    return times.user + times.system + times.children_user + times.children_system
+
+
+def measure(name, seconds=SECONDS):
+    executor = make_executor(name)
+    frame_queue = executor.queue(maxsize=1)
+    gesture_queue = executor.queue(maxsize=1)
+    gui_queue = executor.queue(maxsize=5, external=True)
+    source = SyntheticSource(SHAPE, FPS, frames=int(seconds * FPS))
+    source.open()
+    grabber = FrameGrabber(source).start()
+
+    frame_ring = FrameRing(SHAPE)
+    latency = LatencyHistograms()
+    counters = PipelineCounters()
+    command_channel = CommandChannel(counters, executor.queue())
+    tier_feedback = TierFeedback()
+
+    cpu_start, wall_start = cpu_seconds(), time.perf_counter()
+    executor.start(SyntheticDetectionStage(frame_ring, frame_queue, gesture_queue, counters, tier_feedback))
+    executor.start(GestureStage(SHAPE[1::-1], gesture_queue, None, command_channel, gui_queue, latency, counters,
+                                tier_feedback, landmark_filter=LandmarkFilter(),
+                                window_backend=ScriptedWindowBackend([])))
+    executor.start(ActionStage(command_channel, latency, backend_factory=NullBackend))
+    window = LatencyWindow(latency)
+    CaptureStage(grabber, frame_ring, [frame_queue], None, counters, {}, headless=True).run()
+
+    frame_queue.put(None)
+    gesture_queue.put(None)
+    command_channel.close()
+    executor.join()
+    cpu, wall = cpu_seconds() - cpu_start, time.perf_counter() - wall_start
+
+    grabber.stop()
+    frame_ring.close()
+    frame_ring.unlink()
+    return window.update(), cpu / wall * 100
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Порівняння виконавців етапів конвеєра")
+    parser.add_argument('--seconds', type=float, default=SECONDS)
+    parser.add_argument('executors', nargs='*', metavar='EXECUTOR', default=['process', 'thread', 'asyncio'],
+                        help=f"один або кілька з: {', '.join(sorted(EXECUTORS))}")
+    args = parser.parse_args()
+
+    print(f"{'executor':<10}{'commands':>10}{'e2e p50 ms':>12}{'e2e p95 ms':>12}"
+          f"{'detect p50 ms':>15}{'CPU %':>8}")
+    for name in args.executors:
+        stats, cpu = measure(name, args.seconds)
+        e2e, detection = stats['end_to_end'], stats['detection']
+        print(f"{name:<10}{e2e['count']:>10}{e2e['p50'] * 1000:>12.1f}{e2e['p95'] * 1000:>12.1f}"
+              f"{detection['p50'] * 1000:>15.1f}{cpu:>8.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,85 @@
+import time
+from multiprocessing import Process, Queue
+
+import numpy as np
+
+from frame_ring import FrameRing
+
+# Вартість передачі одного кадру між процесами: пікл через Queue проти
+# кільцевого буфера у спільній пам'яті, де черга несе лише індекс слота.
+# Запуск з кореня репозиторію: python -m benchmarks.frame_transfer
+
+RESOLUTIONS = {'720p': (720, 1280, 3), '1080p': (1080, 1920, 3)}
+FRAMES = 200
+
+
+def _queue_consumer(in_queue, ack_queue):
+    while True:
+        frame = in_queue.get()
+        if frame is None: break
+        ack_queue.put(int(frame[0, 0, 0]))
+
+
+def _ring_consumer(frame_ring, in_queue, ack_queue):
+    while True:
+        item = in_queue.get()
+        if item is None: break
+        slot, seq, capture_time = item
+        ack_queue.put(int(frame_ring.view(slot)[0, 0, 0]))
+    frame_ring.close()
+
+
+def bench_queue(shape, frames=FRAMES):
+    in_queue, ack_queue = Queue(maxsize=1), Queue()
+    consumer = Process(target=_queue_consumer, args=(in_queue, ack_queue), daemon=True)
+    consumer.start()
+    frame = np.random.randint(0, 255, shape, dtype=np.uint8)
+    in_queue.put(frame)
+    ack_queue.get()
+
+    start = time.perf_counter()
+    for _ in range(frames):
+        in_queue.put(frame)
+        ack_queue.get()
+    elapsed = time.perf_counter() - start
+
+    in_queue.put(None)
+    consumer.join()
+    return elapsed / frames
+
+
+def bench_ring(shape, frames=FRAMES):
+    frame_ring = FrameRing(shape)
+    in_queue, ack_queue = Queue(maxsize=1), Queue()
+    consumer = Process(target=_ring_consumer, args=(frame_ring, in_queue, ack_queue), daemon=True)
+    consumer.start()
+    frame = np.random.randint(0, 255, shape, dtype=np.uint8)
+    in_queue.put((frame_ring.write(frame), 0, time.time()))
+    ack_queue.get()
+
+    start = time.perf_counter()
+    for seq in range(frames):
+        # Запис у слот відповідає cv2.flip(..., dst=slot) у головному циклі.
+        slot = frame_ring.write(frame)
+        in_queue.put((slot, seq, time.time()))
+        frame_ring.commit()
+        ack_queue.get()
+    elapsed = time.perf_counter() - start
+
+    in_queue.put(None)
+    consumer.join()
+    frame_ring.close()
+    frame_ring.unlink()
+    return elapsed / frames
+
+
+def main():
+    print(f"{'resolution':<12}{'queue ms/hop':>14}{'ring ms/hop':>14}{'queue x3':>12}{'ring x3':>12}")
+    for label, shape in RESOLUTIONS.items():
+        queue_cost = bench_queue(shape) * 1000
+        ring_cost = bench_ring(shape) * 1000
+        print(f"{label:<12}{queue_cost:>14.3f}{ring_cost:>14.3f}{queue_cost * 3:>12.3f}{ring_cost * 3:>12.3f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,86 @@
+import argparse
+import time
+from collections import Counter
+
+from benchmarks.synthetic import synthetic_session, synthetic_hold_session
+from commands import Op
+from landmark_filter import LandmarkFilter
+from replay import replay
+from rules import RuleEngine
+from session import load_session
+
+# Вартість One Euro фільтра на кадр та кількість зайвих команд на сесії без
+# фільтра, з фільтром і з фільтром + прогнозом. Без аргументу беруться дві
+# синтетичні сесії з шумом лендмарків (нерухомі утримання жестів та рух між
+# жестами) і порівнюються з тими ж сесіями без шуму.
+# Запуск з кореня репозиторію: python -m benchmarks.landmark_filter [session.npz]
+
+STEP_OPS = (Op.VOLUME, Op.SCROLL, Op.BRIGHTNESS)
+REVERSAL_WINDOW = 10
+NOISE = 0.01
+
+
+def reversals(trace):
+    # Кроки гучності/скролінгу/яскравості, що змінюють напрямок протягом REVERSAL_WINDOW кадрів.
+    last = {}
+    count = 0
+    for frame, op, a, b in trace:
+        if op not in STEP_OPS:
+            continue
+        if op in last and frame - last[op][0] <= REVERSAL_WINDOW and (a > 0) != (last[op][1] > 0):
+            count += 1
+        last[op] = (frame, a)
+    return count
+
+
+def extra_commands(trace, reference):
+    counts = Counter(op for _, op, _, _ in trace)
+    expected = Counter(op for _, op, _, _ in reference)
+    return sum(max(0, counts[op] - expected[op]) for op in counts)
+
+
+def filter_cost(session, frames=5000):
+    landmark_filter = LandmarkFilter()
+    start = time.perf_counter()
+    for hands in session.hands[:frames]:
+        landmark_filter.apply(hands)
+    return (time.perf_counter() - start) / min(frames, len(session))
+
+
+def compare(title, session, rules, reference=None):
+    print(f"\n{title}")
+    print(f"{'variant':<18}{'commands':>10}{'non-move':>10}{'reversals':>11}{'extra':>8}{'missing':>9}")
+    for name, landmark_filter, predict in (('raw', None, False), ('filtered', LandmarkFilter(), False),
+                                           ('filtered+predict', LandmarkFilter(), True)):
+        sink, _ = replay(session, rules, landmark_filter=landmark_filter, predict=predict)
+        non_move = sum(1 for _, op, _, _ in sink.trace if op != Op.MOVE)
+        extra = missing = '-'
+        if reference is not None:
+            extra = extra_commands(sink.trace, reference.trace)
+            missing = extra_commands(reference.trace, sink.trace)
+        print(f"{name:<18}{len(sink.trace):>10}{non_move:>10}{reversals(sink.trace):>11}{extra:>8}{missing:>9}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Landmark filter cost and command reduction.")
+    parser.add_argument('session', nargs='?', help="NPZ session recorded with main.py --record")
+    args = parser.parse_args()
+
+    rules = RuleEngine.load()
+    if args.session:
+        session = load_session(args.session)
+        print(f"One Euro filter: {filter_cost(session) * 1e6:.1f} us/frame")
+        compare(args.session, session, rules)
+        return
+
+    contexts = ('general', 'browser', 'media')
+    moving = synthetic_session(3000, contexts, noise=NOISE)
+    print(f"One Euro filter: {filter_cost(moving) * 1e6:.1f} us/frame (1 hand)")
+    compare(f"Held gestures, noise {NOISE}", synthetic_hold_session(noise=NOISE), rules,
+            replay(synthetic_hold_session(), rules)[0])
+    compare(f"Moving between gestures, noise {NOISE}", moving, rules,
+            replay(synthetic_session(3000, contexts), rules)[0])
+
+
+if __name__ == '__main__':
+    main()
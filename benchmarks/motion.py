@@ -0,0 +1,146 @@
+import argparse
+import time
+
+import numpy as np
+
+from benchmarks.synthetic import synthetic_motion_session
+from gesture_engine import SWIPE_COMMANDS
+from landmark_filter import LandmarkFilter
+from motion import MotionDetector, MOTIONS, SWIPES
+from replay import replay
+from rules import RuleEngine
+from session import load_session
+
+# Детектор руху проти якоря. Обидва способи проганяються через ту саму логіку жестів
+# (долоня озброює, та сама пауза між спрацюваннями):
+# 1. Синтетична сесія з відомим початком кожного руху: скільки рухів розпізнано
+#    правильно, скільки дали не ту команду, і затримка від початку руху до команди
+#    (p50/p95, також у частках тривалості руху). Якір розпізнає лише свайпи; коло для
+#    нього - свайп у бік першої дуги.
+# 2. Записана сесія (якщо вказана): початок руху невідомий, тож свайпи обох способів
+#    зіставляються між собою, і виводиться, наскільки раніше спрацьовує детектор руху.
+# 3. Вартість детектора: мікросекунди на кадр (додавання в історію + розпізнавання).
+#
+# Запуск з кореня репозиторію: python -m benchmarks.motion [session.npz]
+
+FPS = 30.0
+REPEATS = 10
+CONTEXT = 'media'
+NOISE_LEVELS = (0.0, 0.003)
+FILTERED_NOISE = 0.01
+MATCH_WINDOW = 0.5
+
+
+def run(session, rules, motion, landmark_filter=None):
+    # [(час кадру, код операції, аргумент), ...] для всіх команд сесії.
+    sink, _ = replay(session, rules, landmark_filter=landmark_filter, motion=motion)
+    times = session.hands['capture_time']
+    return [(float(times[frame]), op, a) for frame, op, a, _ in sink.trace]
+
+
+def expected_command(rules, motion):
+    if motion in SWIPE_COMMANDS:
+        return SWIPE_COMMANDS[motion][0], 0.0
+    rule = rules.lookup_motion(CONTEXT, motion)
+    return (rule.command[0], rule.command[1]) if rule is not None else (None, 0.0)
+
+
+def score(commands, events, rules):
+    # {рух: (правильно, не та команда, затримки правильних)} та кількість команд до початку рухів.
+    stats = {}
+    early = 0
+    bounds = [onset for onset, _, _ in events[1:]] + [float('inf')]
+    for (onset, duration, motion), end in zip(events, bounds):
+        window = [(t, op, a) for t, op, a in commands if onset - 1.0 < t < end]
+        early += sum(1 for t, _, _ in window if t <= onset)
+        fired = [(t, op, a) for t, op, a in window if t > onset]
+        correct, wrong, latencies = stats.get(motion, (0, 0, []))
+        if fired:
+            t, op, a = fired[0]
+            if (op, a) == expected_command(rules, motion):
+                correct += 1
+                latencies.append((t - onset, (t - onset) / duration))
+            else:
+                wrong += 1
+        stats[motion] = (correct, wrong, latencies)
+    return stats, early
+
+
+def compare_synthetic(title, session, events, rules, landmark_filter_factory=None):
+    print(title)
+    print(f"{'motion':<12}{'method':<8}{'correct':>9}{'wrong':>7}{'p50 ms':>8}{'p95 ms':>8}{'p50 % of motion':>17}")
+    results = {}
+    for method in ('anchor', 'motion'):
+        landmark_filter = landmark_filter_factory() if landmark_filter_factory else None
+        results[method] = score(run(session, rules, method == 'motion', landmark_filter), events, rules)
+    for motion in dict.fromkeys(m for _, _, m in events):
+        for method in ('anchor', 'motion'):
+            correct, wrong, latencies = results[method][0][motion]
+            if latencies:
+                ms = np.array([latency for latency, _ in latencies]) * 1000
+                share = np.median([fraction for _, fraction in latencies]) * 100
+                timing = f"{np.percentile(ms, 50):>8.0f}{np.percentile(ms, 95):>8.0f}{share:>17.0f}"
+            else:
+                timing = f"{'-':>8}{'-':>8}{'-':>17}"
+            print(f"{motion:<12}{method:<8}{correct:>9}{wrong:>7}{timing}")
+    print(f"commands before motion onset: anchor {results['anchor'][1]}, motion {results['motion'][1]}")
+    print()
+
+
+def compare_recorded(path, rules):
+    session = load_session(path)
+    swipe_ops = {SWIPE_COMMANDS[m][0] for m in SWIPES}
+    anchor = [(t, op) for t, op, _ in run(session, rules, False) if op in swipe_ops]
+    motion = [(t, op) for t, op, _ in run(session, rules, True)]
+    leads, unmatched = [], 0
+    for t, op in anchor:
+        matches = [m_t for m_t, m_op in motion if m_op == op and abs(m_t - t) < MATCH_WINDOW]
+        if matches:
+            leads.append(t - min(matches, key=lambda m_t: abs(m_t - t)))
+        else:
+            unmatched += 1
+    other = sum(1 for _, op in motion if op not in swipe_ops)
+    print(f"Recorded session {path}: {len(session)} frames, {session.duration:.1f} s")
+    print(f"  anchor swipes: {len(anchor)}, motion commands: {len(motion)} ({other} circles/flicks)")
+    if leads:
+        leads = np.array(leads) * 1000
+        print(f"  matched swipes: {len(leads)}, motion detector earlier by p50 {np.percentile(leads, 50):.0f} ms, "
+              f"min {leads.min():.0f} ms, max {leads.max():.0f} ms")
+    print(f"  anchor swipes without a motion swipe within {MATCH_WINDOW * 1000:.0f} ms: {unmatched}")
+    print()
+
+
+def detector_cost(session, repeats=5):
+    detector = MotionDetector(session.frame_size)
+    start = time.perf_counter()
+    for _ in range(repeats):
+        for hands in session.hands:
+            detector.push(hands)
+            detector.detect()
+    return (time.perf_counter() - start) / (repeats * len(session.hands)) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Затримка розпізнавання свайпів: детектор руху проти якоря")
+    parser.add_argument('session', nargs='?', help="NPZ-сесія, записана через main.py --record")
+    parser.add_argument('--repeats', type=int, default=REPEATS)
+    args = parser.parse_args()
+
+    rules = RuleEngine.load()
+    motions = [m for m in MOTIONS if m in SWIPES or rules.lookup_motion(CONTEXT, m) is not None]
+    for noise in NOISE_LEVELS:
+        session, events = synthetic_motion_session(motions, args.repeats, FPS, noise=noise, context=CONTEXT)
+        compare_synthetic(f"Synthetic motions, {FPS:.0f} fps, noise {noise}", session, events, rules)
+    session, events = synthetic_motion_session(motions, args.repeats, FPS, noise=FILTERED_NOISE, context=CONTEXT)
+    compare_synthetic(f"Synthetic motions, {FPS:.0f} fps, noise {FILTERED_NOISE} + One Euro filter", session, events,
+                      rules, LandmarkFilter)
+    print(f"Motion detector: {detector_cost(session):.1f} us/frame (push + detect, "
+          f"history {MotionDetector(session.frame_size).history.capacity} frames)")
+
+    if args.session:
+        print()
+        compare_recorded(args.session, rules)
+
+
+if __name__ == '__main__':
+    main()
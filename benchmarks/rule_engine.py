@@ -0,0 +1,39 @@
+import time
+
+import numpy as np
+
+from features import extract_features, gesture_flags, gesture_keys
+from landmarks import HAND_RIGHT
+from rules import RuleEngine, PHASE_OVERRIDE, PHASE_ACTION
+
+# Час визначення дії на кадр: ознаки руки + ключ жесту + пошук у таблиці правил.
+# Запуск з кореня репозиторію: python -m benchmarks.rule_engine
+
+FRAMES = 20000
+
+
+def main():
+    rules = RuleEngine.load()
+    rng = np.random.default_rng(0)
+    hands = rng.random((FRAMES, 1, 21, 3), dtype=np.float32)
+    handedness = np.array([HAND_RIGHT])
+
+    start = time.perf_counter()
+    keys = []
+    for landmarks in hands:
+        features = extract_features(landmarks, handedness)
+        keys.append(int(gesture_keys(features, gesture_flags(features))[0]))
+    feature_cost = (time.perf_counter() - start) / FRAMES
+
+    print(f"{'context':<12}{'lookup us/frame':>18}{'features+lookup us/frame':>28}")
+    for context in rules.contexts:
+        start = time.perf_counter()
+        for key in keys:
+            if rules.lookup(PHASE_OVERRIDE, context, key) is None:
+                rules.lookup(PHASE_ACTION, context, key)
+        lookup_cost = (time.perf_counter() - start) / FRAMES
+        print(f"{context:<12}{lookup_cost * 1e6:>18.3f}{(feature_cost + lookup_cost) * 1e6:>28.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,200 @@
+import numpy as np
+
+from landmarks import new_hands_record, HANDS_RECORD_DTYPE, HAND_RIGHT, HAND_LEFT
+from session import Session
+
+# Синтетичні лендмарки для бенчмарків: рука з заданою маскою піднятих пальців
+# (біт 0 - великий, 1 - вказівний, ... 4 - мізинець) у заданій точці кадру.
+
+FINGER_JOINTS = [(8, 7, 6, 5), (12, 11, 10, 9), (16, 15, 14, 13), (20, 19, 18, 17)]
+FINGER_SPREAD = (-0.045, -0.015, 0.015, 0.045)
+
+# Маски жестів з README: долоня, вказівний, V, три пальці, мізинець, великий вгору, "коза", кулак.
+GESTURE_MASKS = (0b11111, 0b00010, 0b00110, 0b01110, 0b10000, 0b00001, 0b10011, 0b00000)
+HOLD_FRAMES = 90
+DETECTION_LATENCY = 0.035
+
+
+def synthetic_hand(mask, x=0.5, y=0.5, handedness=HAND_RIGHT, pinch=False):
+    lm = np.zeros((21, 3), dtype=np.float32)
+    lm[0] = (x, y + 0.12, 0.0)
+    for bit, (joints, dx) in enumerate(zip(FINGER_JOINTS, FINGER_SPREAD), start=1):
+        tip, dip, pip, mcp = joints
+        up = (mask >> bit) & 1
+        lm[mcp] = (x + dx, y, 0.0)
+        lm[pip] = (x + dx, y - 0.04, 0.0)
+        lm[dip] = (x + dx, y - 0.07 if up else y - 0.02, 0.0)
+        lm[tip] = (x + dx, y - 0.10 if up else y - 0.01, 0.0)
+    side = 1.0 if handedness == HAND_RIGHT else -1.0
+    thumb_out = side * (0.09 if mask & 1 else -0.02)
+    lm[1] = (x - side * 0.04, y + 0.08, 0.0)
+    lm[2] = (x - side * 0.06 + side * 0.02, y + 0.05, 0.0)
+    lm[3] = (lm[2][0] + thumb_out * 0.5, y + 0.02, 0.0)
+    lm[4] = (lm[2][0] + thumb_out, y - 0.02, 0.0)
+    if pinch:
+        lm[4] = lm[8] + (0.01, 0.01, 0.0)
+    return lm
+
+
+def transform_hand(landmarks, angle=0.0, scale=1.0, aspect=720 / 1280):
+    # Поворот (радіани, за годинниковою стрілкою на екрані) і масштаб руки навколо зап'ястя;
+    # обчислюється в пікселях ширини кадру, щоб не спотворювати форму.
+    lm = landmarks.copy()
+    offset = (lm[:, :2] - lm[0, :2]) * (1.0, aspect) * scale
+    c, s = np.cos(angle), np.sin(angle)
+    rotated = offset @ np.array([[c, s], [-s, c]], dtype=np.float32)
+    lm[:, :2] = lm[0, :2] + rotated / (1.0, aspect)
+    return lm
+
+
+# Канонічні пози класів classifier.py, які правила features.py розпізнають без помилок.
+# Складені для правої руки; ліва - дзеркальне відображення. У позах зі зігнутим
+# вказівним великий палець відведено від нього, щоб не виходив щипок.
+GESTURE_POSES = {'fist': 0b00000, 'palm': 0b11111, 'point': 0b00010, 'v_sign': 0b00110, 'three': 0b01110,
+                 'pinky': 0b10000, 'thumbs_up': 0b00001, 'rock': 0b10011, 'thumbs_down': 0b00000,
+                 'ok': 0b11100, 'pinch': 0b00011}
+
+
+def synthetic_gesture(name, x=0.5, y=0.5, handedness=HAND_RIGHT):
+    lm = synthetic_hand(GESTURE_POSES[name], x, y, HAND_RIGHT, pinch=(name == 'pinch'))
+    if name in ('fist', 'pinky'):
+        lm[3] = (x - 0.05, y + 0.06, 0.0)
+        lm[4] = (x - 0.065, y + 0.04, 0.0)
+    elif name == 'thumbs_down':
+        lm[3] = (x - 0.05, y + 0.09, 0.0)
+        lm[4] = (x - 0.06, y + 0.13, 0.0)
+    elif name == 'ok':
+        lm[4] = lm[8] + (-0.01, 0.01, 0.0)
+    if handedness == HAND_LEFT:
+        lm[:, 0] = 2 * x - lm[:, 0]
+    return lm
+
+
+def synthetic_record(t, hands, seq=0):
+    record = new_hands_record(seq, t)
+    record['detect_start'] = t + 0.005
+    record['detect_end'] = t + DETECTION_LATENCY
+    record['num_hands'] = len(hands)
+    for i, (landmarks, handedness) in enumerate(hands):
+        record['landmarks'][i] = landmarks
+        record['handedness'][i] = handedness
+        record['scores'][i] = 0.9
+    return record
+
+
+def synthetic_session(frames=3000, contexts=('general',), fps=30.0, seed=0, noise=0.0):
+    # Активація двома долонями, далі рука переходить між жестами й рухається.
+    rng = np.random.default_rng(seed)
+    hands = np.zeros(frames, dtype=HANDS_RECORD_DTYPE)
+    session_contexts = []
+    segment = 45
+    for i in range(frames):
+        t = i / fps
+        if i < 15:
+            record = synthetic_record(t, [(synthetic_hand(0b11111, 0.3, 0.5, HAND_RIGHT), HAND_RIGHT),
+                                          (synthetic_hand(0b11111, 0.7, 0.5, HAND_LEFT), HAND_LEFT)], i)
+        else:
+            phase = (i - 15) // segment
+            mask = GESTURE_MASKS[phase % len(GESTURE_MASKS)]
+            k = (i - 15) % segment
+            x = 0.5 + 0.25 * np.sin(k / segment * np.pi) * (1 if phase % 2 else -1)
+            y = 0.5 + 0.1 * np.cos(k / 7.0)
+            landmarks = synthetic_hand(mask, x, y, HAND_RIGHT, pinch=(phase % 5 == 4 and k > 20))
+            if noise:
+                landmarks = landmarks + rng.normal(0.0, noise, landmarks.shape).astype(np.float32)
+            record = synthetic_record(t, [(landmarks, HAND_RIGHT)], i)
+        hands[i] = record
+        session_contexts.append(contexts[(i // 600) % len(contexts)])
+    return Session(hands, session_contexts, (1280, 720))
+
+
+def synthetic_hold_session(frames=3000, fps=30.0, seed=0, noise=0.0):
+    # Активація, далі жести утримуються нерухомо по HOLD_FRAMES кадрів; вказівний палець
+    # стоїть біля межі мертвої зони курсора. Без шуму кожне утримання дає фіксований набір
+    # команд, тож усе, що з'являється з шумом, - зайві команди від тремтіння.
+    rng = np.random.default_rng(seed)
+    hands = np.zeros(frames, dtype=HANDS_RECORD_DTYPE)
+    masks = (0b00010, 0b00110, 0b00001, 0b10000, 0b00010, 0b10011)
+    x, y = 0.542, 0.6
+    for i in range(frames):
+        t = i / fps
+        if i < 15:
+            record = synthetic_record(t, [(synthetic_hand(0b11111, 0.3, 0.5, HAND_RIGHT), HAND_RIGHT),
+                                          (synthetic_hand(0b11111, 0.7, 0.5, HAND_LEFT), HAND_LEFT)], i)
+        else:
+            landmarks = synthetic_hand(masks[((i - 15) // HOLD_FRAMES) % len(masks)], x, y, HAND_RIGHT)
+            if noise:
+                landmarks = landmarks + rng.normal(0.0, noise, landmarks.shape).astype(np.float32)
+            record = synthetic_record(t, [(landmarks, HAND_RIGHT)], i)
+        hands[i] = record
+    return Session(hands, ['general'] * frames, (1280, 720))
+
+
+def synthetic_frame(shape=(720, 1280, 3), seed=0):
+    return np.random.default_rng(seed).integers(0, 255, shape, dtype=np.uint8)
+
+
+# Сесія динамічних жестів: перед кожним рухом долоня стоїть нерухомо MOTION_HOLD секунд
+# (свайп озброєний, пауза між свайпами минула), далі рух, коротка зупинка і рука зникає.
+# Рухи: свайпи на 0.3 кадру за 0.3 с, коло радіусом 0.07 ширини кадру за 1 с,
+# клацання - поворот кисті навколо зап'ястя на 0.6 рад за 0.12 с.
+MOTION_HOLD = 1.0
+MOTION_DURATIONS = {'swipe': 0.3, 'circle': 1.0, 'flick': 0.12}
+SWIPE_STARTS = {'swipe_right': (0.35, 0.5), 'swipe_left': (0.65, 0.5),
+                'swipe_up': (0.5, 0.65), 'swipe_down': (0.5, 0.35)}
+
+
+def _smoothstep(u):
+    return u * u * (3.0 - 2.0 * u)
+
+
+def _motion_hand(motion, u, aspect):
+    # Лендмарки долоні в момент u (0..1) руху; aspect = висота / ширина кадру.
+    s = _smoothstep(min(max(u, 0.0), 1.0))
+    if motion in SWIPE_STARTS:
+        x, y = SWIPE_STARTS[motion]
+        dx, dy = {'swipe_right': (0.3, 0.0), 'swipe_left': (-0.3, 0.0),
+                  'swipe_up': (0.0, -0.3), 'swipe_down': (0.0, 0.3)}[motion]
+        return synthetic_hand(0b11111, x + dx * s, y + dy * s)
+    if motion in ('circle_cw', 'circle_ccw'):
+        angle = np.pi + (2.0 * np.pi * s if motion == 'circle_cw' else -2.0 * np.pi * s)
+        return synthetic_hand(0b11111, 0.5 + 0.07 * np.cos(angle), 0.5 + 0.07 / aspect * np.sin(angle))
+    # Клацання: поворот усієї кисті навколо зап'ястя.
+    return transform_hand(synthetic_hand(0b11111, 0.5, 0.5), 0.6 * s * (1.0 if motion == 'flick_right' else -1.0),
+                          aspect=aspect)
+
+
+def synthetic_motion_session(motions, repeats=5, fps=30.0, seed=0, noise=0.0, context='general'):
+    # Повертає (сесія, [(час початку руху, тривалість, назва руху), ...]).
+    rng = np.random.default_rng(seed)
+    w, h = 1280, 720
+    records, events = [], []
+
+    def add(hands):
+        records.append(synthetic_record(len(records) / fps, hands, len(records)))
+
+    for _ in range(15):
+        add([(synthetic_hand(0b11111, 0.3, 0.5, HAND_RIGHT), HAND_RIGHT),
+             (synthetic_hand(0b11111, 0.7, 0.5, HAND_LEFT), HAND_LEFT)])
+    for _ in range(int(0.6 * fps)):
+        add([])
+
+    for motion in list(motions) * repeats:
+        duration = MOTION_DURATIONS[motion.split('_')[0]]
+        steps = int(round(duration * fps))
+        hold = int(MOTION_HOLD * fps)
+        frames = [0.0] * hold + [k / steps for k in range(1, steps + 1)] + [1.0] * int(0.3 * fps)
+        # Рух починається одразу після останнього нерухомого кадру.
+        events.append(((len(records) + hold - 1) / fps, duration, motion))
+        for u in frames:
+            landmarks = _motion_hand(motion, u, h / w)
+            if noise:
+                landmarks = landmarks + rng.normal(0.0, noise, landmarks.shape).astype(np.float32)
+            add([(landmarks, HAND_RIGHT)])
+        for _ in range(int(0.4 * fps)):
+            add([])
+
+    hands = np.zeros(len(records), dtype=HANDS_RECORD_DTYPE)
+    for i, record in enumerate(records):
+        hands[i] = record
+    return Session(hands, [context] * len(records), (w, h)), events
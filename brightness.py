@@ -0,0 +1,119 @@
+import threading
+import time
+
+# --------------------------------------------------------------------------------
+# --- КЕРУВАННЯ ЯСКРАВІСТЮ З КЕШЕМ ТА ФОНОВИМ ЗАПИСОМ ---
+# --------------------------------------------------------------------------------
+# DDC/CI читання і запис тривають 50-300 мс, тому рівень читається один раз,
+# кроки жестів лише змінюють цільове значення в пам'яті, а фоновий потік
+# записує в монітор тільки останнє значення не частіше за min_interval
+# і періодично перечитує фактичний рівень.
+
+
+class SbcBrightnessBackend:
+    def __init__(self):
+        import screen_brightness_control as sbc
+        self._sbc = sbc
+
+    def get(self):
+        current = self._sbc.get_brightness()
+        return current[0] if isinstance(current, list) else current
+
+    def set(self, level):
+        self._sbc.set_brightness(level)
+
+
+class FakeBrightnessBackend:
+    def __init__(self, level=50, latency=0.0):
+        self.level = level
+        self.latency = latency
+        self.reads = 0
+        self.writes = []
+
+    def get(self):
+        time.sleep(self.latency)
+        self.reads += 1
+        return self.level
+
+    def set(self, level):
+        time.sleep(self.latency)
+        self.level = level
+        self.writes.append(level)
+
+
+class BrightnessController:
+    def __init__(self, backend, min_interval=0.1, resync_interval=10.0):
+        self.backend = backend
+        self.min_interval = min_interval
+        self.resync_interval = resync_interval
+        self._lock = threading.Lock()
+        self._changed = threading.Event()
+        self._stop = threading.Event()
+        self._target = None
+        self._applied = None
+        self._pending_delta = 0
+        self._last_write_time = 0.0
+        self._thread = threading.Thread(target=self._run, name="brightness-writer", daemon=True)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        self._changed.set()
+        self._thread.join()
+
+    @property
+    def level(self):
+        return self._target
+
+    def change(self, delta):
+        with self._lock:
+            if self._target is None:
+                self._pending_delta += delta
+            else:
+                self._target = max(0, min(100, self._target + delta))
+        self._changed.set()
+
+    def _sync(self):
+        try:
+            level = self.backend.get()
+        except Exception as e:
+            print(f"Brightness error: {e}")
+            return
+        with self._lock:
+            self._applied = level
+            if self._target is None:
+                self._target = max(0, min(100, level + self._pending_delta))
+                if self._pending_delta:
+                    self._changed.set()
+                self._pending_delta = 0
+            elif not self._changed.is_set():
+                self._target = level
+
+    def _run(self):
+        while self._applied is None:
+            self._sync()
+            if self._applied is None and self._stop.wait(self.resync_interval):
+                return
+        while not self._stop.is_set():
+            if not self._changed.wait(self.resync_interval):
+                self._sync()
+                continue
+            if self._stop.is_set(): break
+
+            wait = self.min_interval - (time.monotonic() - self._last_write_time)
+            if wait > 0 and self._stop.wait(wait):
+                break
+            self._changed.clear()
+            with self._lock:
+                target = self._target
+            if target == self._applied:
+                continue
+            try:
+                self.backend.set(target)
+                self._applied = target
+            except Exception as e:
+                print(f"Brightness error: {e}")
+            self._last_write_time = time.monotonic()
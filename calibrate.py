@@ -0,0 +1,124 @@
+import argparse
+
+import numpy as np
+
+from classifier import GestureClassifier, CLASSES, DEFAULT_MODEL_PATH
+
+# --------------------------------------------------------------------------------
+# --- КАЛІБРУВАННЯ КЛАСИФІКАТОРА ЖЕСТІВ ---
+# --------------------------------------------------------------------------------
+# Для кожного жесту: показати його в камеру й натиснути пробіл - записується
+# --samples кадрів з однією рукою (під час запису варто трохи повертати руку й
+# змінювати відстань до камери). Esc - пропустити жест, q - завершити. Кадри
+# віддзеркалюються, як у конвеєрі, тож руки розпізнаються так само. Без камери
+# зразки можна взяти із записаних сесій: --session palm=palm.npz (у сесії має
+# бути лише цей жест). Модель зберігається в --out для main.py --classifier.
+
+SAMPLES = 40
+WINDOW_NAME = 'Gesture calibration'
+
+
+def samples_from_session(path):
+    # (лендмарки, руки, розмір кадру) кадрів сесії, на яких рівно одна рука.
+    from session import load_session
+    session = load_session(path)
+    single = session.hands[session.hands['num_hands'] == 1]
+    return single['landmarks'][:, 0], single['handedness'][:, 0], session.frame_size
+
+
+def record_from_camera(args, gestures):
+    # ({жест: (лендмарки, руки)}, розмір кадру) або (None, None), якщо камера не відкрилась.
+    import cv2
+    import mediapipe as mp
+
+    from capture import open_source
+    from landmarks import new_hands_record, fill_from_mediapipe, draw_hands
+
+    source = open_source(args.source, args.width, args.height, args.fps, not args.no_mjpg)
+    if not source.open():
+        return None, None
+    detector = mp.solutions.hands.Hands(
+        model_complexity=0, min_detection_confidence=0.6, min_tracking_confidence=0.5, max_num_hands=1)
+    samples, frame_size = {}, None
+    try:
+        for name in gestures:
+            landmarks, handedness = [], []
+            recording = False
+            while len(landmarks) < args.samples:
+                ok, frame = source.read()
+                if not ok:
+                    return samples, frame_size
+                frame = cv2.flip(frame, 1)
+                frame_size = frame.shape[1::-1]
+                result = detector.process(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
+                record = fill_from_mediapipe(new_hands_record(), result)
+                if recording and record['num_hands'] == 1:
+                    landmarks.append(record['landmarks'][0].copy())
+                    handedness.append(record['handedness'][0])
+                draw_hands(frame, record)
+                if recording:
+                    text = f"{name}: {len(landmarks)}/{args.samples}"
+                else:
+                    text = f"Show '{name}' and press SPACE (Esc - skip)"
+                cv2.putText(frame, text, (10, 30), cv2.FONT_HERSHEY_SIMPLEX, 0.8, (0, 255, 0), 2)
+                cv2.imshow(WINDOW_NAME, frame)
+                key = cv2.waitKey(1) & 0xFF
+                if key == ord('q'):
+                    return samples, frame_size
+                if key == 27:
+                    break
+                if key == ord(' '):
+                    recording = True
+            if len(landmarks) == args.samples:
+                samples[name] = (np.stack(landmarks), np.array(handedness))
+    finally:
+        detector.close()
+        source.release()
+        cv2.destroyAllWindows()
+    return samples, frame_size
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Калібрування класифікатора статичних жестів")
+    parser.add_argument('--out', default=DEFAULT_MODEL_PATH, help="куди зберегти модель (NPZ)")
+    parser.add_argument('--samples', type=int, default=SAMPLES, help="кадрів на жест")
+    parser.add_argument('--gestures', nargs='+', choices=CLASSES, default=list(CLASSES), metavar='GESTURE',
+                        help=f"які жести записувати: {', '.join(CLASSES)}")
+    parser.add_argument('--session', action='append', default=[], metavar='GESTURE=PATH',
+                        help="взяти зразки жесту з NPZ-сесії main.py --record замість камери (можна кілька разів)")
+    parser.add_argument('--source', default='camera',
+                        help="джерело кадрів: camera, camera:N, відеофайл або тека/шаблон зображень")
+    parser.add_argument('--width', type=int, default=1280)
+    parser.add_argument('--height', type=int, default=720)
+    parser.add_argument('--fps', type=int, default=30)
+    parser.add_argument('--no-mjpg', action='store_true', help="не вимагати від камери формат MJPG")
+    args = parser.parse_args()
+
+    if args.session:
+        samples, frame_size = {}, None
+        for spec in args.session:
+            name, _, path = spec.partition('=')
+            if name not in CLASSES or not path:
+                parser.error(f"--session {spec}: очікується GESTURE=PATH, GESTURE - один з {', '.join(CLASSES)}")
+            landmarks, handedness, frame_size = samples_from_session(path)
+            samples[name] = (landmarks, handedness)
+    else:
+        samples, frame_size = record_from_camera(args, args.gestures)
+        if samples is None:
+            print("ПОМИЛКА: Не вдалося відкрити джерело кадрів. Перевірте --source.")
+            return
+
+    samples = {name: sample for name, sample in samples.items() if len(sample[0])}
+    if not samples:
+        print("ПОМИЛКА: Не записано жодного жесту.")
+        return
+    model = GestureClassifier.fit(samples, frame_size)
+    model.save(args.out)
+    for name, (landmarks, _) in samples.items():
+        print(f"{name:<12}{len(landmarks):>6} samples")
+    print(f"Reject distance: {model.reject_distance:.3f}")
+    print(f"Model saved: {args.out} ({len(model.classes)} gestures)")
+
+
+if __name__ == '__main__':
+    main()
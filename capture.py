@@ -0,0 +1,254 @@
+import glob
+import os
+import threading
+import time
+
+import cv2
+import numpy as np
+
+# --------------------------------------------------------------------------------
+# --- ЗАХОПЛЕННЯ КАДРІВ: ДЖЕРЕЛА ТА ПОТІК-ГРАБЕР ---
+# --------------------------------------------------------------------------------
+# Джерело кадрів (камера, відеофайл, послідовність зображень або синтетичний
+# тестовий сигнал) читається в окремому потоці, який зберігає лише останній кадр.
+# Головний цикл забирає найсвіжіший кадр і не гальмує захоплення, навіть якщо
+# imshow чи waitKey тривають довго. Кадри, які ніхто не встиг забрати,
+# перезаписуються і рахуються як пропущені. Потік може й сам відкрити джерело:
+# відкриття камери триває до кількох секунд і йде паралельно із запуском етапів.
+
+VIDEO_EXTENSIONS = ('.mp4', '.avi', '.mkv', '.mov', '.webm')
+
+
+class CameraSource:
+    live = True
+
+    def __init__(self, indices=(1, 0), width=1280, height=720, fps=30, mjpg=True):
+        self.indices = indices
+        self.width = width
+        self.height = height
+        self.fps = fps
+        self.mjpg = mjpg
+        self._cap = None
+
+    def open(self):
+        for index in self.indices:
+            cap = cv2.VideoCapture(index)
+            if cap.isOpened():
+                self._cap = cap
+                self._negotiate(index)
+                return True
+            print(f"ПОМИЛКА: Не вдалося відкрити камеру з індексом {index}.")
+        return False
+
+    def _negotiate(self, index):
+        # Порядок важливий: багато камер дають 720p@30 лише у MJPG, тому формат задається першим.
+        cap = self._cap
+        if self.mjpg:
+            cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*'MJPG'))
+        cap.set(cv2.CAP_PROP_FRAME_WIDTH, self.width)
+        cap.set(cv2.CAP_PROP_FRAME_HEIGHT, self.height)
+        cap.set(cv2.CAP_PROP_FPS, self.fps)
+        fourcc = int(cap.get(cv2.CAP_PROP_FOURCC))
+        fourcc = "".join(chr((fourcc >> (8 * i)) & 0xFF) for i in range(4)) if fourcc else "?"
+        print(f"Camera {index}: {int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))}x{int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))} "
+              f"@ {cap.get(cv2.CAP_PROP_FPS):.0f} fps, {fourcc}")
+
+    def read(self):
+        return self._cap.read()
+
+    def release(self):
+        if self._cap is not None:
+            self._cap.release()
+            self._cap = None
+
+
+class VideoFileSource:
+    live = False
+
+    def __init__(self, path, loop=False):
+        self.path = path
+        self.loop = loop
+        self.fps = None
+        self._cap = None
+
+    def open(self):
+        self._cap = cv2.VideoCapture(self.path)
+        if not self._cap.isOpened():
+            print(f"ПОМИЛКА: Не вдалося відкрити відео {self.path}")
+            return False
+        self.fps = self._cap.get(cv2.CAP_PROP_FPS) or 30.0
+        return True
+
+    def read(self):
+        success, frame = self._cap.read()
+        if not success and self.loop:
+            self._cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+            success, frame = self._cap.read()
+        return success, frame
+
+    def release(self):
+        if self._cap is not None:
+            self._cap.release()
+            self._cap = None
+
+
+class ImageSequenceSource:
+    live = False
+
+    def __init__(self, pattern, fps=30.0, loop=False):
+        self.pattern = os.path.join(pattern, '*') if os.path.isdir(pattern) else pattern
+        self.fps = fps
+        self.loop = loop
+        self._paths = []
+        self._next = 0
+
+    def open(self):
+        self._paths = sorted(glob.glob(self.pattern))
+        if not self._paths:
+            print(f"ПОМИЛКА: Немає зображень за шаблоном {self.pattern}")
+            return False
+        return True
+
+    def read(self):
+        if self._next == len(self._paths):
+            if not self.loop:
+                return False, None
+            self._next = 0
+        frame = cv2.imread(self._paths[self._next])
+        self._next += 1
+        return frame is not None, frame
+
+    def release(self):
+        pass
+
+
+class SyntheticSource:
+    # Тестовий сигнал: кольоровий градієнт з яскравим квадратом, що рухається по колу.
+    live = False
+
+    def __init__(self, shape=(720, 1280, 3), fps=30.0, frames=None):
+        self.shape = shape
+        self.fps = fps
+        self.frames = frames
+        self._index = 0
+        self._background = None
+
+    def open(self):
+        h, w = self.shape[:2]
+        x = np.linspace(0, 255, w, dtype=np.float32)
+        y = np.linspace(0, 255, h, dtype=np.float32)[:, None]
+        self._background = np.dstack([np.broadcast_to(x, (h, w)), np.broadcast_to(y, (h, w)),
+                                      np.full((h, w), 96, np.float32)]).astype(np.uint8)
+        return True
+
+    def read(self):
+        if self.frames is not None and self._index >= self.frames:
+            return False, None
+        h, w = self.shape[:2]
+        frame = self._background.copy()
+        angle = self._index / self.fps
+        cx, cy = int(w / 2 + w / 4 * np.cos(angle)), int(h / 2 + h / 4 * np.sin(angle))
+        cv2.rectangle(frame, (cx - 40, cy - 40), (cx + 40, cy + 40), (255, 255, 255), -1)
+        self._index += 1
+        return True, frame
+
+    def release(self):
+        pass
+
+
+def open_source(spec, width=1280, height=720, fps=30, mjpg=True, loop=False):
+    # spec: "camera", "camera:0", "synthetic", шлях до відео або до теки/шаблону зображень.
+    if spec == 'camera':
+        return CameraSource((1, 0), width, height, fps, mjpg)
+    if spec.startswith('camera:'):
+        return CameraSource((int(spec.split(':', 1)[1]),), width, height, fps, mjpg)
+    if spec == 'synthetic':
+        return SyntheticSource((height, width, 3), fps)
+    if os.path.isfile(spec) and spec.lower().endswith(VIDEO_EXTENSIONS):
+        return VideoFileSource(spec, loop)
+    return ImageSequenceSource(spec, fps, loop)
+
+
+class FrameGrabber:
+    def __init__(self, source, reconnect_delay=1.0):
+        self.source = source
+        self.reconnect_delay = reconnect_delay
+        self.frames = 0
+        self.dropped = 0
+        self.open_time = None
+        self._open_source = False
+        self._cond = threading.Condition()
+        self._latest = None
+        self._taken = True
+        self._ended = False
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="frame-grabber", daemon=True)
+
+    def start(self, open_source=False):
+        # open_source - викликати source.open() у потоці грабера; якщо не вдалося, ended стає True.
+        self._open_source = open_source
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+        self.source.release()
+
+    def _publish(self, frame, capture_time):
+        with self._cond:
+            if not self._taken:
+                self.dropped += 1
+            self._latest = (frame, capture_time)
+            self._taken = False
+            self.frames += 1
+            self._cond.notify()
+
+    def _end(self):
+        with self._cond:
+            self._ended = True
+            self._cond.notify_all()
+
+    def _run(self):
+        if self._open_source and not self.source.open():
+            self._end()
+            return
+        self.open_time = time.time()
+        pace = None if self.source.live else 1.0 / self.source.fps
+        next_time = time.perf_counter()
+        while not self._stop.is_set():
+            success, frame = self.source.read()
+            capture_time = time.time()
+            if not success:
+                if not self.source.live:
+                    break
+                print("Помилка читання кадру, спроба перепідключення...")
+                self.source.release()
+                if self._stop.wait(self.reconnect_delay):
+                    break
+                self.source.open()
+                continue
+            self._publish(frame, capture_time)
+            if pace is not None:
+                next_time += pace
+                delay = next_time - time.perf_counter()
+                if delay > 0:
+                    self._stop.wait(delay)
+                else:
+                    next_time = time.perf_counter()
+        self._end()
+
+    def read(self, timeout=1.0):
+        # Найсвіжіший ще не виданий кадр (frame, capture_time); None - джерело вичерпане
+        # або кадр не надійшов за timeout.
+        with self._cond:
+            if not self._cond.wait_for(lambda: not self._taken or self._ended, timeout):
+                return None
+            if self._taken:
+                return None
+            self._taken = True
+            return self._latest
+
+    @property
+    def ended(self):
+        return self._ended
@@ -0,0 +1,123 @@
+import numpy as np
+
+from features import (GESTURE_KEY_OK, GESTURE_KEY_PINCH, GESTURE_KEY_THUMBS_DOWN, FINGER_THUMB, FINGER_INDEX,
+                      FINGER_MIDDLE, FINGER_RING, FINGER_PINKY)
+from landmarks import HAND_LEFT
+
+# --------------------------------------------------------------------------------
+# --- НАВЧЕНИЙ КЛАСИФІКАТОР СТАТИЧНИХ ЖЕСТІВ (NEAREST CENTROID) ---
+# --------------------------------------------------------------------------------
+# Альтернатива пороговим правилам features.py, які ламаються при повороті руки та
+# іншій відстані до камери. Лендмарки нормалізуються: початок координат - зап'ястя,
+# вісь "зап'ястя -> основа середнього пальця" повернута вгору і має довжину 1, ліва
+# рука віддзеркалюється в праву. До 42 координат додається напрямок цієї осі (щоб
+# відрізнити великий палець вгору від пальця вниз). Модель - центроїди класів,
+# записані calibrate.py для конкретного користувача. Найближчий центроїд - це
+# лінійна модель: |x - c|^2 = |x|^2 - 2 (x.c - |c|^2 / 2), тож усі класи для всіх
+# рук оцінюються одним множенням матриць. Клас перетворюється на той самий ключ
+# жесту, що й у правилах, тож таблиця правил і логіка жестів не змінюються. Якщо
+# поза далі від найближчого центроїда, ніж reject_distance, лишається ключ правил.
+
+DEFAULT_MODEL_PATH = 'gesture_model.npz'
+
+ORIENTATION_WEIGHT = 1.0
+# Поріг відхилення: у REJECT_MARGIN разів більше за REJECT_PERCENTILE-й перцентиль
+# відстаней калібрувальних зразків до центроїдів своїх класів.
+REJECT_PERCENTILE = 95
+REJECT_MARGIN = 2.0
+
+_FINGERS = FINGER_INDEX | FINGER_MIDDLE | FINGER_RING | FINGER_PINKY
+
+# Клас -> ключ жесту, який дали б правила для канонічної пози.
+CLASS_KEYS = {
+    'fist': 0,
+    'palm': FINGER_THUMB | _FINGERS,
+    'point': FINGER_INDEX,
+    'v_sign': FINGER_INDEX | FINGER_MIDDLE,
+    'three': FINGER_INDEX | FINGER_MIDDLE | FINGER_RING,
+    'pinky': FINGER_PINKY,
+    'thumbs_up': FINGER_THUMB,
+    'rock': FINGER_THUMB | FINGER_INDEX | FINGER_PINKY,
+    'thumbs_down': GESTURE_KEY_THUMBS_DOWN,
+    'ok': FINGER_MIDDLE | FINGER_RING | FINGER_PINKY | GESTURE_KEY_OK | GESTURE_KEY_PINCH,
+    'pinch': FINGER_THUMB | FINGER_INDEX | GESTURE_KEY_PINCH,
+}
+CLASSES = tuple(CLASS_KEYS)
+
+
+def normalize_landmarks(landmarks, handedness, scale):
+    # (hands, 21, 3) -> (hands, 44). scale = (1, висота / ширина кадру): координати в пікселях
+    # ширини, щоб поворот руки не спотворював форму.
+    points = landmarks[:, :, :2] * scale
+    points = points - points[:, :1]
+    points[..., 0] *= np.where(handedness == HAND_LEFT, -1.0, 1.0)[:, None]
+    axis = points[:, 9]
+    size = np.maximum(np.hypot(axis[:, 0], axis[:, 1]), 1e-6)
+    up = axis / size[:, None]
+    along = (points[..., 0] * up[:, None, 0] + points[..., 1] * up[:, None, 1]) / size[:, None]
+    across = (points[..., 1] * up[:, None, 0] - points[..., 0] * up[:, None, 1]) / size[:, None]
+    return np.concatenate([across, along, ORIENTATION_WEIGHT * up], axis=1).astype(np.float32)
+
+
+class GestureClassifier:
+    def __init__(self, classes, centroids, reject_distance, frame_size=(1280, 720)):
+        w, h = frame_size
+        self.classes = tuple(classes)
+        self.centroids = np.asarray(centroids, dtype=np.float32)
+        self.reject_distance = float(reject_distance)
+        self.scale = np.array([1.0, h / w], dtype=np.float32)
+        self.keys = np.array([CLASS_KEYS[name] for name in self.classes], dtype=np.uint8)
+        self.weights = np.ascontiguousarray(self.centroids.T)
+        self.bias = -0.5 * (self.centroids ** 2).sum(axis=1)
+        self._orientation = self.centroids[:, -2:]
+
+    def scores(self, features):
+        # (hands, класи); більше - ближче.
+        return features @ self.weights + self.bias
+
+    def _nearest(self, landmarks, handedness):
+        features = normalize_landmarks(landmarks, handedness, self.scale)
+        scores = self.scores(features)
+        best = scores.argmax(axis=1)
+        distance_sq = (features * features).sum(axis=1) - 2.0 * scores[np.arange(len(best)), best]
+        # Напрямок руки вибирає між класами, але не впливає на відхилення: повернута
+        # рука має розпізнаватися як той самий жест.
+        distance_sq -= ((features[:, -2:] - self._orientation[best]) ** 2).sum(axis=1)
+        return best, distance_sq
+
+    def classify(self, landmarks, handedness):
+        # (індекси класів, відстані пози до їхніх центроїдів) для всіх рук.
+        best, distance_sq = self._nearest(landmarks, handedness)
+        return best, np.sqrt(np.maximum(distance_sq, 0.0))
+
+    def predict_keys(self, landmarks, handedness, fallback_keys):
+        # Ключі жестів для всіх рук; далекі від усіх центроїдів пози отримують fallback_keys.
+        best, distance_sq = self._nearest(landmarks, handedness)
+        return np.where(distance_sq <= self.reject_distance ** 2, self.keys[best], fallback_keys).astype(np.uint8)
+
+    @classmethod
+    def fit(cls, samples, frame_size=(1280, 720)):
+        # samples: {клас: (лендмарки (n, 21, 3), руки (n,))}.
+        w, h = frame_size
+        scale = np.array([1.0, h / w], dtype=np.float32)
+        classes, centroids, distances = [], [], []
+        for name, (landmarks, handedness) in samples.items():
+            if name not in CLASS_KEYS:
+                raise ValueError(f"Unknown gesture class '{name}'")
+            x = normalize_landmarks(np.asarray(landmarks, dtype=np.float32), np.asarray(handedness), scale)
+            centroid = x.mean(axis=0)
+            classes.append(name)
+            centroids.append(centroid)
+            distances.append(np.linalg.norm(x[:, :-2] - centroid[:-2], axis=1))
+        reject_distance = REJECT_MARGIN * float(np.percentile(np.concatenate(distances), REJECT_PERCENTILE))
+        return cls(classes, np.stack(centroids), reject_distance, frame_size)
+
+    def save(self, path):
+        np.savez(path, classes=np.array(self.classes), centroids=self.centroids,
+                 reject_distance=np.array(self.reject_distance))
+
+    @classmethod
+    def load(cls, path=DEFAULT_MODEL_PATH, frame_size=(1280, 720)):
+        with np.load(path) as data:
+            return cls([str(c) for c in data['classes']], data['centroids'], float(data['reject_distance']),
+                       frame_size)
@@ -0,0 +1,191 @@
+import struct
+import time
+from enum import IntEnum
+from multiprocessing import Queue, Array
+
+# --------------------------------------------------------------------------------
+# --- ПРОТОКОЛ КОМАНД ---
+# --------------------------------------------------------------------------------
+# Команда - запис фіксованого розміру: код операції, два аргументи, час захоплення
+# кадру, з якого вона виникла, та час постановки в канал (struct '<Bffdd').
+
+
+class Op(IntEnum):
+    MOVE = 1
+    CLICK = 2
+    RIGHT_CLICK = 3
+    SCROLL = 4
+    VOLUME = 5
+    BRIGHTNESS = 6
+    SWIPE_NEXT_WINDOW = 7
+    SWIPE_PREV_WINDOW = 8
+    SWIPE_DESKTOP = 9
+    SWIPE_TASK_VIEW = 10
+    PPT_START_SHOW = 11
+    PPT_NEXT_SLIDE = 12
+    PPT_PREV_SLIDE = 13
+    ZOOM_RAISE_HAND = 14
+    ZOOM_MUTE = 15
+    ZOOM_VIDEO = 16
+    BROWSER_NEXT_TAB = 17
+    BROWSER_PREV_TAB = 18
+    MEDIA_PLAY_PAUSE = 19
+    MEDIA_NEXT_TRACK = 20
+    MEDIA_PREV_TRACK = 21
+
+
+COMMAND_STRUCT = struct.Struct('<Bffdd')
+
+# Імена команд у gesture_rules.json -> (код операції, аргумент).
+COMMAND_NAMES = {
+    'click': (Op.CLICK, 0.0),
+    'right_click': (Op.RIGHT_CLICK, 0.0),
+    'scroll_up': (Op.SCROLL, 1.0),
+    'scroll_down': (Op.SCROLL, -1.0),
+    'vol_up': (Op.VOLUME, 1.0),
+    'vol_down': (Op.VOLUME, -1.0),
+    'brightness_up': (Op.BRIGHTNESS, 1.0),
+    'brightness_down': (Op.BRIGHTNESS, -1.0),
+    'swipe:next_window': (Op.SWIPE_NEXT_WINDOW, 0.0),
+    'swipe:prev_window': (Op.SWIPE_PREV_WINDOW, 0.0),
+    'swipe:desktop': (Op.SWIPE_DESKTOP, 0.0),
+    'swipe:task_view': (Op.SWIPE_TASK_VIEW, 0.0),
+    'ppt:start_show': (Op.PPT_START_SHOW, 0.0),
+    'ppt:next_slide': (Op.PPT_NEXT_SLIDE, 0.0),
+    'ppt:prev_slide': (Op.PPT_PREV_SLIDE, 0.0),
+    'zoom:raise_hand': (Op.ZOOM_RAISE_HAND, 0.0),
+    'zoom:mute': (Op.ZOOM_MUTE, 0.0),
+    'zoom:video': (Op.ZOOM_VIDEO, 0.0),
+    'browser:next_tab': (Op.BROWSER_NEXT_TAB, 0.0),
+    'browser:prev_tab': (Op.BROWSER_PREV_TAB, 0.0),
+    'media:play_pause': (Op.MEDIA_PLAY_PAUSE, 0.0),
+    'media:next_track': (Op.MEDIA_NEXT_TRACK, 0.0),
+    'media:prev_track': (Op.MEDIA_PREV_TRACK, 0.0),
+}
+
+
+def resolve_command(name):
+    if name not in COMMAND_NAMES:
+        raise ValueError(f"Unknown command '{name}'")
+    return COMMAND_NAMES[name]
+
+
+# Смуги виконавця дій (lanes.py): курсор, ввід (кліки, гарячі клавіші) і система
+# (гучність, яскравість, медіа). Невідомі коди операцій ідуть у смугу вводу.
+LANE_CURSOR = 'cursor'
+LANE_INPUT = 'input'
+LANE_SYSTEM = 'system'
+LANES = (LANE_CURSOR, LANE_INPUT, LANE_SYSTEM)
+OP_LANES = {op: LANE_INPUT for op in Op}
+OP_LANES.update({
+    Op.MOVE: LANE_CURSOR,
+    Op.SCROLL: LANE_CURSOR,
+    Op.VOLUME: LANE_SYSTEM,
+    Op.BRIGHTNESS: LANE_SYSTEM,
+    Op.MEDIA_PLAY_PAUSE: LANE_SYSTEM,
+    Op.MEDIA_NEXT_TRACK: LANE_SYSTEM,
+    Op.MEDIA_PREV_TRACK: LANE_SYSTEM,
+})
+
+
+def pack_command(op, a=0.0, b=0.0, capture_time=0.0, enqueue_time=0.0):
+    return COMMAND_STRUCT.pack(op, a, b, capture_time, enqueue_time)
+
+
+def unpack_command(data):
+    return COMMAND_STRUCT.unpack(data)
+
+
+# --------------------------------------------------------------------------------
+# --- КАНАЛ КОМАНД МІЖ ЛОГІКОЮ ЖЕСТІВ ТА ВИКОНАННЯМ ДІЙ ---
+# --------------------------------------------------------------------------------
+# Дискретні команди (кліки, гарячі клавіші, дії режимів) йдуть у необмежену чергу
+# і ніколи не губляться. Неперервні (рух, скролінг, гучність, яскравість)
+# додаються до одного накопиченого значення на вид; у черзі в кожен момент лежить
+# не більше одного маркера на вид, і виконавець забирає суму на момент читання.
+# Для злитих команд зберігаються мітки часу найстарішої з них.
+
+CONTINUOUS_OPS = (Op.MOVE, Op.SCROLL, Op.VOLUME, Op.BRIGHTNESS)
+_CONTINUOUS_INDEX = {op: i for i, op in enumerate(CONTINUOUS_OPS)}
+_PENDING_FIELDS = 4
+_OP_LABELS = {op: op.name.lower() for op in Op}
+
+
+class CommandChannel:
+    def __init__(self, counters=None, queue=None):
+        # queue - необмежена черга виконавця етапів (pipeline.py); типово multiprocessing.Queue.
+        self.counters = counters
+        self._queue = queue if queue is not None else Queue()
+        self._pending = Array('d', _PENDING_FIELDS * len(CONTINUOUS_OPS))
+        self._armed = Array('b', len(CONTINUOUS_OPS), lock=False)
+
+    def send(self, op, a=0.0, b=0.0, capture_time=0.0):
+        enqueue_time = time.time()
+        if self.counters is not None:
+            self.counters.inc('commands_sent', _OP_LABELS[op])
+        i = _CONTINUOUS_INDEX.get(op)
+        if i is None:
+            self._queue.put(pack_command(op, a, b, capture_time, enqueue_time))
+            return
+        base = _PENDING_FIELDS * i
+        with self._pending.get_lock():
+            self._pending[base] += a
+            self._pending[base + 1] += b
+            if not self._armed[i]:
+                self._armed[i] = 1
+                self._pending[base + 2] = capture_time
+                self._pending[base + 3] = enqueue_time
+                self._queue.put(i)
+            elif self.counters is not None:
+                self.counters.inc('commands_coalesced', _OP_LABELS[op])
+
+    def _take(self, i):
+        base = _PENDING_FIELDS * i
+        with self._pending.get_lock():
+            values = self._pending[base:base + _PENDING_FIELDS]
+            self._pending[base] = 0.0
+            self._pending[base + 1] = 0.0
+            self._armed[i] = 0
+        return values
+
+    def _decode(self, item):
+        # Команда, None при закритті або False для маркера, суму якого вже забрали.
+        if item is None:
+            return None
+        if isinstance(item, bytes):
+            return unpack_command(item)
+        a, b, capture_time, enqueue_time = self._take(item)
+        if a or b:
+            return CONTINUOUS_OPS[item], a, b, capture_time, enqueue_time
+        return False
+
+    def get(self):
+        while True:
+            command = self._decode(self._queue.get())
+            if command is not False:
+                return command
+
+    async def aget(self):
+        while True:
+            command = self._decode(await self._queue.aget())
+            if command is not False:
+                return command
+
+    def qsize(self):
+        return self._queue.qsize()
+
+    def close(self):
+        self._queue.put(None)
+
+
+class RecordingSink:
+    # Замість виконавця: зберігає кожну команду разом з номером кадру.
+    def __init__(self):
+        self.frame = 0
+        self.trace = []
+
+    def send(self, op, a=0.0, b=0.0, capture_time=0.0):
+        self.trace.append((self.frame, Op(op), a, b))
+
+    def format_trace(self):
+        return [f"{frame}\t{op.name}\t{a:.3f}\t{b:.3f}" for frame, op, a, b in self.trace]
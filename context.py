@@ -0,0 +1,190 @@
+import re
+import sys
+import threading
+import time
+from functools import lru_cache
+
+# --------------------------------------------------------------------------------
+# --- ВИЗНАЧЕННЯ АКТИВНОЇ ПРОГРАМИ (app_context) ---
+# --------------------------------------------------------------------------------
+# Окремий потік стежить за активним вікном і змінює app_context лише тоді, коли
+# змінюється вікно або його заголовок. Заголовок класифікується одним
+# скомпільованим регулярним виразом з LRU-кешем "заголовок -> профіль".
+
+DEFAULT_CONTEXT = 'general'
+
+
+class TitleClassifier:
+    def __init__(self, profiles, default=DEFAULT_CONTEXT, cache_size=256):
+        # profiles: {контекст: [підрядки]}, порядок ключів задає пріоритет.
+        self.default = default
+        self._priority = {}
+        alternatives = []
+        for priority, (context, patterns) in enumerate(profiles.items()):
+            self._priority[context] = priority
+            if patterns:
+                alternatives.append(f"(?P<{context}>" + "|".join(re.escape(p.lower()) for p in patterns) + ")")
+        self._pattern = re.compile("|".join(alternatives)) if alternatives else None
+        self.classify = lru_cache(maxsize=cache_size)(self._classify)
+
+    def _classify(self, title):
+        if not title or self._pattern is None:
+            return self.default
+        best = None
+        for match in self._pattern.finditer(title.lower()):
+            context = match.lastgroup
+            if best is None or self._priority[context] < self._priority[best]:
+                best = context
+                if self._priority[best] == 0: break
+        return best or self.default
+
+
+class PollingWindowBackend:
+    def __init__(self, interval=0.25):
+        import pygetwindow
+        self._gw = pygetwindow
+        self.interval = interval
+
+    def _title(self):
+        active_window = self._gw.getActiveWindow()
+        return active_window.title if active_window is not None else ""
+
+    def watch(self, on_title, stop):
+        last_title = None
+        while not stop.is_set():
+            try:
+                title = self._title()
+            except Exception:
+                title = ""
+            if title != last_title:
+                last_title = title
+                on_title(title)
+            stop.wait(self.interval)
+
+
+class WinEventBackend:
+    EVENT_SYSTEM_FOREGROUND = 0x0003
+    EVENT_OBJECT_NAMECHANGE = 0x800C
+    WINEVENT_OUTOFCONTEXT = 0x0000
+    OBJID_WINDOW = 0
+    PM_REMOVE = 0x0001
+    QS_ALLINPUT = 0x04FF
+
+    def watch(self, on_title, stop):
+        import ctypes
+        import ctypes.wintypes as wt
+        user32 = ctypes.windll.user32
+        win_event_proc = ctypes.WINFUNCTYPE(None, wt.HANDLE, wt.DWORD, wt.HWND, wt.LONG, wt.LONG, wt.DWORD, wt.DWORD)
+        # Без restype/argtypes ctypes вважає результат і аргументи int, і в 64-бітному
+        # Python дескриптори вікон і хуків обрізаються до 32 біт.
+        user32.GetForegroundWindow.restype = wt.HWND
+        user32.GetForegroundWindow.argtypes = []
+        user32.GetWindowTextLengthW.argtypes = [wt.HWND]
+        user32.GetWindowTextW.argtypes = [wt.HWND, wt.LPWSTR, ctypes.c_int]
+        user32.SetWinEventHook.restype = wt.HANDLE
+        user32.SetWinEventHook.argtypes = [wt.DWORD, wt.DWORD, wt.HMODULE, win_event_proc, wt.DWORD, wt.DWORD,
+                                           wt.DWORD]
+        user32.UnhookWinEvent.argtypes = [wt.HANDLE]
+
+        def window_title(hwnd):
+            length = user32.GetWindowTextLengthW(hwnd)
+            buffer = ctypes.create_unicode_buffer(length + 1)
+            user32.GetWindowTextW(hwnd, buffer, length + 1)
+            return buffer.value
+
+        def callback(hook, event, hwnd, id_object, id_child, event_thread, event_time):
+            if event == self.EVENT_OBJECT_NAMECHANGE:
+                if id_object != self.OBJID_WINDOW or hwnd != user32.GetForegroundWindow():
+                    return
+            on_title(window_title(hwnd))
+
+        proc = win_event_proc(callback)
+        hooks = [user32.SetWinEventHook(event, event, None, proc, 0, 0, self.WINEVENT_OUTOFCONTEXT)
+                 for event in (self.EVENT_SYSTEM_FOREGROUND, self.EVENT_OBJECT_NAMECHANGE)]
+        msg = wt.MSG()
+        try:
+            on_title(window_title(user32.GetForegroundWindow()))
+            while not stop.is_set():
+                while user32.PeekMessageW(ctypes.byref(msg), 0, 0, 0, self.PM_REMOVE):
+                    user32.TranslateMessage(ctypes.byref(msg))
+                    user32.DispatchMessageW(ctypes.byref(msg))
+                user32.MsgWaitForMultipleObjects(0, None, False, 200, self.QS_ALLINPUT)
+        finally:
+            for hook in hooks:
+                user32.UnhookWinEvent(hook)
+
+
+class ScriptedWindowBackend:
+    def __init__(self, events):
+        # events: [(секунд від старту, заголовок), ...]
+        self.events = list(events)
+
+    def watch(self, on_title, stop):
+        start = time.monotonic()
+        for at, title in self.events:
+            if stop.wait(max(0.0, start + at - time.monotonic())):
+                return
+            on_title(title)
+        stop.wait()
+
+
+class StaticWindowBackend:
+    # Коли активне вікно визначити не можна (Linux, немає pygetwindow): один
+    # заголовок на весь час роботи, типово порожній, тобто контекст 'general'.
+    def __init__(self, title=""):
+        self.title = title
+
+    def watch(self, on_title, stop):
+        on_title(self.title)
+        stop.wait()
+
+
+WINDOW_BACKENDS = ('auto', 'winevent', 'polling', 'static')
+
+
+def default_window_backend(name='auto'):
+    # auto - WinEvent у Windows, опитування pygetwindow деінде. Якщо бекенд недоступний
+    # (pygetwindow не встановлено або не підтримує платформу), контекст завжди 'general'.
+    if name == 'static':
+        return StaticWindowBackend()
+    if name == 'winevent' or (name == 'auto' and sys.platform == 'win32'):
+        return WinEventBackend()
+    try:
+        return PollingWindowBackend()
+    except (ImportError, NotImplementedError) as e:
+        print(f"Context watcher: активне вікно недоступне ({e}), контекст завжди '{DEFAULT_CONTEXT}'")
+        return StaticWindowBackend()
+
+
+class ContextWatcher:
+    def __init__(self, classifier, backend=None, on_change=None):
+        self.classifier = classifier
+        self.backend = backend if backend is not None else default_window_backend()
+        self.on_change = on_change
+        self.context = classifier.default
+        self.title = ""
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="context-watcher", daemon=True)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join(timeout=1.0)
+
+    def _run(self):
+        try:
+            self.backend.watch(self._on_title, self._stop)
+        except Exception as e:
+            print(f"Context watcher error: {e}")
+
+    def _on_title(self, title):
+        self.title = title
+        context = self.classifier.classify(title)
+        if context != self.context:
+            self.context = context
+            print(f"DEBUG: Title='{title.lower()}' | Profile='{context}'")
+            if self.on_change is not None:
+                self.on_change(context)
@@ -0,0 +1,116 @@
+import math
+import threading
+import time
+
+# --------------------------------------------------------------------------------
+# --- ПЛАВНИЙ РУХ КУРСОРА З ВИСОКОЮ ЧАСТОТОЮ ---
+# --------------------------------------------------------------------------------
+# Команди руху надходять з частотою кадрів (~30 Гц і менше), тому курсор рухався
+# рівними стрибками раз на кадр. Тепер кожна команда лише задає цільову швидкість:
+# зміщення ділиться на середній інтервал між командами. Окремий потік з частотою
+# rate Гц (120-240) плавно наближає поточну швидкість до цільової і зсуває курсор
+# на малі цілі кроки, зберігаючи дробову частину. Якщо команд немає довше за
+# hold_time, цільова швидкість експоненційно згасає до нуля, після чого потік
+# засинає до наступної команди.
+
+CURSOR_RATE = 180
+VELOCITY_SMOOTHING = 0.03
+DECAY_TIME = 0.05
+MIN_INTERVAL = 1 / 60
+MAX_INTERVAL = 0.1
+
+
+class CursorInterpolator:
+    def __init__(self, backend, rate=CURSOR_RATE, smoothing=VELOCITY_SMOOTHING, decay_time=DECAY_TIME):
+        self.backend = backend
+        self.rate = rate
+        self.smoothing = smoothing
+        self.decay_time = decay_time
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._target = (0.0, 0.0)
+        self._last_update = None
+        self._interval = 1 / 30
+        self.ticks = 0
+        self.moves = 0
+        self._thread = threading.Thread(target=self._run, name="cursor-interpolator", daemon=True)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        self._wake.set()
+        self._thread.join()
+
+    def update(self, dx, dy):
+        # dx, dy - зміщення в пікселях, яке старий код виконав би одним стрибком.
+        now = time.perf_counter()
+        with self._lock:
+            if self._last_update is not None:
+                interval = min(max(now - self._last_update, MIN_INTERVAL), MAX_INTERVAL)
+                self._interval += 0.3 * (interval - self._interval)
+            self._last_update = now
+            self._target = (dx / self._interval, dy / self._interval)
+        self._wake.set()
+
+    def _run(self):
+        period = 1.0 / self.rate
+        vx = vy = 0.0
+        rest_x = rest_y = 0.0
+        previous = time.perf_counter()
+        while not self._stop.is_set():
+            now = time.perf_counter()
+            dt = now - previous
+            previous = now
+            with self._lock:
+                tx, ty = self._target
+                idle = now - self._last_update if self._last_update is not None else math.inf
+                hold_time = 1.5 * self._interval
+            if idle > hold_time:
+                decay = math.exp(-(idle - hold_time) / self.decay_time)
+                tx, ty = tx * decay, ty * decay
+
+            k = 1.0 - math.exp(-dt / self.smoothing)
+            vx += (tx - vx) * k
+            vy += (ty - vy) * k
+            rest_x += vx * dt
+            rest_y += vy * dt
+            step_x, step_y = int(rest_x), int(rest_y)
+            if step_x or step_y:
+                rest_x -= step_x
+                rest_y -= step_y
+                self.backend.move(step_x, step_y)
+                self.moves += 1
+            self.ticks += 1
+
+            if abs(vx) < 1.0 and abs(vy) < 1.0 and idle > hold_time + 5 * self.decay_time:
+                vx = vy = rest_x = rest_y = 0.0
+                self._wake.clear()
+                with self._lock:
+                    last_update = self._last_update
+                if last_update is None or time.perf_counter() - last_update > hold_time:
+                    self._wake.wait()
+                previous = time.perf_counter()
+                continue
+            time.sleep(max(0.0, period - (time.perf_counter() - now)))
+
+
+class SmoothCursorBackend:
+    # Обгортка над бекендом виводу: move() лише оновлює цільову швидкість потоку,
+    # решта дій передається без змін.
+    def __init__(self, backend, rate=CURSOR_RATE):
+        self.inner = backend
+        self.cursor = CursorInterpolator(backend, rate).start()
+
+    def move(self, dx, dy):
+        self.cursor.update(dx, dy)
+
+    def __getattr__(self, name):
+        return getattr(self.inner, name)
+
+    def close(self):
+        self.cursor.stop()
+        self.inner.close()
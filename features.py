@@ -0,0 +1,143 @@
+from collections import namedtuple
+
+import numpy as np
+
+from landmarks import HAND_RIGHT, HAND_LEFT
+
+# --------------------------------------------------------------------------------
+# --- ВЕКТОРИЗОВАНІ ОЗНАКИ РУК ---
+# --------------------------------------------------------------------------------
+# Один прохід NumPy по масиву (hands, 21, 3) дає маску піднятих пальців, відстань
+# щипка, центр кісточок і напрямок великого пальця для всіх рук одразу.
+# Статичні жести визначаються таблицею "маска -> прапорці жестів".
+
+PINCH_THRESHOLD = 0.05
+OK_PINCH_THRESHOLD = PINCH_THRESHOLD * 1.5
+
+FINGER_THUMB = 1 << 0
+FINGER_INDEX = 1 << 1
+FINGER_MIDDLE = 1 << 2
+FINGER_RING = 1 << 3
+FINGER_PINKY = 1 << 4
+
+TIP_IDS = [8, 12, 16, 20]
+PIP_IDS = [6, 10, 14, 18]
+KNUCKLE_IDS = [5, 9, 13, 17]
+_FINGER_BITS = np.array([FINGER_INDEX, FINGER_MIDDLE, FINGER_RING, FINGER_PINKY], dtype=np.uint8)
+
+GESTURE_FIST = 1 << 0
+GESTURE_PALM = 1 << 1
+GESTURE_POINT = 1 << 2
+GESTURE_V_SIGN = 1 << 3
+GESTURE_THREE = 1 << 4
+GESTURE_PINKY = 1 << 5
+GESTURE_THUMBS_UP = 1 << 6
+GESTURE_ROCK = 1 << 7
+GESTURE_THUMBS_DOWN = 1 << 8
+GESTURE_OK = 1 << 9
+GESTURE_PINCH = 1 << 10
+
+GESTURE_NAMES = {
+    'fist': GESTURE_FIST,
+    'palm': GESTURE_PALM,
+    'point': GESTURE_POINT,
+    'v_sign': GESTURE_V_SIGN,
+    'three': GESTURE_THREE,
+    'pinky': GESTURE_PINKY,
+    'thumbs_up': GESTURE_THUMBS_UP,
+    'rock': GESTURE_ROCK,
+    'thumbs_down': GESTURE_THUMBS_DOWN,
+    'ok': GESTURE_OK,
+    'pinch': GESTURE_PINCH,
+}
+
+# Ключ жесту: 5 біт маски пальців + біти щипка, "палець вниз" та OK.
+# Усі прапорці жестів однозначно відновлюються з ключа, тож таблиці правил
+# можна скомпілювати заздалегідь для всіх 256 значень.
+GESTURE_KEY_PINCH = 1 << 5
+GESTURE_KEY_THUMBS_DOWN = 1 << 6
+GESTURE_KEY_OK = 1 << 7
+GESTURE_KEY_COUNT = 1 << 8
+
+HandFeatures = namedtuple('HandFeatures', ['finger_mask', 'pinch', 'knuckle', 'thumb_down'])
+
+
+def _static_gesture_flags(mask):
+    thumb, index, middle, ring, pinky = [(mask >> bit) & 1 for bit in range(5)]
+    fingers_up = [thumb, index, middle, ring, pinky]
+    flags = 0
+    if sum(fingers_up) == 0:
+        flags |= GESTURE_FIST
+    if sum(fingers_up) >= 4:
+        flags |= GESTURE_PALM
+    if fingers_up == [0, 1, 0, 0, 0]:
+        flags |= GESTURE_POINT
+    if index and middle and not ring and not pinky:
+        flags |= GESTURE_V_SIGN
+    if fingers_up == [0, 1, 1, 1, 0]:
+        flags |= GESTURE_THREE
+    if fingers_up == [0, 0, 0, 0, 1]:
+        flags |= GESTURE_PINKY
+    if thumb and not index and not middle:
+        flags |= GESTURE_THUMBS_UP
+    if fingers_up == [1, 1, 0, 0, 1]:
+        flags |= GESTURE_ROCK
+    return flags
+
+
+STATIC_GESTURE_LUT = np.array([_static_gesture_flags(mask) for mask in range(32)], dtype=np.uint16)
+
+
+def extract_features(landmarks, handedness):
+    landmarks = np.asarray(landmarks, dtype=np.float32)
+    handedness = np.asarray(handedness)
+
+    thumb_tip_x = landmarks[:, 4, 0]
+    thumb_mcp_x = landmarks[:, 2, 0]
+    thumb_up = ((handedness == HAND_RIGHT) & (thumb_tip_x > thumb_mcp_x)) | \
+               ((handedness == HAND_LEFT) & (thumb_tip_x < thumb_mcp_x))
+    fingers = landmarks[:, TIP_IDS, 1] < landmarks[:, PIP_IDS, 1]
+    finger_mask = thumb_up.astype(np.uint8) | (fingers * _FINGER_BITS).sum(axis=1, dtype=np.uint8)
+
+    pinch_delta = landmarks[:, 4, :2] - landmarks[:, 8, :2]
+    pinch = np.hypot(pinch_delta[:, 0], pinch_delta[:, 1])
+    knuckle = landmarks[:, KNUCKLE_IDS, :2].mean(axis=1)
+    thumb_down = landmarks[:, 4, 1] > landmarks[:, 3, 1]
+
+    return HandFeatures(finger_mask, pinch, knuckle, thumb_down)
+
+
+def gesture_flags(features):
+    mask = features.finger_mask
+    flags = STATIC_GESTURE_LUT[mask]
+
+    others_down = (mask & (FINGER_INDEX | FINGER_MIDDLE | FINGER_RING | FINGER_PINKY)) == 0
+    others_up = (mask & (FINGER_MIDDLE | FINGER_RING | FINGER_PINKY)) == (FINGER_MIDDLE | FINGER_RING | FINGER_PINKY)
+    flags = flags | np.where(others_down & features.thumb_down, GESTURE_THUMBS_DOWN, 0)
+    flags = flags | np.where(others_up & (features.pinch < OK_PINCH_THRESHOLD), GESTURE_OK, 0)
+    flags = flags | np.where(features.pinch < PINCH_THRESHOLD, GESTURE_PINCH, 0)
+    return flags.astype(np.uint16)
+
+
+def gesture_keys(features, flags):
+    keys = features.finger_mask.astype(np.uint8)
+    keys = keys | np.where(flags & GESTURE_PINCH, GESTURE_KEY_PINCH, 0)
+    keys = keys | np.where(flags & GESTURE_THUMBS_DOWN, GESTURE_KEY_THUMBS_DOWN, 0)
+    keys = keys | np.where(flags & GESTURE_OK, GESTURE_KEY_OK, 0)
+    return keys.astype(np.uint8)
+
+
+def flags_from_key(key):
+    flags = int(STATIC_GESTURE_LUT[key & 0b11111])
+    if key & GESTURE_KEY_PINCH:
+        flags |= GESTURE_PINCH
+    if key & GESTURE_KEY_THUMBS_DOWN:
+        flags |= GESTURE_THUMBS_DOWN
+    if key & GESTURE_KEY_OK:
+        flags |= GESTURE_OK
+    return flags
+
+
+# Прапорці жестів для кожного ключа: ключі від класифікатора (classifier.py)
+# перетворюються на прапорці одним індексуванням.
+KEY_FLAGS_LUT = np.array([flags_from_key(key) for key in range(GESTURE_KEY_COUNT)], dtype=np.uint16)
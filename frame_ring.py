@@ -0,0 +1,100 @@
+from multiprocessing import shared_memory
+
+import numpy as np
+
+
+# --------------------------------------------------------------------------------
+# --- КІЛЬЦЕВИЙ БУФЕР КАДРІВ У СПІЛЬНІЙ ПАМ'ЯТІ ---
+# --------------------------------------------------------------------------------
+# Кадри пишуться один раз у попередньо виділені слоти, а черги між процесами
+# передають лише (slot, seq, timestamp). Кожен етап читає піксели на місці.
+# Власника у слота немає: якщо споживач відстав на все кільце, захоплення
+# перезаписує слот, поки той його ще читає. Тому після слотів у тому ж сегменті
+# лежить номер кадру кожного слота: перед записом він стає NO_FRAME, після запису -
+# номером нового кадру. Споживач спершу копіює чи зменшує потрібні піксели, а тоді
+# перевіряє valid(slot, seq); якщо номер змінився, копія може бути розірваною і
+# кадр відкидається.
+
+FRAME_RING_SLOTS = 8
+NO_FRAME = -1
+
+
+def _open_shared_memory(name):
+    try:
+        # Python 3.13+: процеси, що лише під'єднуються, не мають видаляти сегмент.
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        return shared_memory.SharedMemory(name=name)
+
+
+class FrameRing:
+    def __init__(self, shape, slots=FRAME_RING_SLOTS, dtype=np.uint8, name=None):
+        self.shape = tuple(shape)
+        self.slots = slots
+        self.dtype = np.dtype(dtype)
+        self.slot_nbytes = int(np.prod(self.shape)) * self.dtype.itemsize
+        # Номери кадрів - після всіх слотів, вирівняні на 8 байтів.
+        seqs_offset = -(-self.slot_nbytes * slots // 8) * 8
+        self._owner = name is None
+        if self._owner:
+            self._shm = shared_memory.SharedMemory(create=True, size=seqs_offset + 8 * slots)
+        else:
+            self._shm = _open_shared_memory(name)
+        self.name = self._shm.name
+        self._frames = np.ndarray((slots,) + self.shape, dtype=self.dtype, buffer=self._shm.buf)
+        self._seqs = np.ndarray(slots, dtype=np.int64, buffer=self._shm.buf, offset=seqs_offset)
+        if self._owner:
+            self._seqs[:] = NO_FRAME
+        self._next_slot = 0
+
+    def __reduce__(self):
+        # При передачі у дочірній процес відкриваємо той самий сегмент за іменем.
+        return FrameRing, (self.shape, self.slots, self.dtype.str, self.name)
+
+    def next_slot(self):
+        return self._next_slot
+
+    def commit(self):
+        # Слот вважається зайнятим лише після того, як його індекс прийняла черга,
+        # інакше наступний кадр перезаписує той самий слот.
+        self._next_slot = (self._next_slot + 1) % self.slots
+
+    def view(self, slot):
+        return self._frames[slot]
+
+    def begin_write(self, slot):
+        # Слот, у який зараз писатиметься: кадр у ньому вже недійсний для споживачів.
+        self._seqs[slot] = NO_FRAME
+        return self._frames[slot]
+
+    def publish(self, slot, seq):
+        self._seqs[slot] = seq
+
+    def valid(self, slot, seq):
+        # Чи досі у слоті кадр seq; викликається після того, як піксели прочитано.
+        return self._seqs[slot] == seq
+
+    def write(self, frame, seq=0):
+        slot = self._next_slot
+        np.copyto(self.begin_write(slot), frame)
+        self.publish(slot, seq)
+        return slot
+
+    def detach(self):
+        # Для етапів-споживачів: закриває лише копію, під'єднану в дочірньому процесі.
+        # У виконавцях thread і asyncio кільце одне на всіх, і закриває його головний процес.
+        if not self._owner:
+            self.close()
+
+    def close(self):
+        self._frames = None
+        self._seqs = None
+        try:
+            self._shm.close()
+        except BufferError:
+            # Ще існують numpy-представлення слотів; сегмент звільниться при виході процесу.
+            pass
+
+    def unlink(self):
+        if self._owner:
+            self._shm.unlink()
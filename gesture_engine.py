@@ -0,0 +1,303 @@
+import math
+
+from commands import Op
+from features import (extract_features, gesture_flags, gesture_keys, KEY_FLAGS_LUT, GESTURE_PALM, GESTURE_POINT,
+                      GESTURE_OK, GESTURE_V_SIGN)
+from motion import MOTION_SWIPE_LEFT, MOTION_SWIPE_RIGHT, MOTION_SWIPE_UP, MOTION_SWIPE_DOWN
+from rules import PHASE_OVERRIDE, PHASE_ACTION
+
+# --------------------------------------------------------------------------------
+# --- ЛОГІКА ЖЕСТІВ: СКІНЧЕННИЙ АВТОМАТ НА ЧАСОВИХ МІТКАХ КАДРІВ ---
+# --------------------------------------------------------------------------------
+# Увесь час береться з capture_time кадру, а не з time.time(), тому рушій ніколи
+# не блокує конвеєр і дає однаковий результат при прогоні записаних даних
+# швидше за реальний час. Замість time.sleep(0.5) після (де)активації автомат
+# переходить у стан блокування, у якому кадри ігноруються до його завершення.
+# Долоня озброює динамічні жести. Типово свайп спрацьовує, коли центр кісточок
+# відійшов від якоря (точки озброєння) на поріг; з детектором руху (motion.py)
+# свайпи, кола й клацання розпізнаються за швидкістю та прискоренням.
+
+DEAD_ZONE_RADIUS = 35
+
+PHASE_INACTIVE = 'inactive'
+PHASE_ACTIVATING = 'activating'
+PHASE_ACTIVE = 'active'
+PHASE_DEACTIVATING = 'deactivating'
+
+SWIPE_IDLE = 'idle'
+SWIPE_ARMED = 'armed'
+SWIPE_GRACE = 'grace'
+
+NEVER = float('-inf')
+
+SWIPE_COMMANDS = {
+    MOTION_SWIPE_RIGHT: (Op.SWIPE_NEXT_WINDOW, "Swipe Right"),
+    MOTION_SWIPE_LEFT: (Op.SWIPE_PREV_WINDOW, "Swipe Left"),
+    MOTION_SWIPE_DOWN: (Op.SWIPE_DESKTOP, "Show Desktop"),
+    MOTION_SWIPE_UP: (Op.SWIPE_TASK_VIEW, "Task View"),
+}
+
+
+class GestureState:
+    def __init__(self):
+        self.phase = PHASE_INACTIVE
+        self.lockout_until = NEVER
+        self.LOCKOUT_DURATION = 0.5
+        self.last_mode_change_time = NEVER
+        self.MODE_COOLDOWN = 1.0
+
+        self.last_click_time = NEVER
+        self.active_special_gesture = None
+
+        self.swipe_phase = SWIPE_IDLE
+        self.swipe_motion_start_x = 0.0
+        self.swipe_motion_start_y = 0.0
+        self.last_swipe_motion_time = NEVER
+        self.swipe_motion_lost_time = NEVER
+
+        self.SWIPE_MOTION_THRESHOLD_X = 0.1
+        self.SWIPE_MOTION_THRESHOLD_Y = 0.1
+        self.SWIPE_MOTION_COOLDOWN = 0.8
+        self.SWIPE_GRACE_PERIOD = 0.25
+
+        self.active_mode = None
+        self.mode_anchor_y = 0.0
+        self.last_action_time = NEVER
+
+        self.app_context = 'general'
+
+    @property
+    def is_active(self):
+        return self.phase in (PHASE_ACTIVE, PHASE_ACTIVATING)
+
+    @property
+    def in_lockout(self):
+        return self.phase in (PHASE_ACTIVATING, PHASE_DEACTIVATING)
+
+    def advance(self, now):
+        if self.in_lockout and now >= self.lockout_until:
+            self.phase = PHASE_ACTIVE if self.phase == PHASE_ACTIVATING else PHASE_INACTIVE
+
+    def can_change_mode(self, now):
+        return (now - self.last_mode_change_time) > self.MODE_COOLDOWN
+
+    def activate(self, now):
+        self.phase = PHASE_ACTIVATING
+        self.lockout_until = now + self.LOCKOUT_DURATION
+        self.last_mode_change_time = now
+
+    def deactivate(self, now):
+        self.phase = PHASE_DEACTIVATING
+        self.lockout_until = now + self.LOCKOUT_DURATION
+        self.last_mode_change_time = now
+
+    def disarm_swipe(self):
+        self.swipe_phase = SWIPE_IDLE
+
+
+class FrameResult:
+    def __init__(self):
+        self.action_text = ""
+        self.status_text = ""
+        self.cursor_target = None
+
+
+class GestureEngine:
+    def __init__(self, rules, frame_size, sink, verbose=True, motion=None, classifier=None):
+        # motion - MotionDetector; без нього свайпи визначаються зсувом від якоря.
+        # classifier - GestureClassifier; без нього статичні жести визначають порогові правила.
+        self.rules = rules
+        self.frame_width, self.frame_height = frame_size
+        self.sink = sink
+        self.verbose = verbose
+        self.motion = motion
+        self.classifier = classifier
+        self.state = GestureState()
+        self._now = 0.0
+
+    def _send(self, op, a=0.0, b=0.0):
+        self.sink.send(op, a, b, self._now)
+
+    def _debug(self, message):
+        if self.verbose:
+            print(message)
+
+    def process(self, hands):
+        state = self.state
+        now = float(hands['capture_time'])
+        self._now = now
+        if self.motion is not None:
+            self.motion.push(hands)
+        state.advance(now)
+        state.active_special_gesture = None
+
+        result = FrameResult()
+        if state.in_lockout:
+            result.status_text = "MODE: ACTIVATING" if state.is_active else "MODE: INACTIVE"
+            return result
+
+        num_hands = hands['num_hands']
+        landmarks, handedness = hands['landmarks'][:num_hands], hands['handedness'][:num_hands]
+        features = extract_features(landmarks, handedness)
+        flags = gesture_flags(features)
+        keys = None
+        if self.classifier is not None:
+            keys = self.classifier.predict_keys(landmarks, handedness, gesture_keys(features, flags))
+            flags = KEY_FLAGS_LUT[keys]
+
+        if num_hands == 2:
+            self._process_two_hands(int(flags[0] & flags[1]), now)
+        elif num_hands == 1 and state.is_active:
+            gesture_key = int((gesture_keys(features, flags) if keys is None else keys)[0])
+            knuckle_x, knuckle_y = features.knuckle[0].tolist()
+            self._process_one_hand(hands['landmarks'][0], int(flags[0]), gesture_key, knuckle_x, knuckle_y, now,
+                                   result)
+        else:
+            if not state.is_active:
+                result.status_text = "MODE: INACTIVE"
+            else:
+                result.status_text = f"MODE: {state.app_context.upper()}"
+
+            if state.swipe_phase != SWIPE_IDLE:
+                self._debug("DEBUG: Swipe Disarmed (Hand lost).")
+            state.disarm_swipe()
+        return result
+
+    def _process_two_hands(self, both_flags, now):
+        state = self.state
+        can_change_mode = state.can_change_mode(now)
+        if both_flags & GESTURE_PALM and can_change_mode:
+            state.activate(now)
+        elif both_flags & GESTURE_OK and state.is_active and can_change_mode:
+            state.deactivate(now)
+        elif both_flags & GESTURE_V_SIGN:
+            state.active_special_gesture = 'scissors'
+
+    def _process_one_hand(self, hand_landmarks, gesture, gesture_key, knuckle_x, knuckle_y, now, result):
+        state = self.state
+        rules = self.rules
+        send = self._send
+        profile_action_taken = False
+
+        override_rule = rules.lookup(PHASE_OVERRIDE, state.app_context, gesture_key)
+        if override_rule is not None:
+            if override_rule.command:
+                send(*override_rule.command)
+            result.action_text = override_rule.text
+            profile_action_taken = True
+        else:
+            profile_action_taken = self._process_swipe(gesture, knuckle_x, knuckle_y, now, result)
+
+        if profile_action_taken:
+            return
+        result.status_text = f"MODE: {state.app_context.upper()}"
+
+        if gesture & GESTURE_POINT:
+            w, h = self.frame_width, self.frame_height
+            center_x, center_y = w / 2, h / 2
+            index_x_abs, index_y_abs = int(hand_landmarks[8][0] * w), int(hand_landmarks[8][1] * h)
+            move_x = index_x_abs - center_x
+            move_y = index_y_abs - center_y
+            if math.hypot(move_x, move_y) > DEAD_ZONE_RADIUS:
+                send(Op.MOVE, move_x, move_y)
+            result.action_text = "Cursor Mode"
+            result.cursor_target = (index_x_abs, index_y_abs)
+            return
+
+        if state.active_mode is not None:
+            mode = rules.modes[state.active_mode]
+            if not gesture & mode.hold_flag:
+                state.active_mode = None
+            else:
+                current_y = float(hand_landmarks[mode.anchor_landmark][1])
+                delta_y = current_y - state.mode_anchor_y
+                can_act = (now - state.last_action_time) > mode.cooldown
+                if delta_y < -mode.step and can_act:
+                    send(*mode.up_command)
+                    state.mode_anchor_y = current_y
+                    state.last_action_time = now
+                    result.action_text = mode.up_text
+                elif delta_y > mode.step and can_act:
+                    send(*mode.down_command)
+                    state.mode_anchor_y = current_y
+                    state.last_action_time = now
+                    result.action_text = mode.down_text
+                else:
+                    result.action_text = mode.idle_text
+                return
+
+        rule = rules.lookup(PHASE_ACTION, state.app_context, gesture_key)
+        if rule is not None and (now - state.last_click_time) > rule.cooldown:
+            if rule.command:
+                send(*rule.command)
+            if rule.mode is not None:
+                mode = rules.modes[rule.mode]
+                state.active_mode = rule.mode
+                state.mode_anchor_y = float(hand_landmarks[mode.anchor_landmark][1])
+                state.last_action_time = now
+            result.action_text = rule.text
+            state.last_click_time = now
+
+    def _process_swipe(self, gesture, knuckle_x, knuckle_y, now, result):
+        state = self.state
+        if gesture & GESTURE_PALM:
+            if state.swipe_phase == SWIPE_IDLE:
+                state.swipe_phase = SWIPE_ARMED
+                state.swipe_motion_start_x = knuckle_x
+                state.swipe_motion_start_y = knuckle_y
+                state.last_swipe_motion_time = now
+                result.action_text = "Swipe Armed (Palm)"
+                self._debug("DEBUG: Swipe Armed. Anchor set.")
+                return True
+
+            state.swipe_phase = SWIPE_ARMED
+            can_swipe_now = (now - state.last_swipe_motion_time) > state.SWIPE_MOTION_COOLDOWN
+            motion = None
+            if can_swipe_now:
+                motion = self._anchor_swipe(knuckle_x, knuckle_y) if self.motion is None else self.motion.detect()
+
+            if motion in SWIPE_COMMANDS:
+                op, result.action_text = SWIPE_COMMANDS[motion]
+                self._send(op)
+            elif motion is not None:
+                rule = self.rules.lookup_motion(state.app_context, motion)
+                if rule is None:
+                    motion = None
+                else:
+                    self._send(*rule.command)
+                    result.action_text = rule.text
+
+            if motion is not None:
+                self._debug(f"DEBUG: {result.action_text} complete.")
+                state.swipe_motion_start_x = knuckle_x
+                state.swipe_motion_start_y = knuckle_y
+                state.last_swipe_motion_time = now
+                state.last_click_time = now
+            else:
+                result.action_text = "Swipe Ready..."
+            return True
+
+        if state.swipe_phase == SWIPE_ARMED:
+            state.swipe_phase = SWIPE_GRACE
+            state.swipe_motion_lost_time = now
+            result.action_text = "Swipe Ready..."
+            return True
+        if state.swipe_phase == SWIPE_GRACE:
+            if (now - state.swipe_motion_lost_time) > state.SWIPE_GRACE_PERIOD:
+                self._debug("DEBUG: Swipe Disarmed (Grace period ended).")
+                state.disarm_swipe()
+                return False
+            result.action_text = "Swipe Ready..."
+            return True
+        return False
+
+    def _anchor_swipe(self, knuckle_x, knuckle_y):
+        state = self.state
+        delta_x = knuckle_x - state.swipe_motion_start_x
+        delta_y = knuckle_y - state.swipe_motion_start_y
+        abs_dx, abs_dy = abs(delta_x), abs(delta_y)
+        if abs_dx <= state.SWIPE_MOTION_THRESHOLD_X and abs_dy <= state.SWIPE_MOTION_THRESHOLD_Y:
+            return None
+        if abs_dx > abs_dy:
+            return MOTION_SWIPE_RIGHT if delta_x > 0 else MOTION_SWIPE_LEFT
+        return MOTION_SWIPE_DOWN if delta_y > 0 else MOTION_SWIPE_UP
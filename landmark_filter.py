@@ -0,0 +1,74 @@
+import math
+
+import numpy as np
+
+from landmarks import MAX_HANDS, NUM_LANDMARKS
+
+# --------------------------------------------------------------------------------
+# --- ФІЛЬТРАЦІЯ ЛЕНДМАРКІВ (ONE EURO) ТА ПРОГНОЗ НА ЗАТРИМКУ КОНВЕЄРА ---
+# --------------------------------------------------------------------------------
+# One Euro фільтр над усіма 21x3 точками руки одразу: при повільному русі сильно
+# згладжує тремтіння, при швидкому - частота зрізу зростає і запізнення майже
+# немає. Стан зберігається окремо для правої та лівої руки; якщо руки не було
+# довше reset_after секунд, фільтр починає заново. Опційно координати
+# екстраполюються за згладженою швидкістю на horizon секунд уперед, щоб
+# компенсувати затримку від захоплення кадру до рішення.
+
+MIN_CUTOFF = 1.5
+BETA = 5.0
+DERIVATIVE_CUTOFF = 1.0
+RESET_AFTER = 0.3
+MAX_HORIZON = 0.1
+
+
+def _alpha(cutoff, dt):
+    tau = 1.0 / (2.0 * math.pi * cutoff)
+    return 1.0 / (1.0 + tau / dt)
+
+
+class LandmarkFilter:
+    def __init__(self, min_cutoff=MIN_CUTOFF, beta=BETA, d_cutoff=DERIVATIVE_CUTOFF, reset_after=RESET_AFTER,
+                 max_horizon=MAX_HORIZON):
+        self.min_cutoff = min_cutoff
+        self.beta = beta
+        self.d_cutoff = d_cutoff
+        self.reset_after = reset_after
+        self.max_horizon = max_horizon
+        self._value = np.zeros((MAX_HANDS, NUM_LANDMARKS, 3), dtype=np.float32)
+        self._velocity = np.zeros((MAX_HANDS, NUM_LANDMARKS, 3), dtype=np.float32)
+        self._last_time = np.full(MAX_HANDS, -np.inf)
+
+    def reset(self):
+        self._last_time[:] = -np.inf
+
+    def apply(self, hands, horizon=0.0):
+        # Повертає копію запису з відфільтрованими (і, якщо horizon > 0, спрогнозованими) лендмарками.
+        out = hands.copy()
+        now = float(hands['capture_time'])
+        horizon = min(max(horizon, 0.0), self.max_horizon)
+        seen = set()
+        for i in range(int(hands['num_hands'])):
+            side = int(hands['handedness'][i])
+            if side < 0 or side in seen:
+                continue
+            seen.add(side)
+            out['landmarks'][i] = self._filter(side, hands['landmarks'][i], now, horizon)
+        return out
+
+    def _filter(self, side, x, now, horizon):
+        dt = now - self._last_time[side]
+        self._last_time[side] = now
+        if not 0.0 < dt <= self.reset_after:
+            self._value[side] = x
+            self._velocity[side] = 0.0
+            return x
+
+        value, velocity = self._value[side], self._velocity[side]
+        a_d = _alpha(self.d_cutoff, dt)
+        velocity += a_d * ((x - value) / dt - velocity)
+        cutoff = self.min_cutoff + self.beta * np.abs(velocity)
+        tau = 1.0 / (2.0 * np.pi * cutoff)
+        value += (x - value) / (1.0 + tau / dt)
+        if horizon:
+            return value + velocity * horizon
+        return value
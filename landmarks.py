@@ -0,0 +1,81 @@
+import numpy as np
+
+# --------------------------------------------------------------------------------
+# --- КОМПАКТНИЙ ФОРМАТ ЛЕНДМАРКІВ МІЖ ДЕТЕКЦІЄЮ ТА ЛОГІКОЮ ЖЕСТІВ ---
+# --------------------------------------------------------------------------------
+# Один запис фіксованого розміру на кадр: float32 (2, 21, 3) + руки, впевненість,
+# номер кадру, час захоплення та мітки початку/кінця детекції. Між процесами передається як сирі байти.
+
+MAX_HANDS = 2
+NUM_LANDMARKS = 21
+
+HAND_NONE = -1
+HAND_RIGHT = 0
+HAND_LEFT = 1
+HAND_LABELS = ('Right', 'Left')
+
+HANDS_RECORD_DTYPE = np.dtype([
+    ('seq', '<u8'),
+    ('capture_time', '<f8'),
+    ('detect_start', '<f8'),
+    ('detect_end', '<f8'),
+    ('num_hands', 'u1'),
+    ('handedness', 'i1', (MAX_HANDS,)),
+    ('scores', '<f4', (MAX_HANDS,)),
+    ('landmarks', '<f4', (MAX_HANDS, NUM_LANDMARKS, 3)),
+])
+
+# Ті самі з'єднання, що й mp.solutions.hands.HAND_CONNECTIONS.
+HAND_CONNECTIONS = (
+    (0, 1), (1, 2), (2, 3), (3, 4),
+    (0, 5), (5, 6), (6, 7), (7, 8),
+    (5, 9), (9, 10), (10, 11), (11, 12),
+    (9, 13), (13, 14), (14, 15), (15, 16),
+    (13, 17), (0, 17), (17, 18), (18, 19), (19, 20),
+)
+
+
+def new_hands_record(seq=0, capture_time=0.0):
+    record = np.zeros((), dtype=HANDS_RECORD_DTYPE)
+    record['seq'] = seq
+    record['capture_time'] = capture_time
+    record['handedness'] = HAND_NONE
+    return record
+
+
+def fill_from_mediapipe(record, result):
+    num_hands = 0
+    if result.multi_hand_landmarks and result.multi_handedness:
+        for hand_landmarks, handedness in zip(result.multi_hand_landmarks, result.multi_handedness):
+            if num_hands == MAX_HANDS: break
+            classification = handedness.classification[0]
+            record['landmarks'][num_hands] = [(lm.x, lm.y, lm.z) for lm in hand_landmarks.landmark]
+            record['handedness'][num_hands] = HAND_RIGHT if classification.label == 'Right' else HAND_LEFT
+            record['scores'][num_hands] = classification.score
+            num_hands += 1
+    record['num_hands'] = num_hands
+    return record
+
+
+def pack_hands(record):
+    return record.tobytes()
+
+
+def unpack_hands(data):
+    return np.frombuffer(data, dtype=HANDS_RECORD_DTYPE, count=1)[0]
+
+
+def hand_label(record, index):
+    return HAND_LABELS[record['handedness'][index]]
+
+
+def draw_hands(frame, record):
+    # OpenCV потрібен лише для малювання, тож логіка жестів його не імпортує.
+    import cv2
+    h, w = frame.shape[:2]
+    for i in range(record['num_hands']):
+        points = [tuple(p) for p in (record['landmarks'][i, :, :2] * (w, h)).astype(np.int32).tolist()]
+        for start, end in HAND_CONNECTIONS:
+            cv2.line(frame, points[start], points[end], (255, 0, 255), 2)
+        for point in points:
+            cv2.circle(frame, point, 2, (255, 255, 0), 2)
@@ -0,0 +1,105 @@
+import threading
+from collections import deque
+
+from actions import execute
+from commands import CONTINUOUS_OPS, LANES, LANE_CURSOR, LANE_INPUT, LANE_SYSTEM, OP_LANES
+
+# --------------------------------------------------------------------------------
+# --- СМУГИ ВИКОНАННЯ ДІЙ ---
+# --------------------------------------------------------------------------------
+# В одному циклі повільна дія (кілька натискань гучності, медіаклавіша,
+# послідовність гарячих клавіш) затримує кожен рух курсора і клік, що стоять за
+# нею. Тому команда йде в смугу за кодом операції (commands.OP_LANES): cursor -
+# рух і скролінг, input - кліки та гарячі клавіші, system - гучність, яскравість,
+# медіа. Кожна смуга - окремий потік з власною чергою. Порядок зберігається в
+# межах смуги, але не між смугами. Як і в CommandChannel, жодна команда не
+# губиться: неперервна (рух, скролінг, гучність, яскравість) додається до вже
+# чекаючої команди того самого виду і виконується на її місці, тож таких у черзі
+# не більше однієї на вид. Дискретних у черзі не більше max_depth; якщо черга
+# повна, submit() чекає, доки смуга виконає наступну (зворотний тиск на етап).
+
+LANE_DEPTHS = {LANE_CURSOR: 4, LANE_INPUT: 16, LANE_SYSTEM: 8}
+
+
+class ActionLane:
+    def __init__(self, name, backend, latency=None, counters=None, max_depth=16):
+        # max_depth - межа лише для дискретних команд.
+        self.name = name
+        self.backend = backend
+        self.latency = latency
+        self.counters = counters
+        self.max_depth = max_depth
+        self._items = deque()
+        # Код неперервної операції -> її запис [op, a, b, capture_time, enqueue_time] у черзі.
+        self._continuous = {}
+        self._discrete = 0
+        self._ready = threading.Condition()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name=f"action-{name}", daemon=True)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def close(self):
+        # Команди, що вже в черзі, виконуються до кінця.
+        with self._ready:
+            self._closed = True
+            self._ready.notify_all()
+        self._thread.join()
+
+    def submit(self, command):
+        op, a, b = command[:3]
+        with self._ready:
+            if op in CONTINUOUS_OPS:
+                pending = self._continuous.get(op)
+                if pending is not None:
+                    pending[1] += a
+                    pending[2] += b
+                    self._count('lane_merged')
+                    return
+                command = self._continuous[op] = list(command)
+            else:
+                if self._discrete >= self.max_depth:
+                    self._count('lane_blocked')
+                    while self._discrete >= self.max_depth and not self._closed:
+                        self._ready.wait()
+                self._discrete += 1
+            self._items.append(command)
+            self._ready.notify_all()
+
+    def _count(self, metric):
+        if self.counters is not None:
+            self.counters.inc(metric, self.name)
+
+    def _run(self):
+        while True:
+            with self._ready:
+                while not self._items and not self._closed:
+                    self._ready.wait()
+                if not self._items:
+                    return
+                command = self._items.popleft()
+                if self._continuous.get(command[0]) is command:
+                    del self._continuous[command[0]]
+                else:
+                    self._discrete -= 1
+                self._ready.notify_all()
+            execute(self.backend, command, self.latency)
+
+
+class LaneExecutor:
+    def __init__(self, backend, latency=None, counters=None, depths=LANE_DEPTHS):
+        self.lanes = {name: ActionLane(name, backend, latency, counters, depths[name]) for name in LANES}
+
+    def start(self):
+        for lane in self.lanes.values():
+            lane.start()
+        return self
+
+    def submit(self, command):
+        self.lanes[OP_LANES.get(command[0], LANE_INPUT)].submit(command)
+
+    def close(self):
+        for lane in self.lanes.values():
+            lane.close()
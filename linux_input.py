@@ -0,0 +1,109 @@
+import threading
+
+from brightness import BrightnessController, SbcBrightnessBackend
+
+# --------------------------------------------------------------------------------
+# --- БЕКЕНД ВИВОДУ ДЛЯ LINUX: ВІРТУАЛЬНИЙ ПРИСТРІЙ UINPUT ---
+# --------------------------------------------------------------------------------
+# Події миші та клавіатури пишуться у віртуальний пристрій /dev/uinput (пакет
+# evdev), тож працюють і в X11, і у Wayland, де pyautogui не може рухати курсор.
+# Потрібен доступ на запис до /dev/uinput (група input або правило udev).
+# Методи ті самі, що й у PyAutoGuiBackend; смуги виконавця викликають їх з різних
+# потоків, тому кожна група подій до SYN пишеться під блокуванням. Назви клавіш -
+# як у pyautogui.
+
+WHEEL_STEP = 120
+
+_KEY_NAMES = {
+    'alt': 'KEY_LEFTALT',
+    'shift': 'KEY_LEFTSHIFT',
+    'ctrl': 'KEY_LEFTCTRL',
+    'win': 'KEY_LEFTMETA',
+    'volumeup': 'KEY_VOLUMEUP',
+    'volumedown': 'KEY_VOLUMEDOWN',
+    'nexttrack': 'KEY_NEXTSONG',
+    'prevtrack': 'KEY_PREVIOUSSONG',
+    'playpause': 'KEY_PLAYPAUSE',
+}
+
+
+class UinputBackend:
+    def __init__(self, brightness_backend=None):
+        from evdev import UInput, ecodes
+        self._ecodes = ecodes
+        self._device = UInput({
+            ecodes.EV_KEY: list(ecodes.keys),
+            ecodes.EV_REL: [ecodes.REL_X, ecodes.REL_Y, ecodes.REL_WHEEL],
+        }, name='hand-gesture-control')
+        self._lock = threading.Lock()
+        # Дробові залишки руху та прокрутки: пристрій приймає лише цілі кроки.
+        self._rest = [0.0, 0.0, 0.0]
+        if brightness_backend is None:
+            brightness_backend = SbcBrightnessBackend()
+        self.brightness = BrightnessController(brightness_backend).start()
+
+    def _key(self, name):
+        return getattr(self._ecodes, _KEY_NAMES.get(name, 'KEY_' + name.upper()))
+
+    def _relative(self, axis, value):
+        # Ціла частина накопиченого зміщення по осі 0/1/2 (x/y/коліщатко).
+        self._rest[axis] += value
+        step = int(self._rest[axis])
+        self._rest[axis] -= step
+        return step
+
+    def _tap(self, code, times=1):
+        device = self._device
+        for _ in range(times):
+            device.write(self._ecodes.EV_KEY, code, 1)
+            device.syn()
+            device.write(self._ecodes.EV_KEY, code, 0)
+            device.syn()
+
+    def move(self, dx, dy):
+        ecodes = self._ecodes
+        with self._lock:
+            step_x, step_y = self._relative(0, dx), self._relative(1, dy)
+            if step_x or step_y:
+                self._device.write(ecodes.EV_REL, ecodes.REL_X, step_x)
+                self._device.write(ecodes.EV_REL, ecodes.REL_Y, step_y)
+                self._device.syn()
+
+    def click(self):
+        with self._lock:
+            self._tap(self._ecodes.BTN_LEFT)
+
+    def right_click(self):
+        with self._lock:
+            self._tap(self._ecodes.BTN_RIGHT)
+
+    def scroll(self, amount):
+        # amount - у одиницях коліщатка Windows (WHEEL_STEP на клацання), як у pyautogui.
+        ecodes = self._ecodes
+        with self._lock:
+            step = self._relative(2, amount / WHEEL_STEP)
+            if step:
+                self._device.write(ecodes.EV_REL, ecodes.REL_WHEEL, step)
+                self._device.syn()
+
+    def press(self, key, presses=1):
+        with self._lock:
+            self._tap(self._key(key), presses)
+
+    def hotkey(self, *keys):
+        codes = [self._key(key) for key in keys]
+        device = self._device
+        with self._lock:
+            for code in codes:
+                device.write(self._ecodes.EV_KEY, code, 1)
+                device.syn()
+            for code in reversed(codes):
+                device.write(self._ecodes.EV_KEY, code, 0)
+                device.syn()
+
+    def change_brightness(self, delta):
+        self.brightness.change(delta)
+
+    def close(self):
+        self.brightness.stop()
+        self._device.close()
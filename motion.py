@@ -0,0 +1,194 @@
+import math
+
+import numpy as np
+
+from features import KNUCKLE_IDS, TIP_IDS
+from landmarks import MAX_HANDS, NUM_LANDMARKS
+
+# --------------------------------------------------------------------------------
+# --- ДИНАМІЧНІ ЖЕСТИ: ІСТОРІЯ ЛЕНДМАРКІВ І ДЕТЕКТОР РУХУ ---
+# --------------------------------------------------------------------------------
+# Для кожної руки (права/ліва) зберігаються останні MOTION_HISTORY кадрів у
+# заздалегідь виділеному кільцевому масиві NumPy: додавання кадру - один запис
+# у слот, без виділення пам'яті. Детектор бере хвіст історії від моменту, коли
+# рука востаннє стояла (швидкість нижче REST_SPEED), і за швидкістю та
+# прискоренням розпізнає:
+#   * свайп - центр кісточок пройшов SWIPE_MIN_DISTANCE майже прямою лінією
+#     і ще рухається; спрацьовує посеред руху, не чекаючи фіксованого зсуву;
+#   * коло - напрямок швидкості центру кісточок повернувся на CIRCLE_MIN_TURN;
+#   * клацання (flick) - кінчики пальців різко (з прискоренням) пішли вбік
+#     відносно зап'ястя, а саме зап'ястя стоїть. Лише вліво/вправо: рух пальців
+#     вниз - це звичайне стискання в кулак.
+# Відстані - у частках ширини кадру (y перераховано з урахуванням пропорцій),
+# швидкості - у ширинах кадру за секунду.
+
+MOTION_HISTORY = 64
+MIN_FRAMES = 4
+
+REST_SPEED = 0.15
+SWIPE_MIN_DISTANCE = 0.03
+SWIPE_MIN_SPEED = 0.5
+# Середнє відхилення шляху від прямої, у частках пройденої відстані: дуга кола
+# радіусом менше ~0.1 ширини кадру сюди не проходить і не стає свайпом.
+SWIPE_MAX_BEND = 0.035
+SWIPE_AXIS_RATIO = 2.0
+CIRCLE_MIN_TURN = 1.75 * math.pi
+CIRCLE_MIN_STEPS = 8
+CIRCLE_MIN_RADIUS = 0.02
+FLICK_MIN_DISTANCE = 0.02
+FLICK_MIN_SPEED = 0.5
+FLICK_MIN_ACCEL = 5.0
+FLICK_MAX_WRIST_SPEED = 0.25
+
+MOTION_SWIPE_LEFT = 'swipe_left'
+MOTION_SWIPE_RIGHT = 'swipe_right'
+MOTION_SWIPE_UP = 'swipe_up'
+MOTION_SWIPE_DOWN = 'swipe_down'
+MOTION_CIRCLE_CW = 'circle_cw'
+MOTION_CIRCLE_CCW = 'circle_ccw'
+MOTION_FLICK_LEFT = 'flick_left'
+MOTION_FLICK_RIGHT = 'flick_right'
+SWIPES = (MOTION_SWIPE_LEFT, MOTION_SWIPE_RIGHT, MOTION_SWIPE_UP, MOTION_SWIPE_DOWN)
+MOTIONS = SWIPES + (MOTION_CIRCLE_CW, MOTION_CIRCLE_CCW, MOTION_FLICK_LEFT, MOTION_FLICK_RIGHT)
+
+
+class LandmarkHistory:
+    def __init__(self, capacity=MOTION_HISTORY):
+        self.capacity = capacity
+        self.landmarks = np.zeros((MAX_HANDS, capacity, NUM_LANDMARKS, 3), dtype=np.float32)
+        self.times = np.zeros((MAX_HANDS, capacity))
+        self.head = [0] * MAX_HANDS
+        self.count = [0] * MAX_HANDS
+        self._offsets = np.arange(capacity)
+
+    def push(self, side, t, landmarks):
+        i = self.head[side]
+        self.landmarks[side, i] = landmarks
+        self.times[side, i] = t
+        self.head[side] = (i + 1) % self.capacity
+        self.count[side] = min(self.count[side] + 1, self.capacity)
+
+    def clear(self, side):
+        self.count[side] = 0
+
+    def window(self, side, n=None):
+        # Останні n кадрів руки в хронологічному порядку: (часи (n,), лендмарки (n, 21, 3)).
+        n = self.count[side] if n is None else min(n, self.count[side])
+        index = (self.head[side] - n + self._offsets[:n]) % self.capacity
+        return self.times[side, index], self.landmarks[side, index]
+
+
+def _onset(speed, threshold=REST_SPEED):
+    # Індекс точки, з якої триває поточний рух (після останнього кроку зі швидкістю нижче порогу).
+    rest = np.flatnonzero(speed < threshold)
+    return int(rest[-1]) + 1 if rest.size else 0
+
+
+def _dominant_axis(dx, dy):
+    # 'x', 'y' або None, якщо жодна вісь не переважає в SWIPE_AXIS_RATIO разів.
+    if abs(dx) >= SWIPE_AXIS_RATIO * abs(dy):
+        return 'x'
+    if abs(dy) >= SWIPE_AXIS_RATIO * abs(dx):
+        return 'y'
+    return None
+
+
+class MotionDetector:
+    def __init__(self, frame_size, capacity=MOTION_HISTORY):
+        w, h = frame_size
+        self.scale = np.array([1.0, h / w], dtype=np.float32)
+        self.history = LandmarkHistory(capacity)
+        self.side = None
+
+    def push(self, hands):
+        # Додає руки кадру в історію; історія рук, яких на кадрі немає, скидається.
+        # Детектор далі дивиться на першу руку запису.
+        t = float(hands['capture_time'])
+        present = [False] * MAX_HANDS
+        self.side = None
+        for i in range(int(hands['num_hands'])):
+            side = int(hands['handedness'][i])
+            if side < 0 or present[side]:
+                continue
+            present[side] = True
+            self.history.push(side, t, hands['landmarks'][i])
+            if self.side is None:
+                self.side = side
+        for side in range(MAX_HANDS):
+            if not present[side]:
+                self.history.clear(side)
+
+    def detect(self):
+        # Назва розпізнаного руху першої руки або None. Після спрацювання історія
+        # руки скидається, тож той самий рух не спрацює вдруге.
+        side = self.side
+        if side is None or self.history.count[side] < MIN_FRAMES:
+            return None
+        times, landmarks = self.history.window(side)
+        points = landmarks[:, :, :2] * self.scale
+        dt = np.maximum(np.diff(times), 1e-3)
+        palm = points[:, KNUCKLE_IDS].mean(axis=1)
+        wrist = points[:, 0]
+        tips = points[:, TIP_IDS].mean(axis=1) - wrist
+
+        # Поточний рух центру кісточок - від останнього кроку, де рука стояла.
+        velocity = np.diff(palm, axis=0) / dt[:, None]
+        speed = np.hypot(velocity[:, 0], velocity[:, 1])
+        start = _onset(speed)
+        motion = (self._flick(tips, wrist, dt) or self._circle(palm[start:], velocity[start:])
+                  or self._swipe(palm[start:], speed[start:]))
+        if motion is not None:
+            self.history.clear(side)
+        return motion
+
+    def _swipe(self, path, speed):
+        if len(path) < 3 or speed[-2:].mean() < SWIPE_MIN_SPEED:
+            return None
+        dx, dy = (path[-1] - path[0]).tolist()
+        distance = math.hypot(dx, dy)
+        if distance < SWIPE_MIN_DISTANCE:
+            return None
+        offsets = path - path[0]
+        bend = np.abs(offsets[:, 0] * dy - offsets[:, 1] * dx).mean() / distance
+        if bend > SWIPE_MAX_BEND * distance:
+            return None
+        axis = _dominant_axis(dx, dy)
+        if axis == 'x':
+            return MOTION_SWIPE_RIGHT if dx > 0 else MOTION_SWIPE_LEFT
+        if axis == 'y':
+            return MOTION_SWIPE_DOWN if dy > 0 else MOTION_SWIPE_UP
+        return None
+
+    def _circle(self, path, velocity):
+        if len(velocity) < CIRCLE_MIN_STEPS:
+            return None
+        heading = np.arctan2(velocity[:, 1], velocity[:, 0])
+        turn = (np.diff(heading) + math.pi) % (2 * math.pi) - math.pi
+        total = float(turn.sum())
+        if abs(total) < CIRCLE_MIN_TURN:
+            return None
+        offsets = path - path.mean(axis=0)
+        if np.hypot(offsets[:, 0], offsets[:, 1]).mean() < CIRCLE_MIN_RADIUS:
+            return None
+        # y кадру спрямована вниз, тож зростання кута - рух за годинниковою стрілкою.
+        return MOTION_CIRCLE_CW if total > 0 else MOTION_CIRCLE_CCW
+
+    def _flick(self, tips, wrist, dt):
+        wrist_velocity = (wrist[-1] - wrist[-3]) / (dt[-2] + dt[-1])
+        if math.hypot(*wrist_velocity.tolist()) > FLICK_MAX_WRIST_SPEED:
+            return None
+        velocity = np.diff(tips, axis=0) / dt[:, None]
+        speed = np.hypot(velocity[:, 0], velocity[:, 1])
+        if speed[-1] < FLICK_MIN_SPEED:
+            return None
+        start = _onset(speed)
+        dx, dy = (tips[-1] - tips[start]).tolist()
+        if math.hypot(dx, dy) < FLICK_MIN_DISTANCE or _dominant_axis(dx, dy) != 'x':
+            return None
+        # Прискорення - найбільший середній приріст швидкості від будь-якого кроку з початку
+        # руху до поточного: покадрова різниця на 30 кадрах/с надто шумна.
+        first = max(start - 1, 0)
+        elapsed = np.cumsum(dt[:first:-1])[::-1]
+        if ((speed[-1] - speed[first:-1]) / elapsed).max() < FLICK_MIN_ACCEL:
+            return None
+        return MOTION_FLICK_RIGHT if dx > 0 else MOTION_FLICK_LEFT
@@ -0,0 +1,262 @@
+import multiprocessing
+import queue
+import threading
+from collections import deque
+
+# --------------------------------------------------------------------------------
+# --- ЕТАПИ КОНВЕЄРА ТА СПОСОБИ ЇХ ЗАПУСКУ ---
+# --------------------------------------------------------------------------------
+# Кожен етап - об'єкт Stage: setup() створює важкі ресурси вже там, де етап
+# виконується, handle(item) обробляє один елемент з inbox, teardown() звільняє
+# ресурси. None в inbox означає зупинку. Виконавець визначає, де живуть етапи:
+#   process - окремі процеси та multiprocessing.Queue (як раніше, максимум паралелізму);
+#   thread  - потоки одного процесу та queue.Queue (без пікла і копій між процесами;
+#             MediaPipe та OpenCV відпускають GIL на важкій роботі);
+#   asyncio - усі етапи з inbox по черзі в одному циклі подій в окремому потоці.
+# Етапи з власним циклом (GUI на Tk) у режимах thread і asyncio працюють у потоці.
+# asyncio імпортується лише в режимі asyncio: процесам етапів він не потрібен.
+
+
+class Stage:
+    name = 'stage'
+    # False - етап має власний блокуючий цикл і не може працювати в циклі подій.
+    async_capable = True
+    # Секунд без нових елементів, після яких викликається idle() (None - ніколи).
+    idle_timeout = None
+
+    def __init__(self, inbox=None):
+        self.inbox = inbox
+
+    def setup(self):
+        pass
+
+    def handle(self, item):
+        raise NotImplementedError
+
+    def idle(self):
+        pass
+
+    def teardown(self):
+        pass
+
+    def run(self):
+        self.setup()
+        try:
+            while True:
+                if self.idle_timeout is None:
+                    item = self.inbox.get()
+                else:
+                    try:
+                        item = self.inbox.get(timeout=self.idle_timeout)
+                    except queue.Empty:
+                        self.idle()
+                        continue
+                if item is None: break
+                self.handle(item)
+        finally:
+            self.teardown()
+
+    async def run_async(self):
+        import asyncio
+        self.setup()
+        try:
+            while True:
+                if self.idle_timeout is None:
+                    item = await self.inbox.aget()
+                else:
+                    # Готовий елемент береться без wait_for: той створює задачу на кожен виклик.
+                    try:
+                        item = self.inbox.get_nowait()
+                    except queue.Empty:
+                        try:
+                            item = await asyncio.wait_for(self.inbox.aget(), self.idle_timeout)
+                        except asyncio.TimeoutError:
+                            self.idle()
+                            continue
+                if item is None: break
+                self.handle(item)
+                await asyncio.sleep(0)
+        finally:
+            self.teardown()
+
+
+class ProcessExecutor:
+    name = 'process'
+
+    def __init__(self):
+        self._workers = []
+
+    def queue(self, maxsize=0, external=False):
+        return multiprocessing.Queue(maxsize)
+
+    def start(self, stage):
+        worker = multiprocessing.Process(target=stage.run, name=stage.name, daemon=True)
+        worker.start()
+        self._workers.append(worker)
+
+    def join(self, timeout=None):
+        for worker in self._workers:
+            worker.join(timeout)
+
+
+class ThreadExecutor:
+    name = 'thread'
+
+    def __init__(self):
+        self._workers = []
+
+    def queue(self, maxsize=0, external=False):
+        return queue.Queue(maxsize)
+
+    def start(self, stage):
+        worker = threading.Thread(target=stage.run, name=stage.name, daemon=True)
+        worker.start()
+        self._workers.append(worker)
+
+    def join(self, timeout=None):
+        for worker in self._workers:
+            worker.join(timeout)
+
+
+class LoopQueue:
+    # Черга для етапів у циклі подій. Класти можна з будь-якого потоку, читає один
+    # споживач у циклі через await aget(). Потоки поза циклом при заповненій черзі
+    # чекають на місце, як у queue.Queue. Етап у самому циклі чекати не може:
+    # споживач працює в тому ж потоці і не звільнить місце, поки виробник стоїть,
+    # тому там put() витісняє найстаріший елемент і повертає кількість витіснених.
+    # Маркер зупинки в кінці черги не витісняється: тоді put() кидає queue.Full.
+    def __init__(self, loop, maxsize=0):
+        import asyncio
+        self.maxsize = maxsize
+        self._loop = loop
+        self._items = deque()
+        self._lock = threading.Lock()
+        self._space = threading.Condition(self._lock)
+        self._ready = asyncio.Event()
+
+    def _wake(self):
+        self._loop.call_soon_threadsafe(self._ready.set)
+
+    def _full(self):
+        return self.maxsize and len(self._items) >= self.maxsize
+
+    def _in_loop(self):
+        import asyncio
+        try:
+            return asyncio.get_running_loop() is self._loop
+        except RuntimeError:
+            return False
+
+    def put_nowait(self, item):
+        with self._lock:
+            if self._full():
+                raise queue.Full
+            self._items.append(item)
+        self._wake()
+
+    def put(self, item, block=True, timeout=None):
+        evicted = 0
+        with self._lock:
+            if self._in_loop():
+                if self._full():
+                    # Маркер зупинки (None) не витісняється: після нього споживач однаково
+                    # нічого не прочитає, тож відкидається новий елемент.
+                    if item is not None and self._items[-1] is None:
+                        raise queue.Full
+                    self._items.popleft()
+                    evicted = 1
+            elif not block:
+                if self._full():
+                    raise queue.Full
+            elif not self._space.wait_for(lambda: not self._full(), timeout):
+                raise queue.Full
+            self._items.append(item)
+        self._wake()
+        return evicted
+
+    def get_nowait(self):
+        with self._lock:
+            if not self._items:
+                raise queue.Empty
+            self._space.notify()
+            return self._items.popleft()
+
+    async def aget(self):
+        while True:
+            with self._lock:
+                if self._items:
+                    self._space.notify()
+                    return self._items.popleft()
+                self._ready.clear()
+            await self._ready.wait()
+
+    def qsize(self):
+        return len(self._items)
+
+    def empty(self):
+        return not self._items
+
+
+class AsyncioExecutor:
+    name = 'asyncio'
+
+    def __init__(self):
+        import asyncio
+        self.loop = asyncio.new_event_loop()
+        self._tasks = []
+        self._threads = []
+        self._loop_thread = threading.Thread(target=self.loop.run_forever, name="pipeline-loop", daemon=True)
+
+    def queue(self, maxsize=0, external=False):
+        # external - споживач поза циклом подій (головний потік, Tk), потрібна звичайна потокобезпечна черга.
+        if external:
+            return queue.Queue(maxsize)
+        return LoopQueue(self.loop, maxsize)
+
+    def start(self, stage):
+        import asyncio
+        if not stage.async_capable:
+            worker = threading.Thread(target=stage.run, name=stage.name, daemon=True)
+            worker.start()
+            self._threads.append(worker)
+            return
+        if not self._loop_thread.is_alive():
+            self._loop_thread.start()
+        self._tasks.append(asyncio.run_coroutine_threadsafe(stage.run_async(), self.loop))
+
+    def join(self, timeout=None):
+        for task in self._tasks:
+            task.result(timeout)
+        for worker in self._threads:
+            worker.join(timeout)
+        self.loop.call_soon_threadsafe(self.loop.stop)
+
+
+EXECUTORS = {executor.name: executor for executor in (ProcessExecutor, ThreadExecutor, AsyncioExecutor)}
+
+
+def make_executor(name):
+    return EXECUTORS[name]()
+
+
+STOP_TIMEOUT = 1.0
+
+
+def put_stop_marker(q, timeout=STOP_TIMEOUT):
+    # Маркер зупинки для етапу, що читає q. Якщо за timeout місце не звільнилося,
+    # споживач, найімовірніше, вже не працює (наприклад, процес загинув від Ctrl+C):
+    # черга спорожнюється і маркер кладеться без очікування, щоб зупинка не зависла.
+    try:
+        q.put(None, timeout=timeout)
+        return
+    except queue.Full:
+        pass
+    try:
+        while True:
+            q.get_nowait()
+    except queue.Empty:
+        pass
+    try:
+        q.put_nowait(None)
+    except queue.Full:
+        pass
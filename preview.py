@@ -0,0 +1,78 @@
+import queue
+import time
+
+import numpy as np
+
+from landmarks import draw_hands, pack_hands, unpack_hands
+
+# --------------------------------------------------------------------------------
+# --- ПРЕВ'Ю: МАЛЮВАННЯ З ЛЕНДМАРКІВ, З ОБМЕЖЕНОЮ ЧАСТОТОЮ ---
+# --------------------------------------------------------------------------------
+# Логіка жестів не торкається пікселів кадру: не частіше за max_fps вона надсилає
+# головному процесу запис рук і кілька полів стану, а той малює скелет руки,
+# мертву зону курсора та підказки поверх зменшеного останнього кадру з кільцевого
+# буфера (з --preview-blank - на порожньому полотні). У режимі --headless прев'ю
+# немає взагалі. OpenCV імпортує лише рендерер, тобто головний процес.
+
+PREVIEW_FPS = 10
+PREVIEW_SIZE = (640, 360)
+
+
+class PreviewSender:
+    # На боці логіки жестів: пропускає кадри, щоб прев'ю отримувало не більше max_fps оновлень.
+    def __init__(self, display_queue, counters, max_fps=PREVIEW_FPS):
+        self.display_queue = display_queue
+        self.counters = counters
+        self.interval = 1.0 / max_fps
+        self._last_sent = 0.0
+        self._frames = 0
+        self._window_start = time.time()
+        self._fps = 0.0
+
+    def offer(self, hands, result, is_active):
+        now = time.time()
+        self._frames += 1
+        if now - self._window_start >= 1.0:
+            self._fps = self._frames / (now - self._window_start)
+            self._frames = 0
+            self._window_start = now
+        if now - self._last_sent < self.interval:
+            return
+        self._last_sent = now
+        try:
+            self.display_queue.put_nowait((pack_hands(hands), result.cursor_target, is_active, self._fps))
+            self.counters.queue_put('display', True)
+        except queue.Full:
+            self.counters.queue_put('display', False)
+
+
+class PreviewRenderer:
+    def __init__(self, frame_size, dead_zone_radius, size=PREVIEW_SIZE):
+        self.frame_width, self.frame_height = frame_size
+        self.dead_zone_radius = dead_zone_radius
+        self.width, self.height = size
+        self._canvas = np.zeros((self.height, self.width, 3), dtype=np.uint8)
+
+    def render(self, item, frame=None):
+        # frame - кадр камери під полотно; None - порожнє сіре полотно.
+        import cv2
+        hands_data, cursor_target, is_active, fps = item
+        canvas = self._canvas
+        if frame is None:
+            canvas[:] = 32
+        else:
+            cv2.resize(frame, (self.width, self.height), dst=canvas, interpolation=cv2.INTER_AREA)
+        scale = self.width / self.frame_width
+        center = (self.width // 2, self.height // 2)
+        cv2.circle(canvas, center, max(1, int(self.dead_zone_radius * scale)), (0, 255, 0), 1)
+        if cursor_target is not None:
+            target = (int(cursor_target[0] * scale), int(cursor_target[1] * self.height / self.frame_height))
+            cv2.line(canvas, center, target, (0, 255, 0), 2)
+        draw_hands(canvas, unpack_hands(hands_data))
+        cv2.putText(canvas, f'FPS: {int(fps)}', (10, 25), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 0), 2)
+        if not is_active:
+            cv2.putText(canvas, "(Show TWO PALMS to activate)", (10, 55), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 0, 255), 2)
+        else:
+            cv2.putText(canvas, "(Show TWO 'OK' to deactivate)", (10, 55), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 0),
+                        2)
+        return canvas
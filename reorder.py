@@ -0,0 +1,63 @@
+# --------------------------------------------------------------------------------
+# --- ВІДНОВЛЕННЯ ПОРЯДКУ КАДРІВ ПІСЛЯ ПУЛУ ДЕТЕКТОРІВ ---
+# --------------------------------------------------------------------------------
+# Кілька детекторів обробляють кадри по черзі (кадр seq дістається детектору
+# seq % N, якщо його черга вільна) і завершують їх у довільному порядку. Логіці
+# жестів потрібна послідовність у порядку захоплення, тож результати чекають тут,
+# поки не прийде попередній кадр. Якщо пропуск не заповнився за max_delay, він
+# вважається втраченим; результати, що прийшли вже після пропущеного місця,
+# відкидаються як запізнілі. Термін перевіряється при кожному push() і через
+# expire(), коли нових результатів немає (детектори стоять); flush() при зупинці
+# віддає все, що лишилося, щоб не загубити останні кадри жесту.
+
+REORDER_MAX_DELAY = 0.05
+
+
+class ReorderBuffer:
+    def __init__(self, max_delay=REORDER_MAX_DELAY, counters=None):
+        self.max_delay = max_delay
+        self.counters = counters
+        self.next_seq = None
+        self.late = 0
+        self.skipped = 0
+        self._pending = {}
+
+    def _count(self, metric, n=1):
+        if self.counters is not None:
+            self.counters.inc(metric, 'gesture', n)
+
+    def push(self, seq, item, now):
+        # Повертає список елементів, які вже можна обробити, у порядку seq.
+        if self.next_seq is None:
+            self.next_seq = seq
+        if seq < self.next_seq:
+            self.late += 1
+            self._count('reorder_late')
+            return []
+        self._pending[seq] = (item, now)
+        return self.expire(now)
+
+    def expire(self, now):
+        # Те саме, що й push() без нового елемента: пропуски, старші за max_delay, пропускаються.
+        ready = []
+        while self._pending:
+            entry = self._pending.pop(self.next_seq, None)
+            if entry is not None:
+                ready.append(entry[0])
+                self.next_seq += 1
+                continue
+            first = min(self._pending)
+            if now - self._pending[first][1] < self.max_delay:
+                break
+            gap = first - self.next_seq
+            self.skipped += gap
+            self._count('reorder_skipped', gap)
+            self.next_seq = first
+        return ready
+
+    def flush(self):
+        # Усі елементи, що чекають, у порядку seq; пропуски між ними рахуються як пропущені.
+        return self.expire(float('inf'))
+
+    def __len__(self):
+        return len(self._pending)
@@ -0,0 +1,71 @@
+import argparse
+import time
+
+from classifier import GestureClassifier
+from commands import RecordingSink
+from gesture_engine import GestureEngine
+from landmark_filter import LandmarkFilter
+from motion import MotionDetector
+from rules import RuleEngine, DEFAULT_RULES_PATH
+from session import load_session
+
+# --------------------------------------------------------------------------------
+# --- ВІДТВОРЕННЯ ЗАПИСАНОЇ СЕСІЇ ЧЕРЕЗ ЛОГІКУ ЖЕСТІВ ---
+# --------------------------------------------------------------------------------
+# Прогін записаних лендмарків через GestureEngine з максимальною швидкістю.
+# Камера, MediaPipe та Windows не потрібні; виводиться кількість кадрів за
+# секунду та точна послідовність команд (її можна порівнювати між версіями).
+
+
+def replay(session, rules, verbose=False, landmark_filter=None, predict=False, motion=False, classifier=None):
+    sink = RecordingSink()
+    detector = MotionDetector(session.frame_size) if motion else None
+    engine = GestureEngine(rules, session.frame_size, sink, verbose=verbose, motion=detector, classifier=classifier)
+    start = time.perf_counter()
+    for i, (hands, app_context) in enumerate(zip(session.hands, session.contexts)):
+        sink.frame = i
+        engine.state.app_context = app_context
+        if landmark_filter is not None:
+            horizon = float(hands['detect_end'] - hands['capture_time']) if predict else 0.0
+            hands = landmark_filter.apply(hands, horizon)
+        engine.process(hands)
+    return sink, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Відтворення записаної сесії лендмарків через логіку жестів")
+    parser.add_argument('session', help="файл сесії NPZ, записаний main.py --record")
+    parser.add_argument('--rules', default=DEFAULT_RULES_PATH, help="JSON з правилами жестів")
+    parser.add_argument('--trace', help="записати трасу команд у цей файл")
+    parser.add_argument('--verbose', action='store_true', help="виводити DEBUG-повідомлення логіки жестів")
+    parser.add_argument('--filter', action='store_true', help="згладжувати лендмарки фільтром One Euro")
+    parser.add_argument('--predict', action='store_true',
+                        help="разом з --filter екстраполювати на записану затримку від захоплення до детекції")
+    parser.add_argument('--motion', action='store_true',
+                        help="розпізнавати свайпи, кола та клацання детектором руху за швидкістю руки")
+    parser.add_argument('--classifier', metavar='PATH',
+                        help="розпізнавати статичні жести моделлю, записаною calibrate.py")
+    args = parser.parse_args()
+
+    session = load_session(args.session)
+    landmark_filter = LandmarkFilter() if args.filter else None
+    classifier = GestureClassifier.load(args.classifier, session.frame_size) if args.classifier else None
+    sink, elapsed = replay(session, RuleEngine.load(args.rules), args.verbose, landmark_filter, args.predict,
+                           args.motion, classifier)
+
+    print(f"Frames: {len(session)} ({session.duration:.1f} s recorded)")
+    # Порожня чи дуже коротка сесія може пройти швидше за роздільність таймера.
+    rate = f"{len(session) / elapsed:.0f} frames/s" if elapsed > 0 else "n/a frames/s"
+    print(f"Replay: {elapsed * 1000:.1f} ms, {rate}")
+    print(f"Commands: {len(sink.trace)}")
+    lines = sink.format_trace()
+    if args.trace:
+        with open(args.trace, 'w', encoding='utf-8') as f:
+            f.write("\n".join(lines) + "\n")
+    else:
+        for line in lines:
+            print(line)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,92 @@
+import cv2
+import numpy as np
+
+# --------------------------------------------------------------------------------
+# --- ДЕТЕКЦІЯ В ОБЛАСТІ ІНТЕРЕСУ (ROI) НАВКОЛО РУК З ПОПЕРЕДНЬОГО КАДРУ ---
+# --------------------------------------------------------------------------------
+# Замість стискання всього кадру вдвічі MediaPipe отримує вирізану область навколо
+# рамки рук з попереднього кадру з запасом на рух. Роздільна здатність обирається
+# за розміром області: маленька далека рука обробляється без зменшення, велика -
+# зменшується до ROI_MAX_SIDE. Якщо рук в області не знайдено, наступний кадр
+# обробляється повністю; повний кадр також періодично перевіряється, щоб помітити
+# другу руку, що з'явилася поза областю. Лендмарки з області переводяться назад
+# у нормовані координати повного кадру.
+
+FULL_FRAME_SCALE = 0.5
+ROI_MAX_SIDE = 320
+ROI_PADDING = 0.6
+ROI_MIN_SIDE = 0.3
+ROI_MAX_AREA = 0.6
+FULL_FRAME_REFRESH = 15
+
+
+class RoiTracker:
+    def __init__(self, frame_size, padding=ROI_PADDING, min_side=ROI_MIN_SIDE, max_side_px=ROI_MAX_SIDE,
+                 full_scale=FULL_FRAME_SCALE, refresh_every=FULL_FRAME_REFRESH):
+        self.frame_width, self.frame_height = frame_size
+        self.padding = padding
+        self.min_side = min_side
+        self.max_side_px = max_side_px
+        self.full_scale = full_scale
+        self.refresh_every = refresh_every
+        self.roi = None
+        self._frames_since_full = 0
+
+    def plan(self, full_scale=None):
+        # (x0, y0, x1, y1) у пікселях та масштаб для наступного кадру.
+        if self.roi is None or self._frames_since_full >= self.refresh_every:
+            return (0, 0, self.frame_width, self.frame_height), full_scale or self.full_scale
+        x0, y0, x1, y1 = self.roi
+        return self.roi, min(1.0, self.max_side_px / max(x1 - x0, y1 - y0))
+
+    def crop(self, frame, full_scale=None):
+        # Повертає (зображення для MediaPipe, область), зображення вже у масштабі плану.
+        region, scale = self.plan(full_scale)
+        x0, y0, x1, y1 = region
+        image = frame[y0:y1, x0:x1]
+        if scale != 1.0:
+            image = cv2.resize(image, (max(1, int((x1 - x0) * scale)), max(1, int((y1 - y0) * scale))),
+                               interpolation=cv2.INTER_AREA)
+        return image, region
+
+    def update(self, record, region):
+        # Переводить лендмарки record з координат області в координати кадру
+        # та готує область для наступного кадру.
+        x0, y0, x1, y1 = region
+        w, h = self.frame_width, self.frame_height
+        full_frame = (x0, y0, x1, y1) == (0, 0, w, h)
+        num_hands = int(record['num_hands'])
+        landmarks = record['landmarks'][:num_hands]
+        if not full_frame and num_hands:
+            landmarks[..., 0] = (x0 + landmarks[..., 0] * (x1 - x0)) / w
+            landmarks[..., 1] = (y0 + landmarks[..., 1] * (y1 - y0)) / h
+            landmarks[..., 2] *= (x1 - x0) / w
+
+        self._frames_since_full = 0 if full_frame else self._frames_since_full + 1
+        self.roi = self._next_roi(landmarks) if num_hands else None
+        return record
+
+    def _next_roi(self, landmarks):
+        w, h = self.frame_width, self.frame_height
+        xs = landmarks[..., 0] * w
+        ys = landmarks[..., 1] * h
+        left, right, top, bottom = float(xs.min()), float(xs.max()), float(ys.min()), float(ys.max())
+
+        side = max(right - left, bottom - top) * (1.0 + 2.0 * self.padding)
+        side = min(max(side, self.min_side * min(w, h)), w, h)
+        if side * side > ROI_MAX_AREA * w * h:
+            return None
+
+        # Область лишається на місці, поки рука всередині і розмір майже не змінився:
+        # так трекер MediaPipe отримує стабільну картинку між кадрами.
+        if self.roi is not None:
+            x0, y0, x1, y1 = self.roi
+            margin = 0.1 * (x1 - x0)
+            inside = left >= x0 + margin and top >= y0 + margin and right <= x1 - margin and bottom <= y1 - margin
+            if inside and 0.75 < side / (x1 - x0) < 1.33:
+                return self.roi
+
+        cx, cy = (left + right) / 2, (top + bottom) / 2
+        x0 = int(min(max(cx - side / 2, 0), w - side))
+        y0 = int(min(max(cy - side / 2, 0), h - side))
+        return x0, y0, int(x0 + side), int(y0 + side)
@@ -0,0 +1,123 @@
+import json
+import os
+
+from features import GESTURE_NAMES, GESTURE_KEY_COUNT, flags_from_key
+from commands import resolve_command
+from motion import MOTIONS, SWIPES
+
+# --------------------------------------------------------------------------------
+# --- ТАБЛИЧНИЙ РУШІЙ ПРАВИЛ "ЖЕСТ -> ДІЯ" ---
+# --------------------------------------------------------------------------------
+# Правила описані в gesture_rules.json і при старті компілюються в таблицю
+# (app_context, gesture_key) -> правило. Порядок правил у файлі задає пріоритет,
+# тож на кадр виконується один пошук у словнику незалежно від кількості правил.
+# Динамічні жести (кола, клацання) мають окрему таблицю (app_context, рух) -> дія;
+# свайпи завжди перемикають вікна і в таблиці не описуються.
+
+DEFAULT_RULES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'gesture_rules.json')
+
+PHASE_OVERRIDE = 'override'
+PHASE_ACTION = 'action'
+PHASES = (PHASE_OVERRIDE, PHASE_ACTION)
+
+
+class Rule:
+    def __init__(self, gesture, phase=PHASE_ACTION, command=None, text="", mode=None, cooldown=0.0):
+        if gesture not in GESTURE_NAMES:
+            raise ValueError(f"Unknown gesture '{gesture}' in rules")
+        if phase not in PHASES:
+            raise ValueError(f"Unknown rule phase '{phase}'")
+        self.gesture = gesture
+        self.gesture_flag = GESTURE_NAMES[gesture]
+        self.phase = phase
+        self.command = resolve_command(command) if command else None
+        self.text = text
+        self.mode = mode
+        self.cooldown = cooldown
+
+
+class ModeRule:
+    def __init__(self, name, hold, anchor_landmark, step, cooldown, up, down, up_text, down_text, idle_text):
+        if hold not in GESTURE_NAMES:
+            raise ValueError(f"Unknown gesture '{hold}' in mode '{name}'")
+        self.name = name
+        self.hold_flag = GESTURE_NAMES[hold]
+        self.anchor_landmark = anchor_landmark
+        self.step = step
+        self.cooldown = cooldown
+        self.up_command = resolve_command(up)
+        self.down_command = resolve_command(down)
+        self.up_text = up_text
+        self.down_text = down_text
+        self.idle_text = idle_text
+
+
+class MotionRule:
+    def __init__(self, motion, command, text=""):
+        if motion not in MOTIONS:
+            raise ValueError(f"Unknown motion '{motion}' in rules")
+        if motion in SWIPES:
+            raise ValueError(f"Swipes are not configurable in rules ('{motion}')")
+        self.motion = motion
+        self.command = resolve_command(command)
+        self.text = text
+
+
+def _expand_contexts(contexts, known):
+    if contexts == '*':
+        return known
+    if isinstance(contexts, str):
+        contexts = [contexts]
+    for context in contexts:
+        if context not in known:
+            raise ValueError(f"Unknown context '{context}' in rules")
+    return contexts
+
+
+class RuleEngine:
+    def __init__(self, config):
+        self.contexts = tuple(config['contexts'])
+        default_cooldown = config.get('default_cooldown', 0.0)
+        self.window_titles = config.get('window_titles', {})
+
+        self.modes = {name: ModeRule(name, **spec) for name, spec in config.get('modes', {}).items()}
+
+        rules_by_context = {context: [] for context in self.contexts}
+        for spec in config['rules']:
+            spec = dict(spec)
+            contexts = spec.pop('context', '*')
+            spec.setdefault('cooldown', default_cooldown)
+            rule = Rule(**spec)
+            if rule.mode is not None and rule.mode not in self.modes:
+                raise ValueError(f"Rule for '{rule.gesture}' engages unknown mode '{rule.mode}'")
+            for context in _expand_contexts(contexts, self.contexts):
+                rules_by_context[context].append(rule)
+
+        self._dispatch = {phase: {} for phase in PHASES}
+        for key in range(GESTURE_KEY_COUNT):
+            flags = flags_from_key(key)
+            for context, rules in rules_by_context.items():
+                for phase in PHASES:
+                    for rule in rules:
+                        if rule.phase == phase and flags & rule.gesture_flag:
+                            self._dispatch[phase][(context, key)] = rule
+                            break
+
+        self._motions = {}
+        for spec in config.get('motions', []):
+            spec = dict(spec)
+            contexts = spec.pop('context', '*')
+            rule = MotionRule(**spec)
+            for context in _expand_contexts(contexts, self.contexts):
+                self._motions.setdefault((context, rule.motion), rule)
+
+    @classmethod
+    def load(cls, path=DEFAULT_RULES_PATH):
+        with open(path, encoding='utf-8') as f:
+            return cls(json.load(f))
+
+    def lookup(self, phase, app_context, gesture_key):
+        return self._dispatch[phase].get((app_context, gesture_key))
+
+    def lookup_motion(self, app_context, motion):
+        return self._motions.get((app_context, motion))
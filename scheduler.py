@@ -0,0 +1,129 @@
+from collections import namedtuple
+from multiprocessing import Value
+
+# --------------------------------------------------------------------------------
+# --- АДАПТИВНИЙ РОЗКЛАД ДЕТЕКЦІЇ ---
+# --------------------------------------------------------------------------------
+# Логіка жестів повідомляє детекції поточний рівень через спільну пам'ять:
+#   idle   - рук не було довше idle_after секунд: рідка детекція на меншому кадрі;
+#   armed  - руки в кадрі, але керування вимкнене: потрібна лише поза активації;
+#   active - керування увімкнене: детекція на кожному кадрі.
+# Додатково дешевий фільтр руху порівнює зменшену сіру копію кадру з кадром
+# останньої детекції: якщо сцена не змінилася, MediaPipe не запускається, а
+# повторно використовується попередній результат (не довше за max_reuse рівня;
+# в active - ніколи, щоб клік чи щипок не спрацьовував із запізненням). Рух
+# рахується лише в області, де шукатимуть руки (ROI), і не як середня різниця, а
+# як найбільша частка змінених пікселів серед блоків: інакше рух одного пальця
+# розчиняється в нерухомому фоні.
+
+TIER_IDLE = 0
+TIER_ARMED = 1
+TIER_ACTIVE = 2
+DETECTION_TIERS = ('idle', 'armed', 'active')
+
+DETECT_RUN = 'inferred'
+DETECT_SKIP_RATE = 'skipped_rate'
+DETECT_SKIP_MOTION = 'skipped_motion'
+DETECTION_OUTCOMES = (DETECT_RUN, DETECT_SKIP_RATE, DETECT_SKIP_MOTION)
+
+TierPolicy = namedtuple('TierPolicy', 'min_interval full_scale max_reuse')
+
+MAX_REUSE = 1.0
+
+TIER_POLICIES = {
+    TIER_IDLE: TierPolicy(min_interval=0.2, full_scale=0.35, max_reuse=MAX_REUSE),
+    TIER_ARMED: TierPolicy(min_interval=1 / 15, full_scale=0.5, max_reuse=MAX_REUSE),
+    TIER_ACTIVE: TierPolicy(min_interval=0.0, full_scale=0.5, max_reuse=0.0),
+}
+
+# Копія для порівняння - у MOTION_THUMB_STEP разів менша за кадр (160x90 для 720p).
+MOTION_THUMB_STEP = 8
+# Піксель копії вважається зміненим, якщо яскравість зросла чи впала більше ніж на MOTION_PIXEL_DELTA.
+MOTION_PIXEL_DELTA = 8
+# Блок MOTION_BLOCK x MOTION_BLOCK пікселів копії (64x64 пікселі кадру) - приблизно кінчик пальця разом з рухом.
+MOTION_BLOCK = 8
+# Кадр новий, якщо хоч в одному блоці змінено не менше цієї частки пікселів.
+MOTION_THRESHOLD = 0.05
+
+
+class TierFeedback:
+    # Пише процес логіки жестів, читає процес детекції.
+    def __init__(self, idle_after=10.0):
+        self.idle_after = idle_after
+        self._tier = Value('b', TIER_ARMED, lock=False)
+        self._last_hand_time = None
+
+    @property
+    def tier(self):
+        return self._tier.value
+
+    def report(self, is_active, num_hands, now):
+        if num_hands or self._last_hand_time is None:
+            self._last_hand_time = now
+        if is_active:
+            tier = TIER_ACTIVE
+        elif now - self._last_hand_time > self.idle_after:
+            tier = TIER_IDLE
+        else:
+            tier = TIER_ARMED
+        if tier != self._tier.value:
+            self._tier.value = tier
+        return tier
+
+
+def motion_thumbnail(frame, step=MOTION_THUMB_STEP):
+    # Проріджування кроком 4 перед INTER_AREA у кілька разів дешевше і майже не змінює копію.
+    # cv2 імпортується тут: TierFeedback і константи модуля потрібні й процесам без OpenCV та NumPy.
+    import cv2
+    h, w = frame.shape[:2]
+    small = cv2.resize(frame[::4, ::4], (w // step, h // step), interpolation=cv2.INTER_AREA)
+    return cv2.cvtColor(small, cv2.COLOR_BGR2GRAY).astype('int16')
+
+
+def changed_fraction(thumb, last_thumb, region=None, step=MOTION_THUMB_STEP, block=MOTION_BLOCK,
+                     delta=MOTION_PIXEL_DELTA):
+    # Найбільша частка змінених пікселів серед блоків області region (x0, y0, x1, y1 у пікселях кадру).
+    import numpy as np
+    if region is not None:
+        x0, y0, x1, y1 = (v // step for v in region)
+        thumb, last_thumb = thumb[y0:y1 + 1, x0:x1 + 1], last_thumb[y0:y1 + 1, x0:x1 + 1]
+    changed = np.abs(thumb - last_thumb) > delta
+    h, w = changed.shape
+    # Неповні блоки на краях доповнюються незміненими пікселями.
+    padded = np.zeros((-(-h // block) * block, -(-w // block) * block), dtype=bool)
+    padded[:h, :w] = changed
+    blocks = padded.reshape(padded.shape[0] // block, block, padded.shape[1] // block, block)
+    return float(blocks.mean(axis=(1, 3)).max())
+
+
+class DetectionScheduler:
+    def __init__(self, feedback, policies=TIER_POLICIES, motion_threshold=MOTION_THRESHOLD):
+        self.feedback = feedback
+        self.policies = policies
+        self.motion_threshold = motion_threshold
+        self.tier = TIER_ARMED
+        self._last_time = None
+        self._last_thumb = None
+
+    @property
+    def policy(self):
+        return self.policies[self.tier]
+
+    def decide(self, frame, now, region=None):
+        # Повертає DETECT_RUN або причину пропуску; при пропуску слід повторити попередній результат.
+        # region - область (x0, y0, x1, y1), у якій шукатимуть руки; None - весь кадр.
+        self.tier = self.feedback.tier
+        if self._last_time is not None:
+            age = now - self._last_time
+            if age < self.policy.min_interval:
+                return DETECT_SKIP_RATE
+            if age < self.policy.max_reuse:
+                thumb = motion_thumbnail(frame)
+                if changed_fraction(thumb, self._last_thumb, region) < self.motion_threshold:
+                    return DETECT_SKIP_MOTION
+                self._last_thumb = thumb
+                self._last_time = now
+                return DETECT_RUN
+        self._last_thumb = motion_thumbnail(frame)
+        self._last_time = now
+        return DETECT_RUN
@@ -0,0 +1,56 @@
+import numpy as np
+
+from landmarks import HANDS_RECORD_DTYPE
+
+# --------------------------------------------------------------------------------
+# --- ЗАПИС СЕСІЙ ЛЕНДМАРКІВ ---
+# --------------------------------------------------------------------------------
+# Сесія - NPZ-файл: масив записів HANDS_RECORD_DTYPE (лендмарки, руки, час
+# захоплення), app_context для кожного кадру та розмір кадру.
+
+SESSION_CHUNK = 1024
+
+
+class SessionRecorder:
+    def __init__(self, path, frame_size):
+        self.path = path
+        self.frame_size = frame_size
+        self._hands = np.zeros(SESSION_CHUNK, dtype=HANDS_RECORD_DTYPE)
+        self._contexts = []
+
+    def __len__(self):
+        return len(self._contexts)
+
+    def add(self, hands, app_context):
+        n = len(self._contexts)
+        if n == len(self._hands):
+            self._hands = np.concatenate([self._hands, np.zeros(SESSION_CHUNK, dtype=HANDS_RECORD_DTYPE)])
+        self._hands[n] = hands
+        self._contexts.append(app_context)
+
+    def close(self):
+        n = len(self._contexts)
+        np.savez_compressed(self.path, hands=self._hands[:n], contexts=np.array(self._contexts, dtype=str),
+                            frame_size=np.array(self.frame_size))
+        print(f"Session saved: {self.path} ({n} frames)")
+
+
+class Session:
+    def __init__(self, hands, contexts, frame_size):
+        self.hands = hands
+        self.contexts = contexts
+        self.frame_size = frame_size
+
+    def __len__(self):
+        return len(self.hands)
+
+    @property
+    def duration(self):
+        if len(self.hands) < 2:
+            return 0.0
+        return float(self.hands['capture_time'][-1] - self.hands['capture_time'][0])
+
+
+def load_session(path):
+    with np.load(path) as data:
+        return Session(data['hands'], [str(c) for c in data['contexts']], tuple(int(v) for v in data['frame_size']))
@@ -0,0 +1,2 @@
+# Етапи конвеєра, по одному модулю на етап. Пакет навмисно нічого не реекспортує:
+# процес етапу імпортує лише модуль свого етапу та його залежності.
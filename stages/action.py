@@ -0,0 +1,51 @@
+from actions import PyAutoGuiBackend, execute
+from cursor import SmoothCursorBackend
+from lanes import LaneExecutor
+from linux_input import UinputBackend
+from pipeline import Stage
+
+# --------------------------------------------------------------------------------
+# --- ЕТАП 3: ВИКОНАННЯ ДІЙ ---
+# --------------------------------------------------------------------------------
+# pyautogui (чи evdev) імпортує сам бекенд у setup(), тобто вже в процесі
+# виконавця. Типово команди розходяться по смугах (lanes.py), і handle() лише
+# ставить команду в чергу смуги; з lanes=False усі дії виконуються тут по черзі.
+
+OUTPUT_BACKENDS = {'pyautogui': PyAutoGuiBackend, 'uinput': UinputBackend}
+
+
+class ActionStage(Stage):
+    name = 'action'
+
+    def __init__(self, command_channel, latency, cursor_rate=0, backend_factory=PyAutoGuiBackend, timeline=None,
+                 counters=None, lanes=True):
+        super().__init__(command_channel)
+        self.latency = latency
+        self.cursor_rate = cursor_rate
+        self.backend_factory = backend_factory
+        self.timeline = timeline
+        self.counters = counters
+        self.lanes = lanes
+
+    def setup(self):
+        self.backend = self.backend_factory()
+        if self.cursor_rate:
+            self.backend = SmoothCursorBackend(self.backend, self.cursor_rate)
+        self.executor = None
+        if self.lanes:
+            self.executor = LaneExecutor(self.backend, self.latency, self.counters).start()
+        if self.timeline is not None:
+            self.timeline.mark('action_ready')
+        print("Action worker started...")
+
+    def handle(self, command):
+        if self.executor is not None:
+            self.executor.submit(command)
+        else:
+            execute(self.backend, command, self.latency)
+
+    def teardown(self):
+        if self.executor is not None:
+            self.executor.close()
+        self.backend.close()
+        print("Action worker stopped.")
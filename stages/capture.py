@@ -0,0 +1,136 @@
+import queue
+
+import cv2
+
+from gesture_engine import DEAD_ZONE_RADIUS
+from pipeline import Stage
+from preview import PreviewRenderer
+
+# --------------------------------------------------------------------------------
+# --- ЕТАП 5: ЗАХОПЛЕННЯ КАДРІВ ТА ПРЕВ'Ю ---
+# --------------------------------------------------------------------------------
+# Цикл головного процесу: бере кадри у грабера, кладе їх у кільцевий буфер,
+# роздає детекторам і показує прев'ю поверх щойно захопленого кадру (з
+# preview_camera=False - на порожньому полотні). Поки камера відкривається, цикл просто
+# чекає на перший кадр; коли логіка жестів обробила перший кадр, друкується
+# хронологія запуску.
+
+DEPTH_SAMPLE_EVERY = 30
+
+
+class CaptureStage(Stage):
+    # Завжди працює в головному потоці: cv2.imshow і waitKey не можна викликати з інших потоків.
+    name = 'capture'
+    async_capable = False
+
+    def __init__(self, grabber, frame_ring, frame_queues, display_queue, counters, sampled_queues, headless=False,
+                 timeline=None, preview_camera=True):
+        # frame_queues - по черзі на кожен детектор пулу; кадри роздаються по колу.
+        super().__init__()
+        self.grabber = grabber
+        self.frame_ring = frame_ring
+        self.frame_queues = frame_queues
+        self.display_queue = display_queue
+        self.counters = counters
+        self.sampled_queues = sampled_queues
+        self.headless = headless
+        self.timeline = timeline
+        self.preview_camera = preview_camera
+
+    def poll_key(self):
+        return not self.headless and cv2.waitKey(1) & 0xFF == ord('q')
+
+    def dispatch(self, item):
+        # Наступний по колу детектор; якщо його черга зайнята, кадр бере перший вільний.
+        queues = self.frame_queues
+        for _ in range(len(queues)):
+            frame_queue = queues[self._next_worker]
+            self._next_worker = (self._next_worker + 1) % len(queues)
+            try:
+                frame_queue.put_nowait(item)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def run(self):
+        grabber, frame_ring, counters = self.grabber, self.frame_ring, self.counters
+        self._next_worker = 0
+        preview_renderer = None
+        if self.display_queue is not None:
+            preview_renderer = PreviewRenderer(frame_ring.shape[1::-1], DEAD_ZONE_RADIUS)
+        timeline = self.timeline
+        timeline_pending = timeline is not None
+        frame_seq = 0
+        loop_count = 0
+
+        window_name = "Gesture Control (5-Core Pipeline)"
+        window_set_top = False
+
+        try:
+            while True:
+                item = grabber.read(timeout=0.1)
+                if item is None:
+                    if grabber.ended or self.poll_key(): break
+                    continue
+                frame, capture_time = item
+                if loop_count == 0:
+                    if timeline is not None:
+                        timeline.mark('camera_open', grabber.open_time)
+                        timeline.mark('first_frame', capture_time)
+                    if frame.shape != frame_ring.shape:
+                        print(f"Джерело дає кадри {frame.shape[1]}x{frame.shape[0]}, вони масштабуються до "
+                              f"{frame_ring.shape[1]}x{frame_ring.shape[0]} (задайте --width/--height)")
+
+                if frame.shape != frame_ring.shape:
+                    frame = cv2.resize(frame, (frame_ring.shape[1], frame_ring.shape[0]))
+
+                slot = frame_ring.next_slot()
+                cv2.flip(frame, 1, dst=frame_ring.begin_write(slot))
+                frame_ring.publish(slot, frame_seq)
+
+                if self.dispatch((slot, frame_seq, capture_time)):
+                    frame_ring.commit()
+                    frame_seq += 1
+                    counters.queue_put('frame', True)
+                else:
+                    counters.queue_put('frame', False)
+
+                loop_count += 1
+                if loop_count % DEPTH_SAMPLE_EVERY == 0:
+                    for name, sampled_queue in self.sampled_queues.items():
+                        counters.sample_depth(name, sampled_queue)
+                    if timeline_pending and timeline.done('first_decision'):
+                        print(timeline.report())
+                        timeline_pending = False
+
+                preview_item = None
+                if self.display_queue is not None:
+                    try:
+                        preview_item = self.display_queue.get_nowait()
+                    except queue.Empty:
+                        pass
+
+                if preview_item is not None:
+                    # Слот щойно записаного кадру: пише в кільце лише цей цикл, тож до наступної ітерації кадр цілий.
+                    frame = frame_ring.view(slot) if self.preview_camera else None
+                    cv2.imshow(window_name, preview_renderer.render(preview_item, frame))
+
+                    if not window_set_top:
+                        try:
+                            import win32con
+                            import win32gui
+                            hwnd = win32gui.FindWindow(None, window_name)
+                            if hwnd:
+                                win32gui.SetWindowPos(hwnd, win32con.HWND_TOPMOST, 0, 0, 0, 0,
+                                                      win32con.SWP_NOMOVE | win32con.SWP_NOSIZE)
+                                print("--- Вікно камери встановлено 'Always on Top' ---")
+                                window_set_top = True
+                        except Exception as e:
+                            print(f"Помилка встановлення 'Always on Top': {e}")
+                            window_set_top = True
+
+                if self.poll_key():
+                    break
+        except KeyboardInterrupt:
+            pass
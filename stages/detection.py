@@ -0,0 +1,100 @@
+import time
+
+import cv2
+import numpy as np
+
+from landmarks import new_hands_record, fill_from_mediapipe, pack_hands
+from pipeline import Stage
+from roi import RoiTracker
+from scheduler import DetectionScheduler, DETECT_RUN, DETECTION_TIERS
+from telemetry import put_with_backpressure
+
+# --------------------------------------------------------------------------------
+# --- ЕТАП 1: ДЕТЕКЦІЯ РУК ---
+# --------------------------------------------------------------------------------
+# MediaPipe імпортується лише тут, у процесі детектора. Перший виклик моделі
+# ініціалізує граф і TFLite (сотні мілісекунд), тому setup() одразу проганяє
+# порожній кадр - поки головний процес ще відкриває камеру.
+
+
+class DetectionStage(Stage):
+    name = 'detection'
+
+    def __init__(self, frame_ring, frame_queue, gesture_queue, counters, tier_feedback, use_roi=True, worker=0,
+                 timeline=None):
+        # worker - номер у пулі детекторів; кожен має власний трекер MediaPipe, ROI та розклад.
+        super().__init__(frame_queue)
+        self.name = f'detection-{worker}'
+        self.worker = worker
+        self.frame_ring = frame_ring
+        self.gesture_queue = gesture_queue
+        self.counters = counters
+        self.tier_feedback = tier_feedback
+        self.use_roi = use_roi
+        self.timeline = timeline
+
+    def create_detector(self):
+        import mediapipe as mp
+        return mp.solutions.hands.Hands(
+            model_complexity=0, min_detection_confidence=0.6, min_tracking_confidence=0.5, max_num_hands=2)
+
+    def detect(self, rgb_frame, record):
+        return fill_from_mediapipe(record, self.detector.process(rgb_frame))
+
+    def setup(self):
+        self.detector = self.create_detector()
+        h, w = self.frame_ring.shape[:2]
+        self.roi_tracker = RoiTracker((w, h)) if self.use_roi else None
+        self.scheduler = DetectionScheduler(self.tier_feedback)
+        self.last_record = new_hands_record()
+        self.warm_up()
+        if self.timeline is not None:
+            self.timeline.mark('detector_ready')
+        print(f"Detection worker {self.worker} started...")
+
+    def warm_up(self):
+        h, w = self.frame_ring.shape[:2]
+        scale = self.scheduler.policy.full_scale
+        self.detect(np.zeros((int(h * scale), int(w * scale), 3), dtype=np.uint8), new_hands_record())
+
+    def handle(self, item):
+        slot, seq, capture_time = item
+        detect_start = time.time()
+        frame = self.frame_ring.view(slot)
+        scheduler = self.scheduler
+        region = self.roi_tracker.plan()[0] if self.roi_tracker is not None else None
+        outcome = scheduler.decide(frame, capture_time, region)
+        if outcome == DETECT_RUN:
+            full_scale = scheduler.policy.full_scale
+            if self.roi_tracker is not None:
+                small_frame, region = self.roi_tracker.crop(frame, full_scale)
+            else:
+                h, w = frame.shape[:2]
+                small_frame = cv2.resize(frame, (int(w * full_scale), int(h * full_scale)),
+                                         interpolation=cv2.INTER_AREA)
+            # cvtColor - остання операція над пікселями слота, далі детектор працює з копією.
+            rgb_frame = cv2.cvtColor(small_frame, cv2.COLOR_BGR2RGB)
+        if not self.frame_ring.valid(slot, seq):
+            # Захоплення перезаписало слот, поки кадр читався.
+            self.counters.inc('ring_torn', 'frame')
+            return
+        self.counters.inc('detections_' + outcome, DETECTION_TIERS[scheduler.tier])
+        if outcome == DETECT_RUN:
+            record = self.detect(rgb_frame, new_hands_record(seq, capture_time))
+            if self.roi_tracker is not None:
+                self.roi_tracker.update(record, region)
+            self.last_record = record
+        else:
+            record = self.last_record.copy()
+            record['seq'] = seq
+            record['capture_time'] = capture_time
+        record['detect_start'] = detect_start
+        record['detect_end'] = time.time()
+        put_with_backpressure(self.gesture_queue, (slot, pack_hands(record)), self.counters, 'gesture')
+        if self.timeline is not None:
+            self.timeline.mark('first_detection')
+
+    def teardown(self):
+        self.detector.close()
+        self.frame_ring.detach()
+        print(f"Detection worker {self.worker} stopped.")
@@ -0,0 +1,133 @@
+import queue
+import time
+
+from classifier import GestureClassifier
+from context import ContextWatcher, TitleClassifier, default_window_backend
+from gesture_engine import GestureEngine
+from landmarks import unpack_hands
+from motion import MotionDetector
+from pipeline import Stage
+from preview import PreviewSender
+from reorder import ReorderBuffer
+from rules import RuleEngine
+from session import SessionRecorder
+
+# --------------------------------------------------------------------------------
+# --- ЕТАП 2: ЛОГІКА ЖЕСТІВ ---
+# --------------------------------------------------------------------------------
+# Працює лише з лендмарками: ні OpenCV, ні MediaPipe цьому процесу не потрібні.
+
+
+class GestureStage(Stage):
+    name = 'gesture'
+
+    def __init__(self, frame_size, gesture_queue, display_queue, command_channel, gui_queue, latency, counters,
+                 tier_feedback, record_path=None, landmark_filter=None, predict=False, preview_fps=10,
+                 window_backend=None, reorder_delay=None, timeline=None, motion=False,
+                 classifier_path=None):
+        # reorder_delay - з пулом детекторів: скільки чекати на кадр, що відстав (None - без буфера).
+        # motion - розпізнавати динамічні жести детектором руху замість зсуву від якоря.
+        # classifier_path - модель calibrate.py для статичних жестів (None - лише правила).
+        # window_backend - назва з context.WINDOW_BACKENDS (бекенд створюється вже в setup()) або об'єкт.
+        super().__init__(gesture_queue)
+        self.frame_size = frame_size
+        self.display_queue = display_queue
+        self.command_channel = command_channel
+        self.gui_queue = gui_queue
+        self.latency = latency
+        self.counters = counters
+        self.tier_feedback = tier_feedback
+        self.record_path = record_path
+        self.landmark_filter = landmark_filter
+        self.predict = predict
+        self.preview_fps = preview_fps
+        self.window_backend = window_backend
+        self.reorder_delay = reorder_delay
+        self.timeline = timeline
+        self.motion = motion
+        self.classifier_path = classifier_path
+
+    def setup(self):
+        rules = RuleEngine.load()
+        motion = MotionDetector(self.frame_size) if self.motion else None
+        classifier = None
+        if self.classifier_path is not None:
+            classifier = GestureClassifier.load(self.classifier_path, self.frame_size)
+        self.engine = GestureEngine(rules, self.frame_size, self.command_channel, motion=motion, classifier=classifier)
+        window_backend = self.window_backend
+        if window_backend is None or isinstance(window_backend, str):
+            window_backend = default_window_backend(window_backend or 'auto')
+        self.context_watcher = ContextWatcher(TitleClassifier(rules.window_titles), window_backend).start()
+        self.recorder = SessionRecorder(self.record_path, self.frame_size) if self.record_path else None
+        self.preview = None
+        if self.display_queue is not None:
+            self.preview = PreviewSender(self.display_queue, self.counters, self.preview_fps)
+        self.reorder = None
+        if self.reorder_delay is not None:
+            self.reorder = ReorderBuffer(self.reorder_delay, self.counters)
+            # Пропуск, за яким більше нічого не приходить, теж має відпустити кадри через reorder_delay.
+            self.idle_timeout = self.reorder_delay
+        if self.timeline is not None:
+            self.timeline.mark('gesture_ready')
+        print("Gesture worker started...")
+
+    def send_gui_update(self, text):
+        gui_queue = self.gui_queue
+        overwritten = 0
+        try:
+            while not gui_queue.empty():
+                gui_queue.get_nowait()
+                overwritten += 1
+        except queue.Empty:
+            pass
+        try:
+            gui_queue.put_nowait(text)
+            self.counters.queue_put('gui', True, overwritten)
+        except queue.Full:
+            self.counters.queue_put('gui', False, overwritten)
+
+    def handle(self, item):
+        _, hands_data = item
+        hands = unpack_hands(hands_data)
+        if self.reorder is None:
+            self.process(hands)
+            return
+        for ready in self.reorder.push(int(hands['seq']), hands, time.time()):
+            self.process(ready)
+
+    def idle(self):
+        for ready in self.reorder.expire(time.time()):
+            self.process(ready)
+
+    def process(self, hands):
+        state = self.engine.state
+
+        state.app_context = self.context_watcher.context
+        if self.recorder is not None:
+            self.recorder.add(hands, state.app_context)
+        if self.landmark_filter is not None:
+            horizon = time.time() - float(hands['capture_time']) if self.predict else 0.0
+            hands = self.landmark_filter.apply(hands, horizon)
+        result = self.engine.process(hands)
+        self.tier_feedback.report(state.is_active, hands['num_hands'], float(hands['capture_time']))
+        self.latency.record_frame(hands['capture_time'], hands['detect_start'], hands['detect_end'], time.time())
+        if self.timeline is not None:
+            self.timeline.mark('first_decision')
+
+        if result.action_text:
+            self.send_gui_update(result.action_text)
+        else:
+            self.send_gui_update(result.status_text)
+
+        if self.preview is not None:
+            self.preview.offer(hands, result, state.is_active)
+
+    def teardown(self):
+        if self.reorder is not None:
+            for ready in self.reorder.flush():
+                self.process(ready)
+        self.context_watcher.stop()
+        if self.recorder is not None:
+            self.recorder.close()
+        print("Gesture worker stopped.")
+        self.gui_queue.put(None)
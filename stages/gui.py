@@ -0,0 +1,75 @@
+import queue
+import tkinter as tk
+
+from pipeline import Stage
+from telemetry import LatencyWindow, format_latency_line
+
+# --------------------------------------------------------------------------------
+# --- ЕТАП 4: GUI ОВЕРЛЕЙ ---
+# --------------------------------------------------------------------------------
+# Процесу оверлею потрібен лише tkinter і читач гістограм затримок.
+
+
+class GuiStage(Stage):
+    # Tk має власний mainloop, тому в режимах thread і asyncio етап працює в окремому потоці.
+    name = 'gui'
+    async_capable = False
+
+    def __init__(self, gui_queue, latency, timeline=None):
+        super().__init__(gui_queue)
+        self.latency = latency
+        self.timeline = timeline
+
+    def run(self):
+        gui_queue = self.inbox
+        try:
+            root = tk.Tk()
+            root.title("Gesture Status")
+            root.geometry("300x80+50+50")
+
+            root.wm_attributes("-topmost", True)
+            root.wm_attributes("-alpha", 0.7)
+            root.config(bg='black')
+            root.overrideredirect(True)
+
+            status_label = tk.Label(
+                root,
+                text="Initializing...",
+                font=("Arial", 16, "bold"),
+                fg="cyan",
+                bg="black"
+            )
+            status_label.pack(expand=True, fill="both")
+
+            latency_label = tk.Label(root, text="", font=("Arial", 9), fg="gray70", bg="black")
+            latency_label.pack(fill="x")
+            latency_window = LatencyWindow(self.latency)
+
+            def update_latency():
+                window = latency_window.update()
+                latency_label.config(text=format_latency_line(window) + "\n" + format_latency_line(window, 'detection'))
+                root.after(1000, update_latency)
+
+            def check_queue():
+                try:
+                    while not gui_queue.empty():
+                        message = gui_queue.get_nowait()
+                        if message is None:
+                            root.destroy()
+                            return
+                        status_label.config(text=message)
+                except queue.Empty:
+                    pass
+                root.after(50, check_queue)
+
+            if self.timeline is not None:
+                self.timeline.mark('gui_ready')
+            print("GUI worker started...")
+            root.after(50, check_queue)
+            root.after(1000, update_latency)
+            root.mainloop()
+
+        except Exception as e:
+            print(f"GUI Error: {e}")
+        finally:
+            print("GUI worker stopped.")
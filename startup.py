@@ -0,0 +1,47 @@
+import time
+from multiprocessing import Array
+
+# --------------------------------------------------------------------------------
+# --- ХРОНОЛОГІЯ ЗАПУСКУ ---
+# --------------------------------------------------------------------------------
+# Спільний масив часових міток: кожен етап позначає свою першу готовність, а
+# головний процес друкує їх відносно моменту запуску main.py. Кожна мітка
+# записується лише раз, тому виклик mark() на кожному кадрі нічого не коштує.
+
+STARTUP_EVENTS = (
+    'imports',          # головний процес імпортував свої модулі
+    'workers_started',  # усі етапи запущені (процеси ще можуть імпортувати модулі)
+    'camera_open',      # джерело кадрів відкрите
+    'first_frame',      # перший кадр захоплено
+    'gui_ready',
+    'action_ready',
+    'gesture_ready',
+    'detector_ready',   # модель завантажена й прогріта
+    'first_detection',
+    'first_decision',   # логіка жестів обробила перший кадр
+)
+_EVENT_INDEX = {event: i for i, event in enumerate(STARTUP_EVENTS)}
+
+
+class StartupTimeline:
+    def __init__(self, launch_time=None):
+        self.launch_time = launch_time if launch_time is not None else time.time()
+        self._times = Array('d', len(STARTUP_EVENTS), lock=False)
+
+    def mark(self, event, at=None):
+        i = _EVENT_INDEX[event]
+        if not self._times[i]:
+            self._times[i] = at if at is not None else time.time()
+
+    def done(self, event):
+        return self._times[_EVENT_INDEX[event]] > 0
+
+    def offsets(self):
+        # {подія: секунди від запуску} лише для вже позначених подій.
+        return {event: t - self.launch_time for event, t in zip(STARTUP_EVENTS, self._times[:]) if t}
+
+    def report(self):
+        offsets = sorted(self.offsets().items(), key=lambda item: item[1])
+        lines = ["Startup timeline (ms from launch):"]
+        lines += [f"  {offset * 1000:8.0f}  {event}" for event, offset in offsets]
+        return "\n".join(lines)
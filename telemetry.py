@@ -0,0 +1,292 @@
+import json
+import math
+import queue
+import threading
+import time
+from multiprocessing import Array
+
+from commands import Op, LANES
+from scheduler import DETECTION_TIERS, DETECTION_OUTCOMES
+
+# --------------------------------------------------------------------------------
+# --- ЗАТРИМКИ ЕТАПІВ КОНВЕЄРА ---
+# --------------------------------------------------------------------------------
+# Кожен кадр штампується при cap.read(), на початку та в кінці детекції, при
+# рішенні логіки жестів, при постановці команди в канал і при її виконанні.
+# Затримки складаються в логарифмічні гістограми у спільній пам'яті: кожен етап
+# пише лише один процес, а читач рахує p50/p95/p99 за останнє вікно як різницю
+# між поточними лічильниками та попереднім знімком. lane_* - від постановки
+# команди в канал до кінця її виконання, окремо для кожної смуги виконавця дій.
+
+LATENCY_STAGES = ('frame_queue', 'detection', 'gesture', 'command_queue', 'action', 'end_to_end') + tuple(
+    'lane_' + lane for lane in LANES)
+_STAGE_INDEX = {stage: i for i, stage in enumerate(LATENCY_STAGES)}
+
+HISTOGRAM_BINS = 64
+HISTOGRAM_MIN = 1e-4
+HISTOGRAM_MAX = 10.0
+_LOG_MIN = math.log(HISTOGRAM_MIN)
+_LOG_STEP = (math.log(HISTOGRAM_MAX) - _LOG_MIN) / HISTOGRAM_BINS
+
+
+def _bin_index(seconds):
+    if seconds <= HISTOGRAM_MIN:
+        return 0
+    return min(HISTOGRAM_BINS - 1, int((math.log(seconds) - _LOG_MIN) / _LOG_STEP))
+
+
+def _bin_upper_edge(index):
+    return math.exp(_LOG_MIN + (index + 1) * _LOG_STEP)
+
+
+class LatencyHistograms:
+    def __init__(self):
+        self._counts = Array('Q', len(LATENCY_STAGES) * HISTOGRAM_BINS, lock=False)
+
+    def record(self, stage, seconds):
+        self._counts[_STAGE_INDEX[stage] * HISTOGRAM_BINS + _bin_index(seconds)] += 1
+
+    def record_frame(self, capture_time, detect_start, detect_end, decision_time):
+        self.record('frame_queue', detect_start - capture_time)
+        self.record('detection', detect_end - detect_start)
+        self.record('gesture', decision_time - detect_end)
+
+    def record_command(self, capture_time, enqueue_time, exec_start, exec_end, lane=None):
+        self.record('command_queue', exec_start - enqueue_time)
+        self.record('action', exec_end - exec_start)
+        if capture_time > 0:
+            self.record('end_to_end', exec_end - capture_time)
+        if lane is not None:
+            self.record('lane_' + lane, exec_end - enqueue_time)
+
+    def snapshot(self):
+        counts = self._counts[:]
+        return [counts[i * HISTOGRAM_BINS:(i + 1) * HISTOGRAM_BINS] for i in range(len(LATENCY_STAGES))]
+
+
+def percentiles(counts, quantiles=(0.5, 0.95, 0.99)):
+    total = sum(counts)
+    if total == 0:
+        return [None] * len(quantiles)
+    result = []
+    for q in quantiles:
+        threshold = q * total
+        cumulative = 0
+        for i, count in enumerate(counts):
+            cumulative += count
+            if cumulative >= threshold:
+                result.append(_bin_upper_edge(i))
+                break
+    return result
+
+
+class LatencyWindow:
+    # Читач: статистика за період між двома викликами update().
+    def __init__(self, histograms):
+        self.histograms = histograms
+        self._previous = histograms.snapshot()
+
+    def update(self):
+        current = self.histograms.snapshot()
+        window = {}
+        for stage, now_counts, old_counts in zip(LATENCY_STAGES, current, self._previous):
+            counts = [a - b for a, b in zip(now_counts, old_counts)]
+            p50, p95, p99 = percentiles(counts)
+            window[stage] = {'count': sum(counts), 'p50': p50, 'p95': p95, 'p99': p99}
+        self._previous = current
+        return window
+
+
+def format_latency_line(window, stage='end_to_end'):
+    stats = window[stage]
+    if not stats['count']:
+        return f"{stage}: --"
+    return f"{stage} ms p50 {stats['p50'] * 1000:.0f} p95 {stats['p95'] * 1000:.0f} p99 {stats['p99'] * 1000:.0f}"
+
+
+class LatencyReporter:
+    # Фоновий потік, що періодично дописує вікно статистики у JSON Lines файл.
+    def __init__(self, histograms, path, interval=10.0):
+        self.window = LatencyWindow(histograms)
+        self.path = path
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="latency-reporter", daemon=True)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self._dump()
+        self._dump()
+
+    def _dump(self):
+        entry = {'time': time.time(), 'interval': self.interval, 'stages': self.window.update()}
+        try:
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(entry) + "\n")
+        except OSError as e:
+            print(f"Latency report error: {e}")
+
+
+# --------------------------------------------------------------------------------
+# --- ЛІЧИЛЬНИКИ ЧЕРГ ТА КОМАНД ---
+# --------------------------------------------------------------------------------
+# Один блок лічильників у спільній пам'яті на весь конвеєр. Кожен лічильник
+# змінює лише один процес, тому блокування не потрібне. Виняток - пул детекторів
+# (--detectors N): лічильники детекції та черги gesture змінюють N процесів, і при
+# збігу в часі окремі інкременти можуть загубитися; для статистики це прийнятно. Експорт - у текстовому
+# форматі Prometheus у файл або через локальний HTTP /metrics.
+
+PIPELINE_QUEUES = ('frame', 'gesture', 'display', 'command', 'gui')
+QUEUE_COUNTERS = ('offered', 'accepted', 'dropped', 'overwritten', 'blocked')
+QUEUE_GAUGES = ('depth', 'depth_max')
+COMMAND_COUNTERS = ('sent', 'coalesced')
+REORDER_COUNTERS = ('late', 'skipped')
+RING_COUNTERS = ('torn',)
+LANE_COUNTERS = ('merged', 'blocked')
+
+
+def _counter_names():
+    names = []
+    for c in QUEUE_COUNTERS + QUEUE_GAUGES:
+        names += [('queue_' + c, 'queue', q) for q in PIPELINE_QUEUES]
+    for c in COMMAND_COUNTERS:
+        names += [('commands_' + c, 'op', op.name.lower()) for op in Op]
+    for c in DETECTION_OUTCOMES:
+        names += [('detections_' + c, 'tier', tier) for tier in DETECTION_TIERS]
+    names += [('reorder_' + c, 'queue', 'gesture') for c in REORDER_COUNTERS]
+    names += [('ring_' + c, 'queue', 'frame') for c in RING_COUNTERS]
+    for c in LANE_COUNTERS:
+        names += [('lane_' + c, 'lane', lane) for lane in LANES]
+    return names
+
+
+class PipelineCounters:
+    def __init__(self):
+        self._names = _counter_names()
+        self._index = {(metric, label): i for i, (metric, _, label) in enumerate(self._names)}
+        self._values = Array('Q', len(self._names), lock=False)
+
+    def inc(self, metric, label, n=1):
+        self._values[self._index[metric, label]] += n
+
+    def get(self, metric, label):
+        return self._values[self._index[metric, label]]
+
+    def queue_put(self, name, accepted, overwritten=0):
+        self.inc('queue_offered', name)
+        self.inc('queue_accepted' if accepted else 'queue_dropped', name)
+        if overwritten:
+            self.inc('queue_overwritten', name, overwritten)
+
+    def sample_depth(self, name, q):
+        try:
+            depth = q.qsize()
+        except NotImplementedError:
+            return
+        i = self._index['queue_depth', name]
+        self._values[i] = depth
+        j = self._index['queue_depth_max', name]
+        if depth > self._values[j]:
+            self._values[j] = depth
+
+    def prometheus_text(self):
+        values = self._values[:]
+        lines = []
+        declared = set()
+        for (metric, label_name, label), value in zip(self._names, values):
+            gauge = metric in ('queue_depth', 'queue_depth_max')
+            full_name = f"gesture_{metric}" if gauge else f"gesture_{metric}_total"
+            if full_name not in declared:
+                declared.add(full_name)
+                lines.append(f"# TYPE {full_name} {'gauge' if gauge else 'counter'}")
+            lines.append(f'{full_name}{{{label_name}="{label}"}} {value}')
+        return "\n".join(lines) + "\n"
+
+
+class MetricsExporter:
+    # Файл перезаписується кожні interval секунд; HTTP-сервер слухає лише localhost.
+    def __init__(self, counters, path=None, port=None, interval=5.0):
+        self.counters = counters
+        self.path = path
+        self.port = port
+        self.interval = interval
+        self._server = None
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="metrics-exporter", daemon=True)
+
+    def start(self):
+        if self.port:
+            self._start_http()
+        if self.path:
+            self._thread.start()
+        return self
+
+    def _start_http(self):
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+        counters = self.counters
+
+        class MetricsHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path != '/metrics':
+                    self.send_error(404)
+                    return
+                body = counters.prometheus_text().encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/plain; version=0.0.4')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(('127.0.0.1', self.port), MetricsHandler)
+        threading.Thread(target=self._server.serve_forever, name="metrics-http", daemon=True).start()
+        print(f"Metrics: http://127.0.0.1:{self.port}/metrics")
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self._write()
+
+    def _write(self):
+        try:
+            with open(self.path, 'w', encoding='utf-8') as f:
+                f.write(self.counters.prometheus_text())
+        except OSError as e:
+            print(f"Metrics export error: {e}")
+
+    def stop(self):
+        self._stop.set()
+        if self.path:
+            self._thread.join()
+            self._write()
+        if self._server is not None:
+            self._server.shutdown()
+
+
+def put_with_backpressure(q, item, counters, name):
+    # Блокуючий put, що рахує, скільки разів відправник чекав на повну чергу. LoopQueue
+    # у потоці циклу подій чекати не може і витісняє найстаріший елемент - це рахується
+    # як перезапис, а не очікування; якщо ж черга вже закрита маркером зупинки, елемент
+    # відкидається.
+    try:
+        q.put_nowait(item)
+    except queue.Full:
+        try:
+            evicted = q.put(item)
+        except queue.Full:
+            counters.queue_put(name, False)
+            return
+        if evicted:
+            counters.queue_put(name, True, evicted)
+            return
+        counters.inc('queue_blocked', name)
+    counters.queue_put(name, True)
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# Модулі конвеєра лежать у корені репозиторію, без пакета.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,23 @@
+import asyncio
+
+from pipeline import LoopQueue
+from telemetry import PipelineCounters, put_with_backpressure
+
+
+def test_item_behind_stop_marker_counts_as_dropped():
+    loop = asyncio.new_event_loop()
+    counters = PipelineCounters()
+    q = LoopQueue(loop, maxsize=1)
+
+    async def produce():
+        q.put_nowait(None)
+        put_with_backpressure(q, 'late result', counters, 'gesture')
+
+    try:
+        loop.run_until_complete(produce())
+    finally:
+        loop.close()
+    assert q.get_nowait() is None
+    assert counters.get('queue_dropped', 'gesture') == 1
+    assert counters.get('queue_accepted', 'gesture') == 0
+    assert counters.get('queue_overwritten', 'gesture') == 0
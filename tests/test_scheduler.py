@@ -0,0 +1,39 @@
+import numpy as np
+
+from scheduler import DetectionScheduler, TierFeedback, DETECT_RUN, DETECT_SKIP_MOTION
+
+SHAPE = (720, 1280, 3)
+# Рука в ROI; між кадрами зсувається лише кінчик пальця (щипок) - кілька десятків пікселів.
+ROI = (400, 200, 800, 600)
+FINGER = (slice(300, 340), slice(600, 620))
+
+
+def frames():
+    frame = np.random.default_rng(0).integers(60, 200, SHAPE, dtype=np.uint8)
+    moved = frame.copy()
+    moved[FINGER] = 255 - moved[FINGER]
+    return frame, moved
+
+
+def scheduler_at(is_active):
+    feedback = TierFeedback()
+    feedback.report(is_active, 1, 0.0)
+    return DetectionScheduler(feedback)
+
+
+def test_finger_only_change_runs_detection_in_active_tier():
+    frame, moved = frames()
+    scheduler = scheduler_at(True)
+    assert scheduler.decide(frame, 0.0, ROI) == DETECT_RUN
+    assert scheduler.decide(moved, 0.04, ROI) == DETECT_RUN
+    # В active результат не повторюється навіть для незмінного кадру.
+    assert scheduler.decide(moved, 0.08, ROI) == DETECT_RUN
+
+
+def test_motion_gate_sees_finger_inside_roi():
+    frame, moved = frames()
+    scheduler = scheduler_at(False)
+    assert scheduler.decide(frame, 0.0, ROI) == DETECT_RUN
+    assert scheduler.decide(frame, 0.1, ROI) == DETECT_SKIP_MOTION
+    assert scheduler.decide(moved, 0.2, ROI) == DETECT_RUN
+    assert scheduler.decide(moved, 0.3) == DETECT_SKIP_MOTION
@@ -0,0 +1,50 @@
+import threading
+
+from benchmarks.executors import SyntheticDetectionStage, SHAPE
+from frame_ring import FrameRing
+from pipeline import make_executor
+from scheduler import TierFeedback
+from telemetry import PipelineCounters
+
+
+class StoppingDetector(SyntheticDetectionStage):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.stopped = threading.Event()
+
+    def teardown(self):
+        super().teardown()
+        self.stopped.set()
+
+
+def test_thread_executor_detector_pool_shuts_down(monkeypatch):
+    # У виконавці thread кільце кадрів одне на всі детектори: той, що зупинився
+    # першим, не має закривати його для решти.
+    errors = []
+    monkeypatch.setattr(threading, 'excepthook', lambda args: errors.append(args.exc_value))
+    executor = make_executor('thread')
+    frame_ring = FrameRing(SHAPE, 4)
+    counters = PipelineCounters()
+    frame_queues = [executor.queue(maxsize=1) for _ in range(2)]
+    gesture_queue = executor.queue()
+    detectors = [StoppingDetector(frame_ring, frame_queue, gesture_queue, counters, TierFeedback(), worker=worker)
+                 for worker, frame_queue in enumerate(frame_queues)]
+    for detector in detectors:
+        executor.start(detector)
+
+    frame_queues[0].put(None)
+    assert detectors[0].stopped.wait(10)
+
+    slot = frame_ring.next_slot()
+    frame_ring.begin_write(slot)[:] = 0
+    frame_ring.publish(slot, 0)
+    frame_queues[1].put((slot, 0, 0.0))
+    frame_queues[1].put(None)
+    executor.join(10)
+
+    assert errors == []
+    assert detectors[1].stopped.is_set()
+    assert gesture_queue.get_nowait()[0] == slot
+    assert counters.get('ring_torn', 'frame') == 0
+    frame_ring.close()
+    frame_ring.unlink()